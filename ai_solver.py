@@ -0,0 +1,101 @@
+from math import comb
+
+HIGHER = "higher"
+LOWER = "lower"
+
+
+class LyingSearchSolver:
+    # Guesses a number in [lo, hi] from Higher/Lower answers when up to `lies`
+    # of them may be wrong (Ulam's searching game).
+    #
+    # Candidates are stored as sorted, non-overlapping [start, end, lies]
+    # segments: `lies` is how many answers so far that number would have had
+    # to be lied about, and numbers needing more than the budget are dropped.
+    # Each answer only splits the segment containing the guess, so the
+    # segment count stays small and every decision is a single pass over it,
+    # independent of the width of the range (64-bit ranges included).
+    #
+    # Guesses follow Berlekamp's volume argument: with q questions to go, a
+    # number that has used j lies carries weight C(q - 1, lies - j), and the
+    # guess is the weighted median, which splits the remaining volume evenly
+    # between the two possible answers.
+    def __init__(self, lo, hi, lies=0):
+        if lo > hi:
+            raise ValueError("Empty range")
+        self.lies = lies
+        self.segments = [[lo, hi, 0]]
+        self.questions = 0
+        self.current_guess = None
+
+    @property
+    def exhausted(self):
+        return not self.segments
+
+    def candidate_count(self):
+        return sum(end - start + 1 for start, end, _ in self.segments)
+
+    def _volume(self, q):
+        return sum((end - start + 1) * sum(comb(q, i) for i in range(self.lies - j + 1))
+                   for start, end, j in self.segments)
+
+    def _questions_left(self):
+        # Smallest q for which the volume fits in 2**q answers.
+        q = max(0, self.candidate_count().bit_length() - 1)
+        while self._volume(q) > 1 << q:
+            q += 1
+        return q
+
+    def next_guess(self):
+        if not self.segments:
+            raise RuntimeError("No number is consistent with the answers given.")
+        q = self._questions_left()
+        weights = [comb(q - 1, self.lies - j) if q > 0 else 0 for j in range(self.lies + 1)]
+        total = sum((end - start + 1) * weights[j] for start, end, j in self.segments)
+        if total == 0:
+            # Nothing can be ruled out any more; fall back to the plain median.
+            weights = [1] * (self.lies + 1)
+            total = self.candidate_count()
+
+        half = (total + 1) // 2
+        below = 0
+        for start, end, j in self.segments:
+            weight = weights[j]
+            mass = (end - start + 1) * weight
+            if weight and below + mass >= half:
+                offset = max(0, -(-(half - below) // weight) - 1)
+                self.current_guess = start + offset
+                return self.current_guess
+            below += mass
+        self.current_guess = self.segments[-1][1]
+        return self.current_guess
+
+    def answer(self, feedback, guess=None):
+        guess = self.current_guess if guess is None else guess
+        self.questions += 1
+        # Numbers the answer contradicts pick up one more lie.
+        if feedback == HIGHER:
+            contradicted = lambda start, end: (start, min(end, guess))
+        elif feedback == LOWER:
+            contradicted = lambda start, end: (max(start, guess), end)
+        else:
+            raise ValueError(f"Unknown feedback {feedback!r}")
+
+        segments = []
+        for start, end, j in self.segments:
+            bad_start, bad_end = contradicted(start, end)
+            if bad_start > bad_end:
+                self._append(segments, start, end, j)
+                continue
+            if start < bad_start:
+                self._append(segments, start, bad_start - 1, j)
+            if j < self.lies:
+                self._append(segments, bad_start, bad_end, j + 1)
+            if bad_end < end:
+                self._append(segments, bad_end + 1, end, j)
+        self.segments = segments
+
+    def _append(self, segments, start, end, lies):
+        if segments and segments[-1][2] == lies and segments[-1][1] + 1 == start:
+            segments[-1][1] = end
+        else:
+            segments.append([start, end, lies])
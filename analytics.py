@@ -0,0 +1,110 @@
+import argparse
+import json
+from functools import lru_cache
+
+from hints import MIN_REMAINING
+
+CACHE_FILE = "optimal_play.json"
+
+
+def hint_threshold(game):
+    # The largest attempts_left at which get_hint reveals anything.
+    threshold = 0
+    for attempts_left in range(1, 64):
+        if game.get_hint(2, attempts_left) or game.get_hint(3, attempts_left):
+            threshold = attempts_left
+    return threshold
+
+
+@lru_cache(maxsize=None)
+def _solve(size, attempts_left, reveal_at, parity_known):
+    # Optimal play over `size` equally likely candidates. Returns how many of
+    # them are found within attempts_left guesses, and the total number of
+    # guesses spent summed over all of them (lost secrets use every guess).
+    #
+    # The candidates are always an interval, or an interval restricted to one
+    # parity once the hint has been shown; both behave the same under
+    # comparison answers, so only the size matters. Splitting the rest evenly
+    # is optimal because both results are concave in the part sizes, which is
+    # why each level only ever sees two neighbouring sizes and the whole
+    # table has O(attempts) entries even for astronomically large ranges.
+    if size == 0 or attempts_left == 0:
+        return 0, 0
+    wins = 1
+    guesses = size
+    left = (size - 1) // 2
+    for part in (left, size - 1 - left):
+        part_wins, part_guesses = _after_miss(part, attempts_left - 1, reveal_at, parity_known)
+        wins += part_wins
+        guesses += part_guesses
+    return wins, guesses
+
+
+def _after_miss(size, attempts_left, reveal_at, parity_known):
+    # The hint engine withholds a hint that would leave fewer than
+    # MIN_REMAINING candidates. When the smaller parity class is that small,
+    # no hint is counted for either class; the candidates only shrink from
+    # here, so none is counted later either.
+    if not parity_known and 0 < attempts_left <= reveal_at and size // 2 >= MIN_REMAINING:
+        # The parity hint splits the candidates into evens and odds.
+        even_wins, even_guesses = _solve((size + 1) // 2, attempts_left, reveal_at, True)
+        odd_wins, odd_guesses = _solve(size // 2, attempts_left, reveal_at, True)
+        return even_wins + odd_wins, even_guesses + odd_guesses
+    return _solve(size, attempts_left, reveal_at, parity_known)
+
+
+def optimal_play(size, attempts_limit, reveal_at):
+    # Only the parity hint is modelled, and only where the hint engine would
+    # give it. Whenever it would, the engine's chosen hint leaves at most as
+    # many candidates, so the true optimum wins at least this often.
+    wins, guesses = _solve(size, attempts_limit, reveal_at, False)
+    return wins / size, guesses / size
+
+
+class OptimalPlayCache:
+    # Answers are memoized in memory and persisted to a small JSON file
+    # (through the game's write-behind writer when one is given), so repeat
+    # queries across runs are a dict lookup.
+    def __init__(self, path=CACHE_FILE, writer=None):
+        self.path = path
+        self.writer = writer
+        self._results = None
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                self._results = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._results = {}
+
+    def get(self, size, attempts_limit, reveal_at):
+        if self._results is None:
+            self._load()
+        key = f"{size}:{attempts_limit}:{reveal_at}"
+        result = self._results.get(key)
+        if result is None:
+            result = list(optimal_play(size, attempts_limit, reveal_at))
+            self._results[key] = result
+            data = json.dumps(self._results)
+            if self.writer is not None:
+                self.writer.write_file(self.path, data)
+            else:
+                with open(self.path, "w") as f:
+                    f.write(data)
+        return tuple(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimal win probability and expected attempts for a game setting.")
+    parser.add_argument("min_range", type=int)
+    parser.add_argument("max_range", type=int)
+    parser.add_argument("attempts_limit", type=int)
+    parser.add_argument("--reveal-at", type=int, default=3, help="Parity hint shown once attempts left <= this (0 = never).")
+    args = parser.parse_args()
+
+    win_probability, expected_attempts = optimal_play(args.max_range - args.min_range + 1, args.attempts_limit, args.reveal_at)
+    print(f"Optimal play with the parity hint alone wins {win_probability:.2%} (best play wins at least this) using {expected_attempts:.3f} attempts on average.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import time
+import tkinter as tk
+
+FRAME_MS = 16
+
+
+def linear(t):
+    return t
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_quad(t):
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+class Tween:
+    __slots__ = ("widget", "duration", "apply", "easing", "on_done", "start")
+
+    def __init__(self, widget, duration, apply, easing, on_done, start):
+        self.widget = widget
+        self.duration = duration
+        self.apply = apply
+        self.easing = easing
+        self.on_done = on_done
+        self.start = start
+
+
+class Animator:
+    # Drives every running tween from one `after` chain that only exists while
+    # something is animating. Progress comes from the clock rather than from
+    # counting ticks, so when a frame runs late (a slow handler, a busy
+    # machine) the next tick jumps to where the animation should be instead
+    # of replaying the missed steps. A tween whose widget has been destroyed
+    # is dropped on the next tick.
+    def __init__(self, root, frame_ms=FRAME_MS, clock=time.perf_counter):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.clock = clock
+        self.tweens = {}
+        self.job = None
+
+    def animate(self, widget, duration, apply, easing=ease_out_cubic, on_done=None, key=None):
+        # apply(progress) is called with the eased progress in [0, 1]. Starting
+        # a tween under a key that is already animating (by default, one per
+        # widget) replaces that tween.
+        key = str(widget) if key is None else key
+        tween = Tween(widget, duration, apply, easing, on_done, self.clock())
+        self.tweens[key] = tween
+        self._step(key, tween, tween.start)
+        if self.job is None and self.tweens:
+            self.job = self.root.after(self.frame_ms, self._tick)
+        return key
+
+    def cancel(self, key):
+        self.tweens.pop(key, None)
+
+    def running(self, key):
+        return key in self.tweens
+
+    def _step(self, key, tween, now):
+        if not tween.widget.winfo_exists():
+            del self.tweens[key]
+            return
+        progress = 1.0 if tween.duration <= 0 else min(1.0, (now - tween.start) / tween.duration)
+        try:
+            tween.apply(tween.easing(progress))
+        except tk.TclError:
+            # The widget went away in between; nothing left to animate.
+            del self.tweens[key]
+            return
+        if progress >= 1.0:
+            # on_done may start a follow-up tween under the same key.
+            if self.tweens.get(key) is tween:
+                del self.tweens[key]
+            if tween.on_done is not None:
+                tween.on_done()
+
+    def _tick(self):
+        self.job = None
+        now = self.clock()
+        for key, tween in list(self.tweens.items()):
+            if self.tweens.get(key) is tween:
+                self._step(key, tween, now)
+        if self.tweens and self.job is None:
+            # Keep the frame cadence: a tick that used part of its budget
+            # waits only for the rest of it.
+            spent_ms = int((self.clock() - now) * 1000)
+            self.job = self.root.after(max(1, self.frame_ms - spent_ms), self._tick)
@@ -0,0 +1,68 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_solver import HIGHER, LOWER, LyingSearchSolver
+
+
+def play(solver, secret, lies, rng, lie_probability):
+    # An adversary that tells up to `lies` lies at random moments.
+    told = 0
+    decision_ns = 0
+    while True:
+        started = time.perf_counter_ns()
+        guess = solver.next_guess()
+        decision_ns += time.perf_counter_ns() - started
+        if guess == secret:
+            return solver.questions + 1, decision_ns
+        truth = HIGHER if secret > guess else LOWER
+        if told < lies and rng.random() < lie_probability:
+            truth = LOWER if truth == HIGHER else HIGHER
+            told += 1
+        started = time.perf_counter_ns()
+        solver.answer(truth)
+        decision_ns += time.perf_counter_ns() - started
+
+
+def run(bits_list, lies_list, games, seed, lie_probability):
+    rng = random.Random(seed)
+    results = []
+    for bits in bits_list:
+        for lies in lies_list:
+            questions = []
+            total_ns = 0
+            for _ in range(games):
+                solver = LyingSearchSolver(1, 1 << bits, lies)
+                asked, elapsed_ns = play(solver, rng.randint(1, 1 << bits), lies, rng, lie_probability)
+                questions.append(asked)
+                total_ns += elapsed_ns
+            results.append({
+                "range_bits": bits,
+                "lies": lies,
+                "mean_questions": sum(questions) / games,
+                "max_questions": max(questions),
+                "us_per_question": total_ns / sum(questions) / 1000,
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Questions asked and time per decision of the AI solver.")
+    parser.add_argument("--bits", type=int, nargs="+", default=[7, 16, 32, 64])
+    parser.add_argument("--lies", type=int, nargs="+", default=[0, 1, 2, 3])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--lie-probability", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Range':>7} | {'Lies':>4} | {'Mean Q':>7} | {'Max Q':>5} | {'us/question':>11}")
+    for row in run(args.bits, args.lies, args.games, args.seed, args.lie_probability):
+        print(f"{'2^' + str(row['range_bits']):>7} | {row['lies']:>4} | {row['mean_questions']:>7.2f} | {row['max_questions']:>5} | {row['us_per_question']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
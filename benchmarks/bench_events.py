@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from events import GUESS, HEADER, LOSS, MAGIC, RECORD, START, VERSION, WIN, summarize
+
+
+def write_log(path, megabytes, seed):
+    # Synthetic bisecting rounds, a few hundred interleaved at a time, with
+    # human-like gaps between guesses.
+    rng = random.Random(seed)
+    target = megabytes * 1024 * 1024
+    clock = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0))
+        written = HEADER.size
+        while written < target:
+            batch = bytearray()
+            for _ in range(500):
+                round_id = rng.getrandbits(64)
+                difficulty = rng.randrange(3)
+                size, limit = (50, 10) if difficulty == 0 else (100, 7) if difficulty == 1 else (200, 5)
+                clock += rng.randint(10**8, 10**9)
+                batch += RECORD.pack(clock, round_id, size, limit, 0, START, difficulty, 0)
+                remaining = size
+                for attempt in range(1, limit + 1):
+                    clock += int(rng.expovariate(1 / 2.5) * 1e9)
+                    remaining = max(1, remaining // 2)
+                    batch += RECORD.pack(clock, round_id, attempt, remaining, attempt, GUESS, difficulty, 0)
+                    if remaining == 1:
+                        break
+                kind = WIN if remaining == 1 else LOSS
+                batch += RECORD.pack(clock, round_id, 0, 0, attempt, kind, difficulty, 0)
+            f.write(batch)
+            written += len(batch)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event log analytics throughput and memory on a large synthetic log.")
+    parser.add_argument("--megabytes", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "events.log")
+        size = write_log(path, args.megabytes, args.seed)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        report = summarize([path])
+        elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    guesses = sum(row["count"] for row in report["reaction_ms"].values())
+    print(f"Log size:        {size / 1e6:,.0f} MB ({size // RECORD.size:,} records)")
+    print(f"Analysis time:   {elapsed:.1f} s ({size / 1e6 / elapsed:,.1f} MB/s, {guesses:,} guesses)")
+    print(f"Peak RSS growth: {(rss_after - rss_before) / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui import GameGUI
+from main import NumberGuessingGame
+
+# Needs a display; on a headless machine run it under Xvfb:
+#   xvfb-run python benchmarks/bench_navigation.py
+
+
+def measure(gui, transitions):
+    # Main menu -> difficulty -> main menu -> AI mode -> ..., timing each hop
+    # until Tk has processed the resulting geometry and redraw work.
+    route = (gui.start_game, gui.create_widgets, gui.start_ai_game, gui.create_widgets)
+    samples = []
+    for i in range(transitions):
+        started = time.perf_counter()
+        route[i % len(route)]()
+        gui.update_idletasks()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run(transitions, cache):
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        game = NumberGuessingGame()
+        try:
+            # Opening the window can fail without a display; the game still
+            # has to close so its writer is done before the directory goes.
+            gui = GameGUI(game)
+            try:
+                gui.screens.cache = cache
+                gui.update()
+                gui.create_widgets()
+                gui.update()
+                return measure(gui, transitions)
+            finally:
+                gui.destroy()
+        finally:
+            game.close()
+            os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen navigation latency with cached and rebuilt screens.")
+    parser.add_argument("--transitions", type=int, default=400)
+    args = parser.parse_args()
+
+    print(f"{'Screens':<8} | {'Mean ms':>8} | {'p50 ms':>7} | {'p99 ms':>7} | {'Max ms':>7}")
+    for label, cache in (("rebuilt", False), ("cached", True)):
+        try:
+            samples = sorted(run(args.transitions, cache))
+        except tk.TclError as e:
+            sys.exit(f"Cannot open a window ({e}); run it under xvfb-run.")
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        print(f"{label:<8} | {statistics.mean(samples) * 1000:>8.2f} | {statistics.median(samples) * 1000:>7.2f} | {p99 * 1000:>7.2f} | {samples[-1] * 1000:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
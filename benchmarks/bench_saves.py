@@ -0,0 +1,67 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistence import WriteBehindWriter
+from saves import SaveStore
+
+
+def populate(store, start, stop):
+    for i in range(start, stop):
+        store.save(f"player{i}", "default", {"secret_number": i, "attempts": 1, "attempts_limit": 10,
+                                             "difficulty": "easy", "start_time": 0.0})
+
+
+def run(sizes, operations, seed):
+    # Save and resume latency as the store grows; both should stay flat.
+    rng = random.Random(seed)
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        writer = WriteBehindWriter()
+        writer.start()
+        try:
+            filler = SaveStore(os.path.join(directory, "saves"), writer)
+            store = SaveStore(os.path.join(directory, "saves"))
+            stored = 0
+            for n in sorted(sizes):
+                populate(filler, stored, n)
+                writer.flush()
+                stored = n
+                players = [f"player{rng.randrange(n)}" for _ in range(operations)]
+
+                started = time.perf_counter()
+                for name in players:
+                    store.save(name, "quick", {"secret_number": 1, "attempts": 0, "attempts_limit": 10,
+                                               "difficulty": "easy", "start_time": 0.0})
+                save_us = (time.perf_counter() - started) / operations * 1e6
+
+                started = time.perf_counter()
+                for name in players:
+                    if store.load(name) is None:
+                        raise RuntimeError(f"No save found for {name}")
+                resume_us = (time.perf_counter() - started) / operations * 1e6
+                rows.append((n, save_us, resume_us))
+        finally:
+            writer.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save and resume latency against the number of stored saves.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Saves':>8} | {'Save us':>9} | {'Resume us':>9}")
+    for n, save_us, resume_us in run(args.sizes, args.operations, args.seed):
+        print(f"{n:>8} | {save_us:>9.1f} | {resume_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui import GameGUI
+from main import NumberGuessingGame
+
+# Needs a display; on a headless machine run it under Xvfb:
+#   xvfb-run python benchmarks/bench_theme.py
+
+
+def walk_tree(widget, theme):
+    # What set_theme used to do: visit every widget with isinstance checks
+    # and a try/except around each configure.
+    try:
+        widget.configure(bg=theme["bg"], fg=theme["fg"])
+    except tk.TclError:
+        pass
+    for child in widget.winfo_children():
+        try:
+            if isinstance(child, tk.Button):
+                child.configure(bg=theme["button_bg"], fg=theme["button_fg"])
+            elif isinstance(child, tk.Radiobutton):
+                child.configure(bg=theme["radio_bg"], fg=theme["radio_fg"], selectcolor=theme["radio_select"])
+            else:
+                child.configure(bg=theme["bg"], fg=theme["fg"])
+        except tk.TclError:
+            pass
+        if isinstance(child, (tk.Frame, tk.LabelFrame)):
+            walk_tree(child, theme)
+
+
+def run(widgets, switches):
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        game = NumberGuessingGame()
+        gui = GameGUI(game)
+        try:
+            # Screens are built lazily; build them all, then pad with labels.
+            for name in gui.screens.screens:
+                gui.screens.frame(name)
+            filler = gui.themes.register(tk.Frame(gui), "surface")
+            for i in range(widgets):
+                gui.themes.register(tk.Label(filler, text=str(i)), "text")
+            gui.update()
+
+            names = list(game.themes)
+            results = {"tree walk": [], "registry": []}
+            for i in range(switches):
+                name = names[i % len(names)]
+                started = time.perf_counter()
+                walk_tree(gui, game.themes[name])
+                gui.update_idletasks()
+                results["tree walk"].append(time.perf_counter() - started)
+                started = time.perf_counter()
+                gui.set_theme(name)
+                gui.update_idletasks()
+                results["registry"].append(time.perf_counter() - started)
+            return results
+        finally:
+            gui.destroy()
+            game.close()
+            os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Theme switch time with many widgets: tree walk vs role registry.")
+    parser.add_argument("--widgets", type=int, default=5000)
+    parser.add_argument("--switches", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args.widgets, args.switches)
+    print(f"{'Theme switch':<12} | {'Mean ms':>8} | {'Max ms':>7}")
+    for label, samples in results.items():
+        print(f"{label:<12} | {statistics.mean(samples) * 1000:>8.2f} | {max(samples) * 1000:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation import linear
+from gui import FADE_SECONDS, GameGUI
+from main import NumberGuessingGame
+
+# Needs a display; on a headless machine run it under Xvfb:
+#   xvfb-run python benchmarks/bench_toast.py
+
+
+def window_per_message(gui, message, color):
+    # What show_animated_message used to do: a new Toplevel per message,
+    # faded in and out, then destroyed.
+    window = tk.Toplevel(gui)
+    window.overrideredirect(True)
+    window.geometry("200x50+550+400")
+    window.attributes("-alpha", 0.0)
+    tk.Label(window, text=message, bg=color, fg="white", font=("Arial", 12, "bold")).pack(fill="both", expand=True)
+
+    def fade_out():
+        gui.animator.animate(window, FADE_SECONDS, lambda p: window.attributes("-alpha", 1.0 - p), easing=linear, on_done=window.destroy)
+
+    gui.animator.animate(window, FADE_SECONDS, lambda p: window.attributes("-alpha", p), easing=linear, on_done=fade_out)
+
+
+def toplevels(gui):
+    return sum(1 for widget in gui.winfo_children() if isinstance(widget, tk.Toplevel))
+
+
+def run(show, messages, interval):
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        game = NumberGuessingGame()
+        try:
+            # Opening the window can fail without a display; the game still
+            # has to close so its writer is done before the directory goes.
+            gui = GameGUI(game)
+            try:
+                gui.update()
+                latencies = []
+                peak = 0
+                for i in range(messages):
+                    started = time.perf_counter()
+                    show(gui, "Too low!" if i % 3 else "Too high!", "#ff9800")
+                    gui.update_idletasks()
+                    latencies.append(time.perf_counter() - started)
+                    peak = max(peak, toplevels(gui))
+                    deadline = time.perf_counter() + interval
+                    while time.perf_counter() < deadline:
+                        gui.update()
+                        time.sleep(0.002)
+                return latencies, peak
+            finally:
+                gui.destroy()
+        finally:
+            game.close()
+            os.chdir(cwd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guess feedback latency and window count, per-message windows vs the shared toast.")
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--interval", type=float, default=0.05, help="Seconds between guesses.")
+    args = parser.parse_args()
+
+    print(f"{'Feedback':<12} | {'Mean ms':>8} | {'p99 ms':>7} | {'Peak windows':>12}")
+    for label, show in (("per-message", window_per_message), ("toast", lambda gui, m, c: gui.show_animated_message(m, c))):
+        try:
+            latencies, peak = run(show, args.messages, args.interval)
+        except tk.TclError as e:
+            sys.exit(f"Cannot open a window ({e}); run it under xvfb-run.")
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"{label:<12} | {statistics.mean(latencies) * 1000:>8.2f} | {p99 * 1000:>7.2f} | {peak:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leaderboard_snapshot import write_snapshot
+from leaderboard_store import SQLiteLeaderboard
+from scoring import DIFFICULTY_MULTIPLIER, calculate_score
+
+DIFFICULTIES = tuple(DIFFICULTY_MULTIPLIER)
+# Names repeat, as on a real board: most entries come from a small pool.
+NAME_POOL = 5000
+
+
+def leaderboard_entries(n, seed=0):
+    # Entries shaped like update_leaderboard's, with scores derived from
+    # calculate_score's inputs so ties and ranges look realistic.
+    rng = random.Random(seed)
+    for _ in range(n):
+        difficulty = rng.choice(DIFFICULTIES)
+        attempts = rng.randint(1, 10)
+        time_taken = round(rng.expovariate(1 / 20), 2)
+        yield {
+            "name": f"player{rng.randrange(NAME_POOL)}",
+            "score": calculate_score(attempts, time_taken, difficulty),
+            "attempts": attempts,
+            "time_taken": time_taken,
+            "difficulty": difficulty,
+        }
+
+
+def score_inputs(n, seed=0):
+    rng = random.Random(seed)
+    return [(rng.randint(1, 10), rng.expovariate(1 / 20), rng.choice(DIFFICULTIES)) for _ in range(n)]
+
+
+def write_leaderboard(path, n, seed=0):
+    # Writes n synthetic entries in the store format the path selects, the
+    # same way open_leaderboard_store picks a backend.
+    entries = leaderboard_entries(n, seed)
+    if path.endswith((".db", ".sqlite", ".sqlite3")):
+        store = SQLiteLeaderboard(path)
+        try:
+            batch = []
+            for entry in entries:
+                batch.append(entry)
+                if len(batch) == 10000:
+                    store.add_many(batch)
+                    batch = []
+            if batch:
+                store.add_many(batch)
+        finally:
+            store.close()
+    elif path.endswith(".nglb"):
+        write_snapshot(path, list(entries))
+    else:
+        with open(path, "w") as f:
+            json.dump(sorted(entries, key=lambda e: e["score"], reverse=True), f)
+    return path
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Stats:
+    def __init__(self):
+        self.guesses = 0
+        self.rounds = 0
+        self.errors = 0
+        self.latencies = []
+
+
+async def player(host, port, unix_path, stats, deadline, rng, sample_every):
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    async def ask(line):
+        started = time.perf_counter_ns()
+        writer.write(line)
+        reply = await reader.readline()
+        if rng.random() < sample_every:
+            stats.latencies.append(time.perf_counter_ns() - started)
+        return reply.split()
+
+    try:
+        while time.monotonic() < deadline:
+            reply = await ask(f"NEW {rng.choice(('easy', 'medium', 'hard'))} bot{id(rng) % 100000}\n".encode())
+            if not reply or reply[0] != b"OK":
+                stats.errors += 1
+                break
+            lo, hi = int(reply[1]), int(reply[2])
+            while True:
+                # Bisect, with a little noise so rounds do not all look alike.
+                guess = min(hi, max(lo, (lo + hi) // 2 + rng.randint(-1, 1)))
+                reply = await ask(f"GUESS {guess}\n".encode())
+                stats.guesses += 1
+                if not reply:
+                    stats.errors += 1
+                    return
+                if reply[0] == b"LOW":
+                    lo = guess + 1
+                elif reply[0] == b"HIGH":
+                    hi = guess - 1
+                else:
+                    break
+            stats.rounds += 1
+        writer.write(b"QUIT\n")
+        await reader.readline()
+    except ConnectionError:
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def run(args):
+    stats = Stats()
+    rng = random.Random(args.seed)
+    connect_by = time.monotonic() + args.ramp
+    deadline = connect_by + args.duration
+    tasks = []
+    for i in range(args.sessions):
+        tasks.append(asyncio.create_task(player(args.host, args.port, args.unix, stats, deadline, random.Random(rng.random()), args.sample)))
+        if i % 500 == 499:
+            # Spread connects so the listen backlog does not overflow.
+            await asyncio.sleep(args.ramp * 500 / args.sessions)
+    # Count only the steady state, once every session is connected.
+    await asyncio.sleep(max(0.0, connect_by - time.monotonic()))
+    guesses_before = stats.guesses
+    stats.latencies.clear()
+    started = time.monotonic()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.monotonic() - started
+    return stats, (stats.guesses - guesses_before) / elapsed
+
+
+def raise_fd_limit(needed):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(soft, needed)) if hard != resource.RLIM_INFINITY else max(soft, needed)
+    if wanted > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+    return wanted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for server.py: many concurrent bisecting players.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="Connect to this Unix socket instead of TCP.")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of steady-state load after ramp-up.")
+    parser.add_argument("--ramp", type=float, default=5.0, help="Seconds to open all sessions.")
+    parser.add_argument("--sample", type=float, default=0.1, help="Fraction of requests whose latency is recorded.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true", help="Start server.py locally for the run.")
+    args = parser.parse_args()
+
+    limit = raise_fd_limit(args.sessions + 100)
+    if limit < args.sessions + 100:
+        print(f"Open file limit is {limit}; lower --sessions or raise `ulimit -n`.")
+
+    with tempfile.TemporaryDirectory() as directory:
+        server = None
+        if args.spawn:
+            command = [sys.executable, os.path.join(REPO, "server.py"), "--leaderboard", os.path.join(directory, "leaderboard.txt"),
+                       "--events", os.path.join(directory, "events.log")]
+            command += ["--unix", args.unix] if args.unix else ["--host", args.host, "--port", str(args.port)]
+            server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, cwd=directory)
+            server.stdout.readline()
+        try:
+            stats, rate = asyncio.run(run(args))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    latencies = sorted(stats.latencies)
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q))] / 1e6 if latencies else 0.0
+    print(f"Sessions:     {args.sessions}")
+    print(f"Rounds:       {stats.rounds}")
+    print(f"Guesses/sec:  {rate:,.0f}")
+    print(f"Latency p50:  {percentile(0.50):.2f} ms")
+    print(f"Latency p99:  {percentile(0.99):.2f} ms")
+    print(f"Errors:       {stats.errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_solver import HIGHER, LOWER, LyingSearchSolver
+from datagen import score_inputs, write_leaderboard
+from leaderboard_store import open_leaderboard_store
+from main import NumberGuessingGame
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GROUPS = ("leaderboard", "save", "score", "rescore", "ai", "gui")
+FORMATS = ("txt", "nglb", "db")
+THRESHOLD = 0.25
+
+
+def best_seconds(func, repeat):
+    # Best of several runs: the least disturbed by other load on the machine,
+    # which keeps run-to-run comparisons stable.
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def result(value, unit, better="lower"):
+    return {"value": value, "unit": unit, "better": better}
+
+
+def bench_leaderboard(results, directory, sizes, seed):
+    for fmt in FORMATS:
+        for n in sizes:
+            path = write_leaderboard(os.path.join(directory, f"leaderboard-{n}.{fmt}"), n, seed)
+
+            def load():
+                store = open_leaderboard_store(path)
+                store.top(5)
+                store.close()
+
+            results[f"leaderboard_load/{fmt}/{n}"] = result(best_seconds(load, 7) * 1000, "ms")
+
+            # update_leaderboard end to end: queued on the write-behind
+            # writer, then flushed to disk.
+            game = NumberGuessingGame(path, None, data_dir=directory)
+            try:
+                game.leaderboard.top(5)
+                updates = 200
+
+                def update():
+                    for i in range(updates):
+                        game.update_leaderboard("bench", i, 3, 1.5, "easy")
+                    game.writer.flush()
+
+                results[f"update_leaderboard/{fmt}/{n}"] = result(best_seconds(update, 5) / updates * 1e6, "us")
+            finally:
+                game.close()
+
+
+def bench_save_load(results, directory):
+    game = NumberGuessingGame(os.path.join(directory, "save-bench.txt"), None, data_dir=directory)
+    rounds = 200
+    try:
+        def round_trip():
+            for i in range(rounds):
+                game.save_game(i, 3, 10, "easy", 1_700_000_000.0)
+                game.writer.flush()
+                if game.load_game()["secret_number"] != i:
+                    raise RuntimeError("save/load round trip returned stale data")
+
+        results["save_load_round_trip"] = result(best_seconds(round_trip, 5) / rounds * 1e6, "us")
+    finally:
+        game.close()
+
+
+def bench_score(results, directory, records, seed):
+    game = NumberGuessingGame(os.path.join(directory, "score-bench.txt"), None, data_dir=directory)
+    inputs = score_inputs(records, seed)
+    try:
+        def score_all():
+            calculate_score = game.calculate_score
+            for attempts, time_taken, difficulty in inputs:
+                calculate_score(attempts, time_taken, difficulty)
+
+        results["calculate_score"] = result(best_seconds(score_all, 5) / records * 1e9, "ns")
+    finally:
+        game.close()
+
+
+def bench_rescore(results, directory, sizes, seed):
+    # rescore.py needs NumPy, like simulator.py.
+    from rescore import rescore
+
+    for fmt in FORMATS:
+        for n in sizes:
+            path = write_leaderboard(os.path.join(directory, f"rescore-{n}.{fmt}"), n, seed)
+            results[f"rescore/{fmt}/{n}"] = result(best_seconds(lambda: rescore(path), 3) * 1000, "ms")
+
+
+def bench_ai(results, bits_list, seed):
+    for bits in bits_list:
+        rng = random.Random(seed)
+        secrets = [rng.randint(1, 1 << bits) for _ in range(50)]
+        guesses = 0
+
+        def play_all():
+            nonlocal guesses
+            guesses = 0
+            for secret in secrets:
+                solver = LyingSearchSolver(1, 1 << bits, lies=1)
+                while True:
+                    guess = solver.next_guess()
+                    guesses += 1
+                    if guess == secret:
+                        break
+                    solver.answer(HIGHER if secret > guess else LOWER)
+
+        elapsed = best_seconds(play_all, 5)
+        results[f"ai_guesses_per_second/2^{bits}"] = result(guesses / elapsed, "guesses/s", "higher")
+
+
+def bench_gui(results):
+    # Screen and theme timings need an X display, e.g. `xvfb-run python benchmarks/run.py`.
+    import bench_navigation
+    import bench_theme
+
+    samples = sorted(bench_navigation.run(200, True))
+    results["screen_transition"] = result(statistics.mean(samples) * 1000, "ms")
+    results["screen_transition_p99"] = result(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, "ms")
+    theme = bench_theme.run(2000, 12)
+    results["theme_switch/2000_widgets"] = result(statistics.mean(theme["registry"]) * 1000, "ms")
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold):
+    # Returns (name, baseline, current, change, regressed) rows; change > 0 is worse.
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or not previous["value"] or not current["value"]:
+            continue
+        if current["better"] == "lower":
+            change = current["value"] / previous["value"] - 1
+        else:
+            change = previous["value"] / current["value"] - 1
+        rows.append((name, previous["value"], current["value"], change, change > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite for storage, engine, AI and GUI hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000], help="Leaderboard sizes (up to 10000000).")
+    parser.add_argument("--score-records", type=int, default=1_000_000)
+    parser.add_argument("--bits", type=int, nargs="+", default=[7, 16, 32, 64])
+    parser.add_argument("--only", nargs="+", choices=GROUPS, help="Run only these groups.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON (default: benchmarks/results/<commit>-<time>.json).")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Flag results this much worse than the baseline.")
+    args = parser.parse_args()
+
+    groups = args.only or GROUPS
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        if "leaderboard" in groups:
+            bench_leaderboard(results, directory, args.sizes, args.seed)
+        if "save" in groups:
+            bench_save_load(results, directory)
+        if "score" in groups:
+            bench_score(results, directory, args.score_records, args.seed)
+        if "rescore" in groups:
+            bench_rescore(results, directory, args.sizes, args.seed)
+        if "ai" in groups:
+            bench_ai(results, args.bits, args.seed)
+        if "gui" in groups:
+            if os.environ.get("DISPLAY"):
+                cwd = os.getcwd()
+                os.chdir(directory)
+                try:
+                    bench_gui(results)
+                finally:
+                    os.chdir(cwd)
+            else:
+                print("Skipping GUI benchmarks: no DISPLAY (run under xvfb-run).")
+
+    meta = metadata()
+    output = args.output
+    if output is None:
+        output = os.path.join(REPO, "benchmarks", "results", f"{meta['commit'] or 'local'}-{meta['timestamp'].replace(':', '')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    print(f"{'Benchmark':<40} | {'Value':>14} | {'Unit':<10}")
+    for name, row in results.items():
+        print(f"{name:<40} | {row['value']:>14.3f} | {row['unit']:<10}")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.threshold)
+        regressions = [row for row in rows if row[4]]
+        print(f"\n{'Benchmark':<40} | {'Baseline':>12} | {'Current':>12} | {'Change':>8}")
+        for name, previous, current, change, regressed in rows:
+            print(f"{name:<40} | {previous:>12.3f} | {current:>12.3f} | {change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui import GameGUI
+from main import NumberGuessingGame
+
+# Needs a display; on a headless machine run it under Xvfb:
+#   xvfb-run python benchmarks/soak_navigation.py
+
+
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        # Peak rather than current RSS, but still shows unbounded growth.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def tcl_commands(gui):
+    return len(gui.tk.splitlist(gui.tk.call("info", "commands")))
+
+
+def soak(gui, transitions, sample_every):
+    route = (gui.start_game, gui.play_game, gui.create_widgets, gui.start_ai_game, gui.create_widgets)
+    samples = [(0, tcl_commands(gui), rss_kib())]
+    for i in range(1, transitions + 1):
+        route[(i - 1) % len(route)]()
+        gui.update()
+        if i % sample_every == 0:
+            samples.append((i, tcl_commands(gui), rss_kib()))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tcl command count and RSS over many screen transitions.")
+    parser.add_argument("--transitions", type=int, default=10_000)
+    parser.add_argument("--sample-every", type=int, default=1000)
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild every screen on each visit instead of caching it.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        game = NumberGuessingGame()
+        try:
+            # Opening the window can fail without a display; the game still
+            # has to close so its writer is done before the directory goes.
+            gui = GameGUI(game)
+            try:
+                gui.screens.cache = not args.rebuild
+                gui.create_widgets()
+                gui.update()
+                samples = soak(gui, args.transitions, args.sample_every)
+            finally:
+                gui.destroy()
+        except tk.TclError as e:
+            sys.exit(f"Cannot open a window ({e}); run it under xvfb-run.")
+        finally:
+            game.close()
+            os.chdir(cwd)
+
+    print(f"{'Transitions':>11} | {'Tcl commands':>12} | {'RSS KiB':>9}")
+    for transitions, commands, rss in samples:
+        print(f"{transitions:>11} | {commands:>12} | {rss:>9}")
+    first = samples[min(1, len(samples) - 1)]
+    last = samples[-1]
+    print(f"Growth after warm-up: {last[1] - first[1]} Tcl commands, {last[2] - first[2]} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import random
+import time
+
+from hints import CandidateSet, HintEngine
+
+LOW = "low"
+HIGH = "high"
+CORRECT = "correct"
+
+
+class GuessOutcome:
+    __slots__ = ("result", "attempts_left", "finished", "won", "hint", "score", "time_taken", "remaining")
+
+    def __init__(self, result, attempts_left, finished, won, hint="", score=None, time_taken=None, remaining=None):
+        self.result = result
+        self.attempts_left = attempts_left
+        self.finished = finished
+        self.won = won
+        self.hint = hint
+        self.score = score
+        self.time_taken = time_taken
+        self.remaining = remaining
+
+
+class GameRound:
+    # One round of the NumberGuessingGame rules with no UI attached. The GUI,
+    # the terminal mode, the server and scripted drivers all feed guesses
+    # through guess(). Slotted, since the server keeps one per connection.
+    __slots__ = ("game", "difficulty", "min_range", "max_range", "attempts_limit", "secret_number", "attempts",
+                 "start_time", "finished", "won", "score", "time_taken", "candidates", "hints", "events", "round_id", "player")
+
+    def __init__(self, game, difficulty, secret_number=None, attempts=0, attempts_limit=None, start_time=None, rng=random, player=None,
+                 number_range=None):
+        self.game = game
+        self.difficulty = difficulty
+        self.player = player
+        (self.min_range, self.max_range), default_limit = game.set_difficulty(difficulty, player)
+        if number_range is not None:
+            self.min_range, self.max_range = number_range
+        self.attempts_limit = default_limit if attempts_limit is None else attempts_limit
+        if secret_number is None:
+            secret_number = rng.randint(self.min_range, self.max_range)
+        self.secret_number = secret_number
+        self.attempts = attempts
+        self.start_time = time.time() if start_time is None else start_time
+        self.finished = False
+        self.won = False
+        self.score = None
+        self.time_taken = None
+        self.candidates = CandidateSet(self.min_range, self.max_range)
+        self.hints = HintEngine(self.candidates)
+        self.events = game.events
+        self.round_id = self.events.start(self) if self.events is not None else 0
+
+    def remaining(self):
+        return self.candidates.count()
+
+    @classmethod
+    def from_save(cls, game, game_state):
+        # Saves from before min_range/max_range were stored get the current range.
+        number_range = None
+        if "min_range" in game_state:
+            number_range = (game_state["min_range"], game_state["max_range"])
+        return cls(game, game_state["difficulty"], game_state["secret_number"], game_state["attempts"],
+                   game_state["attempts_limit"], game_state["start_time"], player=game_state.get("name") or None,
+                   number_range=number_range)
+
+    @property
+    def attempts_left(self):
+        return self.attempts_limit - self.attempts
+
+    def guess(self, number):
+        if self.finished:
+            raise RuntimeError("The round is already over.")
+        self.attempts += 1
+
+        events = self.events
+        if number == self.secret_number:
+            self.finished = True
+            self.won = True
+            self.time_taken = time.time() - self.start_time
+            self.score = self.game.calculate_score(self.attempts, self.time_taken, self.difficulty)
+            if events is not None:
+                events.guess(self.round_id, self, number, 1)
+                events.finish(self.round_id, self)
+            return GuessOutcome(CORRECT, self.attempts_left, True, True, score=self.score, time_taken=self.time_taken)
+
+        result = LOW if number < self.secret_number else HIGH
+        if result == LOW:
+            self.candidates.exclude_up_to(number)
+        else:
+            self.candidates.exclude_from(number)
+        remaining = self.candidates.count()
+        if events is not None:
+            events.guess(self.round_id, self, number, remaining)
+        if self.attempts >= self.attempts_limit:
+            self.finished = True
+            self.time_taken = time.time() - self.start_time
+            if events is not None:
+                events.finish(self.round_id, self)
+            return GuessOutcome(result, 0, True, False, time_taken=self.time_taken)
+
+        hint = ""
+        # get_hint still decides when a hint is due; the hint engine decides
+        # which one is worth giving.
+        if self.game.get_hint(self.secret_number, self.attempts_left):
+            kind, hint = self.hints.best_hint(self.secret_number)
+            if hint:
+                before, remaining = remaining, self.candidates.count()
+                if events is not None:
+                    events.hint(self.round_id, self, before, remaining, kind)
+        return GuessOutcome(result, self.attempts_left, False, False, hint=hint, remaining=remaining)
@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import random
+import struct
+import time
+
+from leaderboard_snapshot import DIFFICULTIES, DIFFICULTY_CODES
+from metrics import BUCKETS_NS, METRICS, Histogram
+
+MAGIC = b"NGEV"
+VERSION = 1
+EVENTS_FILE = "events.log"
+MAX_BYTES = 64 * 1024 * 1024
+BACKUPS = 5
+BUFFER_BYTES = 64 * 1024
+READ_CHUNK = 1024 * 1024
+# Rounds still open while reading; anything older (a round abandoned when the
+# game was closed) is dropped so memory stays bounded.
+MAX_OPEN_ROUNDS = 100_000
+INT32 = 1 << 31
+
+START, GUESS, HINT, WIN, LOSS = range(5)
+KINDS = ("start", "guess", "hint", "win", "loss")
+# Codes for the kinds HintEngine.best_hint returns.
+HINT_KINDS = ("other", "parity", "divisibility", "digit root", "range")
+HINT_CODES = {kind: code for code, kind in enumerate(HINT_KINDS)}
+
+# magic, version, reserved
+HEADER = struct.Struct("<4sHH")
+# perf_counter_ns, round id, value, extra, attempt, kind, difficulty, detail
+#   start  value = range size, extra = attempts limit
+#   guess  value = the guess, extra = candidates left after it
+#   hint   value = candidates before the hint, extra = after, detail = hint kind
+#   win    value = score
+#   loss   value = the secret
+RECORD = struct.Struct("<qQiiHBBB")
+
+
+class EventLog:
+    # Append-only binary log of what happens in each round. Records are packed
+    # into an in-memory buffer on the caller's thread; full buffers, and the
+    # buffer at the end of every round, are handed to the write-behind writer,
+    # which appends them and rotates the file once it passes `max_bytes`
+    # (events.log -> events.log.1 -> ... -> events.log.<backups>).
+    def __init__(self, path=EVENTS_FILE, writer=None, max_bytes=MAX_BYTES, backups=BACKUPS, buffer_bytes=BUFFER_BYTES):
+        self.path = path
+        self.writer = writer
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer_bytes = buffer_bytes
+        self._buffer = bytearray()
+        self._file = None
+        self._size = 0
+
+    def start(self, game_round):
+        round_id = random.getrandbits(64)
+        self._record(round_id, START, game_round, game_round.max_range - game_round.min_range + 1, game_round.attempts_limit)
+        return round_id
+
+    def guess(self, round_id, game_round, number, remaining):
+        # Guesses arrive unchecked from the server; keep them within the field.
+        self._record(round_id, GUESS, game_round, max(-INT32, min(number, INT32 - 1)), remaining)
+
+    def hint(self, round_id, game_round, before, after, kind):
+        self._record(round_id, HINT, game_round, before, after, HINT_CODES.get(kind, 0))
+
+    def finish(self, round_id, game_round):
+        if game_round.won:
+            self._record(round_id, WIN, game_round, game_round.score, 0)
+        else:
+            self._record(round_id, LOSS, game_round, game_round.secret_number, 0)
+        self.flush()
+
+    def _record(self, round_id, kind, game_round, value, extra, detail=0):
+        self._buffer += RECORD.pack(time.perf_counter_ns(), round_id, value, extra, min(game_round.attempts, 0xFFFF),
+                                    kind, DIFFICULTY_CODES.get(game_round.difficulty, 0), detail)
+        if len(self._buffer) >= self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        if self.writer is not None:
+            self.writer.submit(self._append, chunk)
+        else:
+            self._append(chunk)
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.submit(self._close_file)
+        else:
+            self._close_file()
+
+    # The methods below run on the writer thread.
+
+    def _append(self, chunk):
+        if self._file is None:
+            self._open()
+        self._file.write(chunk)
+        self._file.flush()
+        self._size += len(chunk)
+        METRICS.count("file_written_bytes", len(chunk))
+        if self._size >= self.max_bytes:
+            self._rotate()
+
+    def _open(self):
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        if self._size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+            self._size = HEADER.size
+
+    def _rotate(self):
+        self._close_file()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def log_files(path=EVENTS_FILE, backups=BACKUPS):
+    # Oldest first, so records come out in the order they were written.
+    paths = [f"{path}.{i}" for i in range(backups, 0, -1)] + [path]
+    return [p for p in paths if os.path.exists(p)]
+
+
+def read_records(paths, chunk_size=READ_CHUNK):
+    # Streams records from each file a chunk at a time.
+    for path in paths:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                continue
+            magic, version, _ = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} event log")
+            tail = b""
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                data = tail + chunk
+                usable = len(data) - len(data) % RECORD.size
+                yield from RECORD.iter_unpack(data[:usable])
+                tail = data[usable:]
+            METRICS.count("file_read_bytes", f.tell())
+
+
+def derive(records):
+    # Turns raw records into observations, keeping state only for rounds that
+    # are still open:
+    #   ("reaction", difficulty, ns)                  time since the previous start or guess
+    #   ("progress", difficulty, attempt, fraction)   share of the range still possible
+    #   ("hint", difficulty, kind, before, after)
+    #   ("result", difficulty, won)
+    open_rounds = {}
+    for t_ns, round_id, value, extra, attempt, kind, difficulty, detail in records:
+        difficulty = DIFFICULTIES[difficulty]
+        if kind == START:
+            if len(open_rounds) >= MAX_OPEN_ROUNDS:
+                del open_rounds[next(iter(open_rounds))]
+            open_rounds[round_id] = [t_ns, value]
+            continue
+        state = open_rounds.get(round_id)
+        if state is None:
+            continue
+        if kind == GUESS:
+            yield "reaction", difficulty, t_ns - state[0]
+            yield "progress", difficulty, attempt, extra / state[1]
+            state[0] = t_ns
+        elif kind == HINT:
+            yield "hint", difficulty, HINT_KINDS[detail], value, extra
+        else:
+            yield "result", difficulty, kind == WIN
+            del open_rounds[round_id]
+
+
+class Summary:
+    # Running totals only: one histogram per difficulty, and sums keyed by
+    # attempt number or hint kind, so the size does not depend on the input.
+    def __init__(self):
+        self.reaction = {difficulty: Histogram() for difficulty in DIFFICULTIES}
+        self.progress = {difficulty: {} for difficulty in DIFFICULTIES}
+        self.hints = {}
+        self.results = {difficulty: [0, 0] for difficulty in DIFFICULTIES}
+
+    def add(self, observation):
+        kind, difficulty = observation[0], observation[1]
+        if kind == "reaction":
+            self.reaction[difficulty].observe(observation[2])
+        elif kind == "progress":
+            totals = self.progress[difficulty].setdefault(observation[2], [0, 0.0])
+            totals[0] += 1
+            totals[1] += observation[3]
+        elif kind == "hint":
+            totals = self.hints.setdefault(observation[2], [0, 0, 0.0])
+            before, after = observation[3], observation[4]
+            totals[0] += 1
+            totals[1] += before - after
+            totals[2] += (before - after) / before if before else 0.0
+        else:
+            self.results[difficulty][0 if observation[2] else 1] += 1
+
+    def report(self):
+        return {
+            "reaction_ms": {
+                difficulty: {
+                    "count": h.count,
+                    "mean": h.total_ns / h.count / 1e6 if h.count else 0.0,
+                    "p50": h.quantile(0.5) / 1e6,
+                    "p90": h.quantile(0.9) / 1e6,
+                    "buckets": {f"<={bound / 1e6:g}": count for bound, count in zip(BUCKETS_NS + (h.max_ns,), h.counts) if count},
+                }
+                for difficulty, h in self.reaction.items()
+            },
+            "convergence": {
+                difficulty: {attempt: total / count for attempt, (count, total) in sorted(attempts.items())}
+                for difficulty, attempts in self.progress.items()
+            },
+            "hints": {
+                kind: {"count": count, "mean_removed": removed / count, "mean_removed_share": share / count}
+                for kind, (count, removed, share) in sorted(self.hints.items())
+            },
+            "results": {difficulty: {"won": won, "lost": lost} for difficulty, (won, lost) in self.results.items()},
+        }
+
+
+def summarize(paths):
+    summary = Summary()
+    for observation in derive(read_records(paths)):
+        summary.add(observation)
+    return summary.report()
+
+
+def print_report(report):
+    for difficulty in DIFFICULTIES:
+        results = report["results"][difficulty]
+        reaction = report["reaction_ms"][difficulty]
+        if not reaction["count"]:
+            continue
+        print(f"{difficulty}: {results['won']} won, {results['lost']} lost, {reaction['count']} guesses")
+        print(f"  Reaction time: mean {reaction['mean']:.1f} ms, p50 <= {reaction['p50']:.1f} ms, p90 <= {reaction['p90']:.1f} ms")
+        curve = "  ".join(f"{attempt}:{share:.1%}" for attempt, share in report["convergence"][difficulty].items())
+        print(f"  Range left by attempt: {curve}")
+    if report["hints"]:
+        print(f"{'Hint':<14} | {'Given':>7} | {'Removed':>8} | {'Share':>6}")
+        for kind, row in report["hints"].items():
+            print(f"{kind:<14} | {row['count']:>7} | {row['mean_removed']:>8.1f} | {row['mean_removed_share']:>6.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize guess event logs: reaction times, convergence and hint effectiveness.")
+    parser.add_argument("paths", nargs="*", help=f"Event logs to read (default: {EVENTS_FILE} and its rotated files).")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON.")
+    args = parser.parse_args()
+
+    report = summarize(args.paths or log_files())
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
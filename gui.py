@@ -0,0 +1,406 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from ai_solver import LyingSearchSolver
+from animation import Animator, linear
+from engine import LOW
+from leaderboard_view import LeaderboardView
+from metrics import timed
+from screens import ScreenManager
+from themes import ThemeRegistry
+from toast import Toast
+
+AI_LIES = 1
+SLIDE_SECONDS = 0.25
+FADE_SECONDS = 0.5
+BUTTON_TAG = "GameButton"
+RANK_POLL_MS = 50
+# Background and hover colours of the fixed-colour buttons; "main" buttons
+# follow the theme.
+BUTTON_COLORS = {"save": ("#FFA500", "#ff9800"), "back": ("#FF6347", "#E55337"), "correct": ("#4CAF50", "#45a049")}
+
+
+class GameGUI(tk.Tk):
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+        self.title("Number Guessing Game")
+        self.geometry("400x400")
+        self.attributes("-alpha", 0.0)
+        self.username = ""
+        self.profile = None
+        self.themes = ThemeRegistry(self, game.themes, game.current_theme)
+        self.themes.register(self, "surface")
+        self.animator = Animator(self)
+        self.toast = Toast(self, self.animator)
+        self.bind_button_class()
+        self.create_menu()
+
+        # Every screen is built once and reused; see screens.ScreenManager.
+        self.screens = ScreenManager(self, self.slide_in)
+        self.screens.register("welcome", self.build_welcome_frame)
+        self.screens.register("personalized", self.build_personalized_frame, self.refresh_personalized_frame)
+        self.screens.register("main", self.build_main_frame)
+        self.screens.register("difficulty", self.build_difficulty_frame)
+        self.screens.register("play", self.build_play_frame, self.refresh_play_frame)
+        self.screens.register("ai", self.build_ai_frame, self.refresh_ai_frame)
+
+        self.create_welcome_frame()
+        self.fade_in()
+
+    def show_personalized_welcome(self):
+        self.username = self.name_entry.get()
+        if not self.username:
+            messagebox.showerror("Error", "Please enter your name.")
+            return
+        # Read once here; the profile store caches it for the rest of the session.
+        self.profile = self.game.profiles.get(self.username)
+        self.screens.show("personalized")
+
+    def build_personalized_frame(self):
+        self.personalized_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.welcome_label = self.themes.register(tk.Label(self.personalized_frame, text="", font=("Arial", 24, "bold")), "text")
+        self.welcome_label.pack(pady=40)
+
+        self.profile_label = self.themes.register(tk.Label(self.personalized_frame, text="", font=("Arial", 12)), "text")
+        self.profile_label.pack(pady=10)
+
+        self.make_button(self.personalized_frame, "Start Game", self.create_widgets).pack(pady=20)
+        return self.personalized_frame
+
+    def refresh_personalized_frame(self):
+        profile = self.profile
+        if profile.games:
+            self.welcome_label.config(text=f"Welcome back, {self.username}!")
+            self.profile_label.config(text=f"{profile.wins} wins in {profile.games} games, best streak {profile.best_streak}, "
+                                           f"average score {profile.score.mean:.0f}")
+        else:
+            self.welcome_label.config(text=f"Welcome, {self.username}!")
+            self.profile_label.config(text="")
+
+    def create_welcome_frame(self):
+        self.screens.show("welcome")
+
+    def build_welcome_frame(self):
+        self.welcome_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.themes.register(tk.Label(self.welcome_frame, text="Welcome to the Number Guessing Game!", font=("Arial", 18, "bold")), "text").pack(pady=20)
+        self.themes.register(tk.Label(self.welcome_frame, text="Please enter your name:", font=("Arial", 12)), "text").pack(pady=10)
+
+        self.name_entry = self.themes.register(tk.Entry(self.welcome_frame, font=("Arial", 14)), "text")
+        self.name_entry.pack(pady=5)
+
+        self.make_button(self.welcome_frame, "Continue", self.show_personalized_welcome).pack(pady=20)
+        return self.welcome_frame
+
+    def slide_in(self, widget):
+        # One slide at a time: a new screen takes over the "slide" tween, so a
+        # screen that has since been hidden is never placed again.
+        def place(progress):
+            widget.place(relx=1.5 - progress, rely=0.5, anchor="center", relwidth=0.9, relheight=0.9)
+        self.animator.animate(widget, SLIDE_SECONDS, place, key="slide")
+
+    def fade_in_widget(self, widget):
+        widget.attributes("-alpha", 0.0)
+        self.animator.animate(widget, FADE_SECONDS, lambda alpha: widget.attributes("-alpha", alpha), easing=linear)
+
+    def fade_in(self):
+        self.fade_in_widget(self)
+
+    def create_widgets(self):
+        self.screens.show("main")
+
+    def build_main_frame(self):
+        self.main_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.themes.register(tk.Label(self.main_frame, text="Number Guessing Game", font=("Arial", 24, "bold")), "text").pack(pady=10)
+
+        self.make_button(self.main_frame, "Start Game", self.start_game, width=20).pack(pady=5)
+        self.make_button(self.main_frame, "Load Game", self.load_game, width=20).pack(pady=5)
+        self.make_button(self.main_frame, "AI Opponent Mode", self.start_ai_game, width=20).pack(pady=5)
+        self.make_button(self.main_frame, "Show Leaderboard", self.show_leaderboard, width=20).pack(pady=5)
+        self.make_button(self.main_frame, "Instructions", self.show_instructions, width=20).pack(pady=5)
+        self.make_button(self.main_frame, "Exit", self.quit, width=20).pack(pady=5)
+
+        self.themes.register(tk.Label(self.main_frame, text="Change themes in the menu!", font=("Arial", 10, "italic")), "text").pack(pady=20)
+        return self.main_frame
+
+    def bind_button_class(self):
+        # Hover and press feedback for every game button is bound once per
+        # process on the "GameButton" bindtag, instead of four bind() calls
+        # (four new Tcl commands) per button built.
+        self.bind_class(BUTTON_TAG, "<Enter>", self.on_enter)
+        self.bind_class(BUTTON_TAG, "<Leave>", self.on_leave)
+        self.bind_class(BUTTON_TAG, "<Button-1>", self.on_press)
+        self.bind_class(BUTTON_TAG, "<ButtonRelease-1>", self.on_release)
+
+    def make_button(self, parent, text, command, role="main", **options):
+        style = {"font": ("Arial", 12), "pady": 10, "padx": 20, "relief": "raised"}
+        style.update(options)
+        button = tk.Button(parent, text=text, command=command, **style)
+        button.role = role
+        button.bindtags((str(button), BUTTON_TAG) + button.bindtags()[1:])
+        if role == "main":
+            self.themes.register(button, "button")
+        else:
+            button.configure(bg=BUTTON_COLORS[role][0], fg="white")
+        return button
+
+    def button_colors(self, role):
+        if role == "main":
+            theme = self.themes.theme
+            return theme["button_bg"], theme["button_hover"]
+        return BUTTON_COLORS[role]
+
+    def on_press(self, event):
+        event.widget.config(relief="sunken")
+
+    def on_release(self, event):
+        event.widget.config(relief="raised")
+
+    def on_enter(self, event):
+        event.widget.config(bg=self.button_colors(event.widget.role)[1])
+
+    def on_leave(self, event):
+        event.widget.config(bg=self.button_colors(event.widget.role)[0])
+
+    def create_menu(self):
+        self.menu_bar = tk.Menu(self)
+        self.config(menu=self.menu_bar)
+
+        theme_menu = tk.Menu(self.menu_bar, tearoff=0)
+        self.menu_bar.add_cascade(label="Themes", menu=theme_menu)
+
+        for theme_name in self.game.themes:
+            theme_menu.add_command(label=theme_name.capitalize(), command=lambda t=theme_name: self.set_theme(t))
+
+    def set_theme(self, theme_name):
+        self.game.current_theme = theme_name
+        self.themes.switch(theme_name)
+
+    def start_game(self):
+        self.screens.show("difficulty")
+
+    def build_difficulty_frame(self):
+        self.game_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.themes.register(tk.Label(self.game_frame, text="Choose Difficulty:", font=("Arial", 18, "bold")), "text").pack(pady=10)
+
+        self.difficulty_var = tk.StringVar(value="easy")
+        for text, value in (("Easy", "easy"), ("Medium", "medium"), ("Hard", "hard")):
+            radio = tk.Radiobutton(self.game_frame, text=text, variable=self.difficulty_var, value=value, font=("Arial", 16))
+            self.themes.register(radio, "radio").pack(anchor="w", pady=5)
+
+        self.make_button(self.game_frame, "Play", self.play_game).pack(pady=20)
+        self.make_button(self.game_frame, "Back to Main Menu", self.create_widgets, role="back").pack(pady=5)
+        return self.game_frame
+
+    def play_game(self):
+        self.round = self.game.play_round(self.difficulty_var.get(), self.username)
+        self.screens.show("play")
+
+    def build_play_frame(self):
+        self.play_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.range_label = self.themes.register(tk.Label(self.play_frame, text="", font=("Arial", 16)), "text")
+        self.range_label.pack(pady=10)
+
+        self.guess_entry = self.themes.register(tk.Entry(self.play_frame, font=("Arial", 14)), "text")
+        self.guess_entry.pack(pady=5)
+
+        self.make_button(self.play_frame, "Guess", self.check_guess).pack(pady=10)
+        self.make_button(self.play_frame, "Save Game", self.save_game, role="save").pack(pady=5)
+        self.make_button(self.play_frame, "Back to Main Menu", self.create_widgets, role="back").pack(pady=5)
+
+        self.attempts_label = self.themes.register(tk.Label(self.play_frame, text="", font=("Arial", 12)), "text")
+        self.attempts_label.pack()
+
+        self.hint_label = self.themes.register(tk.Label(self.play_frame, text="", font=("Arial", 12, "italic")), "text")
+        self.hint_label.pack()
+
+        self.remaining_label = self.themes.register(tk.Label(self.play_frame, text="", font=("Arial", 10)), "text")
+        self.remaining_label.pack()
+
+        self.optimal_label = self.themes.register(tk.Label(self.play_frame, text="", font=("Arial", 10, "italic")), "text")
+        self.optimal_label.pack(pady=5)
+        return self.play_frame
+
+    def refresh_play_frame(self):
+        self.range_label.config(text=f"Guess the number between {self.round.min_range} and {self.round.max_range}")
+        self.guess_entry.delete(0, tk.END)
+        self.attempts_label.config(text=f"Attempts left: {self.round.attempts_left}")
+        self.hint_label.config(text="")
+        self.remaining_label.config(text=f"{self.round.remaining()} numbers still possible")
+        win_probability, _ = self.game.optimal_play(self.round)
+        self.optimal_label.config(text=f"Best play wins at least {win_probability:.1%}")
+
+    def save_game(self):
+        r = self.round
+        self.game.save_game(r.secret_number, r.attempts, r.attempts_limit, r.difficulty, r.start_time, self.username,
+                            number_range=(r.min_range, r.max_range))
+
+    def load_game(self):
+        game_state = self.game.load_game(self.username)
+        if game_state:
+            self.round = self.game.resume_round(game_state)
+            self.animator.cancel("slide")
+            self.screens.show("play", animate=False)
+        else:
+            messagebox.showinfo("No Saved Game", "No saved game found.")
+
+    def ai_guess(self):
+        if not self.ai_solver.exhausted:
+            guess = self.ai_solver.next_guess()
+            self.ai_guess_label.config(text=f"Is your number {guess}?")
+            self.current_ai_guess = guess
+        else:
+                        messagebox.showinfo("AI Error", "You might have provided incorrect feedback.")
+                        self.create_widgets()
+    def ai_feedback(self, feedback):
+        self.ai_solver.answer(feedback)
+        self.ai_guess()
+
+    def ai_correct(self):
+                messagebox.showinfo("AI Wins!", f"The AI guessed your number: {self.current_ai_guess}")
+                self.create_widgets()
+    def show_animated_message(self, message, color):
+        self.toast.show(message, color)
+
+    def show_win_window(self, attempts, time_taken, score):
+        win_window = tk.Toplevel(self)
+        win_window.title("You Won!")
+        win_window.geometry("400x300")
+        self.themes.register(win_window, "surface")
+
+        self.themes.register(tk.Label(win_window, text="Congratulations!", font=("Arial", 24, "bold")), "text").pack(pady=20)
+
+        stats_frame = self.themes.register(tk.Frame(win_window), "surface")
+        stats_frame.pack(pady=10)
+
+        self.themes.register(tk.Label(stats_frame, text=f"Attempts: {attempts}", font=("Arial", 14)), "text").pack()
+        self.themes.register(tk.Label(stats_frame, text=f"Time taken: {time_taken:.2f} seconds", font=("Arial", 14)), "text").pack()
+        self.themes.register(tk.Label(stats_frame, text=f"Your score: {score}", font=("Arial", 14)), "text").pack()
+
+        difficulty = self.round.difficulty
+        self.game.finish_round(self.round, self.username)
+        rank_label = self.themes.register(tk.Label(stats_frame, text="Rank: ...", font=("Arial", 14)), "text")
+        rank_label.pack()
+        self.show_rank(win_window, rank_label, score, difficulty)
+
+        win_window.after(3000, lambda: [win_window.destroy(), self.create_widgets()])
+
+    def show_rank(self, window, label, score, difficulty):
+        # Until the writer thread has loaded the leaderboard, poll instead of
+        # waiting for it on the event loop.
+        if not window.winfo_exists():
+            return
+        leaderboard = self.game.leaderboard
+        if not leaderboard.ready():
+            window.after(RANK_POLL_MS, self.show_rank, window, label, score, difficulty)
+            return
+        rank = leaderboard.rank_of_score(score, difficulty)
+        total = leaderboard.count(difficulty)
+        label.config(text=f"Rank: #{rank} of {total} ({difficulty.capitalize()})")
+
+    def show_game_over_window(self, secret_number):
+        game_over_window = tk.Toplevel(self)
+        game_over_window.title("Game Over")
+        game_over_window.geometry("400x200")
+        self.themes.register(game_over_window, "surface")
+
+        self.themes.register(tk.Label(game_over_window, text="Game Over!", font=("Arial", 24, "bold")), "text").pack(pady=20)
+        self.themes.register(tk.Label(game_over_window, text=f"The number was {secret_number}", font=("Arial", 14)), "text").pack()
+
+        self.game.finish_round(self.round, self.username)
+        game_over_window.after(3000, lambda: [game_over_window.destroy(), self.create_widgets()])
+
+    @timed("check_guess")
+    def check_guess(self):
+        if self.round.finished:
+            return
+        try:
+            guess = int(self.guess_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Invalid input. Please enter a number.")
+            return
+
+        outcome = self.round.guess(guess)
+        if outcome.won:
+            self.show_win_window(self.round.attempts, outcome.time_taken, outcome.score)
+            return
+
+        self.show_animated_message("Too low!" if outcome.result == LOW else "Too high!", "#ff9800")
+        if outcome.finished:
+            self.show_game_over_window(self.round.secret_number)
+        else:
+            self.attempts_label.config(text=f"Attempts left: {outcome.attempts_left}")
+            if outcome.hint:
+                # Otherwise the last hint stays up; nothing new was learned.
+                self.hint_label.config(text=outcome.hint)
+            self.remaining_label.config(text=f"{outcome.remaining} numbers still possible")
+
+    def show_leaderboard(self):
+        self.show_custom_leaderboard()
+
+    def show_custom_leaderboard(self):
+        leaderboard_window = LeaderboardView(self, self.game.leaderboard, self.themes)
+        self.fade_in_widget(leaderboard_window)
+
+    def show_instructions(self):
+        self.show_instructions_window()
+
+    def show_instructions_window(self):
+        instructions_window = tk.Toplevel(self)
+        instructions_window.title("Instructions")
+        instructions_window.geometry("500x400")
+        self.themes.register(instructions_window, "surface")
+
+        instructions_text = '''
+        --- Number Guessing Game Instructions ---
+
+        1. Choose a difficulty level: easy, medium, or hard.
+
+        2. Guess the randomly generated number within the given range.
+
+        3. You have a limited number of attempts based on the difficulty.
+
+        4. Hints will be provided in the last few attempts.
+
+        5. Your score is based on attempts, time, and difficulty.
+
+        6. Try to get a high score and make it to the leaderboard!
+        '''
+
+        text_widget = self.themes.register(tk.Text(instructions_window, font=("Arial", 12), wrap="word", bd=0), "text")
+        text_widget.insert("1.0", instructions_text)
+        text_widget.config(state="disabled")
+        text_widget.pack(pady=20, padx=20, fill="both", expand=True)
+
+
+    def start_ai_game(self):
+        self.screens.show("ai")
+
+    def build_ai_frame(self):
+        self.ai_frame = self.themes.register(tk.Frame(self), "surface")
+
+        self.themes.register(tk.Label(self.ai_frame, text="AI Opponent Mode", font=("Arial", 24, "bold")), "text").pack(pady=20)
+        self.themes.register(tk.Label(self.ai_frame, text="Think of a number between 1 and 100.", font=("Arial", 14)), "text").pack(pady=10)
+
+        self.themes.register(tk.Label(self.ai_frame, text=f"The AI forgives up to {AI_LIES} wrong answer{'s' if AI_LIES != 1 else ''}.", font=("Arial", 10, "italic")), "text").pack()
+
+        self.ai_guess_label = self.themes.register(tk.Label(self.ai_frame, text="", font=("Arial", 16, "bold")), "text")
+        self.ai_guess_label.pack(pady=20)
+
+        button_frame = self.themes.register(tk.Frame(self.ai_frame), "surface")
+        button_frame.pack(pady=10)
+
+        self.make_button(button_frame, "Higher", lambda: self.ai_feedback("higher")).pack(side="left", padx=10)
+        self.make_button(button_frame, "Lower", lambda: self.ai_feedback("lower")).pack(side="left", padx=10)
+        self.make_button(button_frame, "Correct", self.ai_correct, role="correct").pack(side="left", padx=10)
+        self.make_button(self.ai_frame, "Back to Main Menu", self.create_widgets, role="back").pack(pady=20)
+        return self.ai_frame
+
+    def refresh_ai_frame(self):
+        self.ai_solver = LyingSearchSolver(1, 100, lies=AI_LIES)
+        self.ai_guess()
@@ -0,0 +1,119 @@
+DIVISORS = (3, 4, 5)
+SUB_RANGE_PARTS = 4
+# A hint must leave at least this many candidates, so it never names the number.
+MIN_REMAINING = 2
+
+
+class CandidateSet:
+    # The numbers still possible in [lo, hi], as one Python int used as a
+    # bitset (bit i is the number lo + i). Every update is a handful of
+    # whole-int operations, i.e. O(range / word size), which stays well under
+    # a millisecond for ranges in the millions.
+    __slots__ = ("lo", "hi", "size", "full", "bits", "_patterns")
+
+    def __init__(self, lo, hi):
+        self.lo = lo
+        self.hi = hi
+        self.size = hi - lo + 1
+        self.full = (1 << self.size) - 1
+        self.bits = self.full
+        self._patterns = {}
+
+    def count(self):
+        return self.bits.bit_count()
+
+    def __contains__(self, number):
+        return self.lo <= number <= self.hi and (self.bits >> (number - self.lo)) & 1 == 1
+
+    def smallest(self):
+        return self.lo + (self.bits & -self.bits).bit_length() - 1
+
+    def largest(self):
+        return self.lo + self.bits.bit_length() - 1
+
+    def exclude_up_to(self, number):
+        shift = min(max(number - self.lo + 1, 0), self.size)
+        self.bits = (self.bits >> shift) << shift
+
+    def exclude_from(self, number):
+        self.bits &= (1 << min(max(number - self.lo, 0), self.size)) - 1
+
+    def residue_mask(self, modulus, residue):
+        # Bits for every number congruent to residue (mod modulus), built by
+        # doubling a single period instead of visiting each number.
+        key = (modulus, residue % modulus)
+        mask = self._patterns.get(key)
+        if mask is None:
+            mask = 1 << ((residue - self.lo) % modulus)
+            span = modulus
+            while span < self.size:
+                mask |= mask << span
+                span *= 2
+            mask &= self.full
+            self._patterns[key] = mask
+        return mask
+
+    def range_mask(self, start, end):
+        start = max(start, self.lo) - self.lo
+        end = min(end, self.hi) - self.lo
+        if start > end:
+            return 0
+        return ((1 << (end - start + 1)) - 1) << start
+
+    def count_with(self, mask):
+        return (self.bits & mask).bit_count()
+
+    def restrict(self, mask):
+        self.bits &= mask
+
+
+class HintEngine:
+    # Offers parity, divisibility, digit-sum (digital root) and sub-range
+    # hints that are true of the secret, and picks the one that leaves the
+    # fewest candidates without naming the number outright.
+    __slots__ = ("candidates", "divisors", "last_hint")
+
+    def __init__(self, candidates, divisors=DIVISORS):
+        self.candidates = candidates
+        self.divisors = divisors
+        self.last_hint = ""
+
+    def hints_for(self, secret):
+        candidates = self.candidates
+        parity = secret % 2
+        yield "parity", f"Hint: The number is {'even' if parity == 0 else 'odd'}.", candidates.residue_mask(2, parity)
+
+        for divisor in self.divisors:
+            multiples = candidates.residue_mask(divisor, 0)
+            if secret % divisor == 0:
+                yield "divisibility", f"Hint: The number is divisible by {divisor}.", multiples
+            else:
+                yield "divisibility", f"Hint: The number is not divisible by {divisor}.", candidates.full & ~multiples
+
+        if candidates.lo > 0:
+            # The repeated digit sum of n > 0 is 1 + (n - 1) % 9.
+            root = 1 + (secret - 1) % 9
+            yield "digit root", f"Hint: Adding up the digits again and again gives {root}.", candidates.residue_mask(9, root)
+
+        low, high = candidates.smallest(), candidates.largest()
+        part = -(-(high - low + 1) // SUB_RANGE_PARTS)
+        start = low + (secret - low) // part * part
+        end = min(start + part - 1, high)
+        yield "range", f"Hint: The number is between {start} and {end}.", candidates.range_mask(start, end)
+
+    def best_hint(self, secret):
+        # Returns the hint's kind and text, or (None, "") when no hint
+        # narrows the candidates any further; the last one given stays in
+        # last_hint.
+        current = self.candidates.count()
+        best = None
+        for kind, text, mask in self.hints_for(secret):
+            remaining = self.candidates.count_with(mask)
+            if MIN_REMAINING <= remaining < current and (best is None or remaining < best[0]):
+                best = (remaining, kind, text, mask)
+        if best is None:
+            return None, ""
+        _, kind, text, mask = best
+        self.candidates.restrict(mask)
+        self.last_hint = text
+        return kind, text
@@ -0,0 +1,223 @@
+import argparse
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"NGLB"
+VERSION = 1
+DIFFICULTIES = ("easy", "medium", "hard")
+DIFFICULTY_CODES = {name: code for code, name in enumerate(DIFFICULTIES)}
+
+# magic, version, reserved, entry count, name count
+HEADER = struct.Struct("<4sHHII")
+NAME_OFFSET = struct.Struct("<I")
+# (column, array typecode, item size); time_taken is stored in hundredths
+# of a second, which is exactly the precision update_leaderboard keeps.
+COLUMNS = (
+    ("score", "i", 4),
+    ("attempts", "i", 4),
+    ("time_taken", "i", 4),
+    ("name_id", "I", 4),
+    ("difficulty", "B", 1),
+)
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _layout(count, name_count):
+    # Column offsets follow from the counts alone, so no offset table is stored.
+    offsets = {}
+    offset = _align(HEADER.size)
+    for column, _, size in COLUMNS:
+        offsets[column] = offset
+        offset = _align(offset + count * size)
+    offsets["name_offsets"] = offset
+    offsets["name_blob"] = offset + (name_count + 1) * 4
+    return offsets
+
+
+def _to_little_endian(values):
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def write_snapshot(path, entries):
+    entries = sorted(entries, key=lambda x: x["score"], reverse=True)
+    columns = {column: array.array(typecode) for column, typecode, _ in COLUMNS}
+    names = {}
+    for entry in entries:
+        columns["score"].append(entry["score"])
+        columns["attempts"].append(entry["attempts"])
+        columns["time_taken"].append(round(entry["time_taken"] * 100))
+        columns["name_id"].append(names.setdefault(entry["name"], len(names)))
+        columns["difficulty"].append(DIFFICULTY_CODES[entry["difficulty"]])
+
+    name_offsets = array.array("I", [0])
+    blob = bytearray()
+    for name in names:
+        blob += name.encode("utf-8")
+        name_offsets.append(len(blob))
+
+    offsets = _layout(len(entries), len(names))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), len(names)))
+        for column, _, _ in COLUMNS:
+            f.write(b"\0" * (offsets[column] - f.tell()))
+            f.write(_to_little_endian(columns[column]).tobytes())
+        f.write(b"\0" * (offsets["name_offsets"] - f.tell()))
+        f.write(_to_little_endian(name_offsets).tobytes())
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class ColumnarSnapshot:
+    # Read-only view over a snapshot written by write_snapshot. Columns are
+    # memoryviews straight onto the mapped file, so opening costs the same at
+    # any size and only the rows (and names) actually read are decoded.
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a leaderboard snapshot")
+        size = len(self._mmap)
+        if size < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is truncated, not a leaderboard snapshot")
+        magic, version, _, self.count, self.name_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} leaderboard snapshot")
+
+        self._offsets = _layout(self.count, self.name_count)
+        # Every column and the name offsets must fit, and the names must end
+        # where the last name offset says.
+        if size < self._offsets["name_blob"] or self._offsets["name_blob"] + NAME_OFFSET.unpack_from(
+                self._mmap, self._offsets["name_offsets"] + self.name_count * 4)[0] > size:
+            self.close()
+            raise ValueError(f"{path} is truncated: {self.count} entries and {self.name_count} names do not fit in {size} bytes")
+        view = memoryview(self._mmap)
+        self._columns = {}
+        for column, typecode, size in COLUMNS:
+            start = self._offsets[column]
+            self._columns[column] = self._column_view(view[start:start + self.count * size], typecode)
+        start = self._offsets["name_offsets"]
+        self._name_offsets = self._column_view(view[start:start + (self.name_count + 1) * 4], "I")
+        self._names = {}
+
+    def _column_view(self, raw, typecode):
+        if typecode == "B":
+            return raw
+        if sys.byteorder == "little":
+            return raw.cast(typecode)
+        values = array.array(typecode, raw)
+        values.byteswap()
+        return values
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # Drop our views first; mmap refuses to close while they are alive.
+        self._columns = {}
+        self._name_offsets = None
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def column(self, name):
+        return self._columns[name]
+
+    def name(self, name_id):
+        name = self._names.get(name_id)
+        if name is None:
+            start = self._offsets["name_blob"]
+            begin, end = self._name_offsets[name_id], self._name_offsets[name_id + 1]
+            name = self._mmap[start + begin:start + end].decode("utf-8")
+            self._names[name_id] = name
+        return name
+
+    def entry(self, i):
+        columns = self._columns
+        return {
+            "name": self.name(columns["name_id"][i]),
+            "score": columns["score"][i],
+            "attempts": columns["attempts"][i],
+            "time_taken": columns["time_taken"][i] / 100,
+            "difficulty": DIFFICULTIES[columns["difficulty"][i]],
+        }
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return self.entry(i)
+
+    def iter_entries(self):
+        for i in range(self.count):
+            yield self.entry(i)
+
+    def top(self, n, difficulty=None):
+        # Rows are stored best score first, so the top n of a difficulty are
+        # its first n rows; bytes.find walks the 1-byte column in C.
+        if difficulty is None:
+            return [self.entry(i) for i in range(min(n, self.count))]
+        code = bytes([DIFFICULTY_CODES[difficulty]])
+        base = self._offsets["difficulty"]
+        entries = []
+        i = self._mmap.find(code, base, base + self.count)
+        while i != -1 and len(entries) < n:
+            entries.append(self.entry(i - base))
+            i = self._mmap.find(code, i + 1, base + self.count)
+        return entries
+
+
+def json_to_snapshot(json_file, snapshot_file):
+    with open(json_file, "r") as f:
+        entries = json.load(f)
+    return write_snapshot(snapshot_file, entries)
+
+
+def snapshot_to_json(snapshot_file, json_file):
+    with ColumnarSnapshot(snapshot_file) as snapshot:
+        entries = list(snapshot.iter_entries())
+    with open(json_file, "w") as f:
+        json.dump(entries, f, indent=4)
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert leaderboards between JSON and the binary snapshot format.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (("to-binary", "JSON leaderboard -> .nglb snapshot"), ("to-json", ".nglb snapshot -> JSON leaderboard")):
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument("source")
+        command_parser.add_argument("target")
+    args = parser.parse_args()
+
+    if args.command == "to-binary":
+        count = json_to_snapshot(args.source, args.target)
+    else:
+        count = snapshot_to_json(args.source, args.target)
+    print(f"Converted {count} entries into {args.target}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,668 @@
+import argparse
+import collections
+import heapq
+import itertools
+import json
+import os
+import sqlite3
+import urllib.parse
+
+from leaderboard_snapshot import DIFFICULTIES, ColumnarSnapshot, write_snapshot
+from metrics import METRICS
+from rank_index import SORT_COLUMNS
+
+TOP_K = 100
+COMPACT_EVERY = 1000
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+SNAPSHOT_SUFFIX = ".nglb"
+INDEX_SUFFIX = ".index.db"
+COMPACTING_SUFFIX = ".compacting"
+INDEX_BATCH = 10000
+ENTRY_COLUMNS = ("name", "score", "attempts", "time_taken", "difficulty")
+MAX_ANCHORS = 256
+
+# score_counts holds how many rows have each (difficulty, score); triggers
+# keep it in step, so counts and ranks read a few hundred rows at most
+# instead of walking the score index.
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS leaderboard (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        attempts INTEGER NOT NULL,
+        time_taken REAL NOT NULL,
+        difficulty TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS leaderboard_score ON leaderboard (score DESC, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_difficulty_score ON leaderboard (difficulty, score DESC, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_name ON leaderboard (name, score DESC)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_name_id ON leaderboard (name, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_attempts ON leaderboard (attempts, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_time_taken ON leaderboard (time_taken, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_difficulty_name ON leaderboard (difficulty, name, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_difficulty_attempts ON leaderboard (difficulty, attempts, id)",
+    "CREATE INDEX IF NOT EXISTS leaderboard_difficulty_time_taken ON leaderboard (difficulty, time_taken, id)",
+    """CREATE TABLE IF NOT EXISTS score_counts (
+        difficulty TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        n INTEGER NOT NULL,
+        PRIMARY KEY (difficulty, score)
+    ) WITHOUT ROWID""",
+    """CREATE TRIGGER IF NOT EXISTS leaderboard_count_insert AFTER INSERT ON leaderboard BEGIN
+        INSERT INTO score_counts VALUES (NEW.difficulty, NEW.score, 1)
+            ON CONFLICT (difficulty, score) DO UPDATE SET n = n + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS leaderboard_count_delete AFTER DELETE ON leaderboard BEGIN
+        UPDATE score_counts SET n = n - 1 WHERE difficulty = OLD.difficulty AND score = OLD.score;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS leaderboard_count_update AFTER UPDATE OF score, difficulty ON leaderboard BEGIN
+        UPDATE score_counts SET n = n - 1 WHERE difficulty = OLD.difficulty AND score = OLD.score;
+        INSERT INTO score_counts VALUES (NEW.difficulty, NEW.score, 1)
+            ON CONFLICT (difficulty, score) DO UPDATE SET n = n + 1;
+    END""",
+)
+
+
+class LeaderboardStore:
+    def add(self, entry):
+        raise NotImplementedError
+
+    def add_many(self, entries):
+        for entry in entries:
+            self.add(entry)
+
+    def top(self, n, difficulty=None):
+        raise NotImplementedError
+
+    def top_for_player(self, name, n):
+        entries = (entry for entry in self.iter_entries() if entry["name"] == name)
+        return heapq.nlargest(n, entries, key=lambda x: x["score"])
+
+    def iter_entries(self):
+        raise NotImplementedError
+
+    def count(self, difficulty=None):
+        raise NotImplementedError
+
+    def rank_of_score(self, score, difficulty=None):
+        raise NotImplementedError
+
+    def rank_of_player(self, name, difficulty=None):
+        raise NotImplementedError
+
+    def best_score(self, name, difficulty=None):
+        scores = [entry["score"] for entry in self.iter_entries()
+                  if entry["name"] == name and (difficulty is None or entry["difficulty"] == difficulty)]
+        return max(scores, default=None)
+
+    def score_counts(self):
+        # (difficulty, score, number of entries) for every score present.
+        counts = collections.Counter((entry["difficulty"], entry["score"]) for entry in self.iter_entries())
+        return ((difficulty, score, n) for (difficulty, score), n in counts.items())
+
+    def entries_around(self, rank, difficulty=None, radius=2):
+        raise NotImplementedError
+
+    def page(self, offset, limit, difficulty=None, sort="score", descending=True):
+        raise NotImplementedError
+
+    def reader(self):
+        # A separate read-only handle on the same data, safe to use from
+        # another thread while this store is being written.
+        raise NotImplementedError
+
+    def data_version(self):
+        # Changes whenever another connection writes the store; None for
+        # stores only this one writes.
+        return None
+
+    def close(self):
+        pass
+
+
+class AppendLogLeaderboard(LeaderboardStore):
+    # Wins are appended to a JSON-lines log next to the snapshot file and
+    # folded into a bounded per-difficulty top-K heap, so recording a win
+    # never re-reads or rewrites the whole leaderboard. The log is merged
+    # back into the snapshot every `compact_every` wins. The snapshot is a
+    # sorted JSON list, or a binary columnar file when it ends in `.nglb`.
+    # Counts, ranks and pages come from a SQLite index kept beside the files
+    # (see LeaderboardIndex), so none of them loads the full history.
+    def __init__(self, snapshot_file, log_file=None, top_k=TOP_K, compact_every=COMPACT_EVERY):
+        self.snapshot_file = snapshot_file
+        self.log_file = log_file or snapshot_file + ".log"
+        self.index_file = snapshot_file + INDEX_SUFFIX
+        self.top_k = top_k
+        self.compact_every = compact_every
+        self.columnar = snapshot_file.endswith(SNAPSHOT_SUFFIX)
+        self._top = None
+        self._index_store = None
+        self._seq = itertools.count()
+        self._log_count = 0
+        self._recovered = False
+
+    def _read_snapshot(self):
+        if self.columnar:
+            return self._read_columnar(None)
+        try:
+            with open(self.snapshot_file, "r") as f:
+                data = f.read()
+            METRICS.count("file_read_bytes", len(data))
+            return json.loads(data)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _read_columnar(self, top_k):
+        try:
+            with ColumnarSnapshot(self.snapshot_file) as snapshot:
+                if top_k is None:
+                    return list(snapshot.iter_entries())
+                return [entry for difficulty in DIFFICULTIES for entry in snapshot.top(top_k, difficulty)]
+        except (FileNotFoundError, ValueError):
+            return []
+
+    def _iter_snapshot(self):
+        if not self.columnar:
+            yield from self._read_snapshot()
+            return
+        try:
+            snapshot = ColumnarSnapshot(self.snapshot_file)
+        except (FileNotFoundError, ValueError):
+            return
+        with snapshot:
+            yield from snapshot.iter_entries()
+
+    def _read_log(self, path=None):
+        entries = []
+        try:
+            with open(path or self.log_file, "r") as f:
+                for line in f:
+                    METRICS.count("file_read_bytes", len(line))
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append.
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _load(self):
+        self._recover_compaction()
+        self._top = {}
+        # A columnar snapshot is stored best-first, so only the first top_k
+        # rows of each difficulty need decoding.
+        snapshot = self._read_columnar(self.top_k) if self.columnar else self._read_snapshot()
+        for entry in snapshot:
+            self._index(entry)
+        log_entries = self._read_log()
+        for entry in log_entries:
+            self._index(entry)
+        self._log_count = len(log_entries)
+
+    def _index(self, entry):
+        heap = self._top.setdefault(entry["difficulty"], [])
+        # Ties keep insertion order: an older entry outranks a newer one.
+        item = (entry["score"], -next(self._seq), entry)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def _snapshot_signature(self):
+        try:
+            stat = os.stat(self.snapshot_file)
+        except FileNotFoundError:
+            return "missing"
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _sorted_index(self):
+        # Opened on first use. A snapshot other than the one the index was
+        # built from means a full rebuild; otherwise only the log written
+        # since the index last saw it is added.
+        if self._index_store is None:
+            self._recover_compaction()
+            index = LeaderboardIndex(self.index_file)
+            signature = self._snapshot_signature()
+            source = index.source()
+            try:
+                log_size = os.path.getsize(self.log_file)
+            except FileNotFoundError:
+                log_size = 0
+            if source is None or source[0] != signature or source[1] > log_size:
+                index.reset(signature)
+                batch = []
+                for entry in self._iter_snapshot():
+                    batch.append(entry)
+                    if len(batch) >= INDEX_BATCH:
+                        index.add_many(batch)
+                        batch = []
+                index.add_many(batch)
+                source = (signature, 0)
+            self._index_log_tail(index, source[1])
+            self._index_store = index
+        return self._index_store
+
+    def _index_log_tail(self, index, offset):
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Stop before a torn final line; the next append completes or skips it.
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        index.add_many(entries, offset + end)
+
+    def add(self, entry):
+        self.add_many([entry])
+
+    def add_many(self, entries):
+        if self._top is None:
+            self._load()
+        index = self._sorted_index()
+        data = "".join(json.dumps(entry) + "\n" for entry in entries)
+        with open(self.log_file, "a") as f:
+            f.write(data)
+            log_size = f.tell()
+        METRICS.count("file_written_bytes", len(data))
+        index.add_many(entries, log_size)
+        for entry in entries:
+            self._index(entry)
+        self._log_count += len(entries)
+        if self._log_count >= self.compact_every:
+            self.compact()
+
+    def top(self, n, difficulty=None):
+        if self._top is None:
+            self._load()
+        if difficulty is None:
+            items = itertools.chain.from_iterable(self._top.values())
+        else:
+            items = self._top.get(difficulty, [])
+        return [item[2] for item in heapq.nlargest(n, items)]
+
+    def top_for_player(self, name, n):
+        return self._sorted_index().top_for_player(name, n)
+
+    def iter_entries(self):
+        self._recover_compaction()
+        yield from self._iter_snapshot()
+        yield from self._read_log()
+
+    def count(self, difficulty=None):
+        return self._sorted_index().count(difficulty)
+
+    def rank_of_score(self, score, difficulty=None):
+        return self._sorted_index().rank_of_score(score, difficulty)
+
+    def best_score(self, name, difficulty=None):
+        return self._sorted_index().best_score(name, difficulty)
+
+    def rank_of_player(self, name, difficulty=None):
+        return self._sorted_index().rank_of_player(name, difficulty)
+
+    def score_counts(self):
+        return self._sorted_index().score_counts()
+
+    def entries_around(self, rank, difficulty=None, radius=2):
+        return self._sorted_index().entries_around(rank, difficulty, radius)
+
+    def page(self, offset, limit, difficulty=None, sort="score", descending=True):
+        return self._sorted_index().page(offset, limit, difficulty, sort, descending)
+
+    def reader(self):
+        self._sorted_index()
+        return SQLiteLeaderboard(self.index_file, read_only=True)
+
+    def compact(self):
+        log_entries = self._read_log()
+        if not log_entries:
+            return
+        # The log is moved aside before the snapshot is replaced, and the
+        # snapshot it is merged into is recorded first, so after a crash
+        # _recover_compaction can tell whether the merge happened and no win
+        # is counted twice or lost.
+        compacting = self.log_file + COMPACTING_SUFFIX
+        with open(compacting + ".from", "w") as f:
+            f.write(self._snapshot_signature())
+        os.replace(self.log_file, compacting)
+        self._merge(log_entries)
+        self._finish_compaction()
+        self._log_count = 0
+        # The index already holds every entry, in the same order.
+        if self._index_store is not None:
+            self._index_store.set_source(self._snapshot_signature(), 0)
+
+    def _merge(self, log_entries):
+        log_entries.sort(key=lambda x: x["score"], reverse=True)
+        merged = heapq.merge(self._read_snapshot(), log_entries, key=lambda x: x["score"], reverse=True)
+        if self.columnar:
+            write_snapshot(self.snapshot_file, merged)
+        else:
+            tmp_file = self.snapshot_file + ".tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(list(merged), f, indent=4)
+            os.replace(tmp_file, self.snapshot_file)
+
+    def _finish_compaction(self):
+        compacting = self.log_file + COMPACTING_SUFFIX
+        for path in (compacting, compacting + ".from"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _recover_compaction(self):
+        # Finishes a compaction a crash interrupted: a log moved aside while
+        # the snapshot is still the one it was to be merged into is merged
+        # now; otherwise the new snapshot already holds it.
+        if self._recovered:
+            return
+        self._recovered = True
+        compacting = self.log_file + COMPACTING_SUFFIX
+        try:
+            with open(compacting + ".from", "r") as f:
+                source = f.read()
+        except FileNotFoundError:
+            source = None
+        if os.path.exists(compacting) and (source is None or source == self._snapshot_signature()):
+            log_entries = self._read_log(compacting)
+            if log_entries:
+                self._merge(log_entries)
+        self._finish_compaction()
+
+    def close(self):
+        if self._index_store is not None:
+            self._index_store.close()
+            self._index_store = None
+
+
+class SQLiteLeaderboard(LeaderboardStore):
+    # WAL lets readers run alongside a writer, and busy_timeout makes
+    # concurrent writers from other processes wait for the lock instead of
+    # failing, so several game instances can share one database file.
+    def __init__(self, db_file, timeout=5.0, read_only=False):
+        self.db_file = db_file
+        # Callers such as WriteBehindLeaderboard serialize access from other threads.
+        if read_only:
+            uri = "file:" + urllib.parse.quote(os.path.abspath(db_file)) + "?mode=ro"
+            self.conn = sqlite3.connect(uri, timeout=timeout, isolation_level=None, check_same_thread=False, uri=True)
+        else:
+            self.conn = sqlite3.connect(db_file, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # Page boundaries and counts served so far, for keyset paging (see page()).
+        self._anchors = {}
+        self._counts = {}
+        self._data_version = None
+        if read_only:
+            return
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._transaction(self._create_schema)
+
+    def _create_schema(self):
+        counted = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'score_counts'").fetchone()
+        for statement in SCHEMA:
+            self.conn.execute(statement)
+        if counted is None:
+            # Older databases: count what is there, in the same transaction
+            # that starts the triggers, so no row is missed or counted twice.
+            self.conn.execute("INSERT INTO score_counts SELECT difficulty, score, COUNT(*) FROM leaderboard GROUP BY difficulty, score")
+
+    def add(self, entry):
+        self.add_many([entry])
+
+    def add_many(self, entries):
+        self._transaction(self._insert, entries)
+
+    def _transaction(self, func, *args):
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            func(*args)
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        self._anchors.clear()
+        self._counts.clear()
+
+    def _insert(self, entries):
+        rows = [(e["name"], e["score"], e["attempts"], e["time_taken"], e["difficulty"]) for e in entries]
+        self.conn.executemany(
+            "INSERT INTO leaderboard (name, score, attempts, time_taken, difficulty) VALUES (?, ?, ?, ?, ?)", rows)
+
+    def _query(self, where, params, n):
+        sql = "SELECT name, score, attempts, time_taken, difficulty FROM leaderboard"
+        if where:
+            sql += " WHERE " + where
+        sql += " ORDER BY score DESC, id LIMIT ?"
+        return [dict(row) for row in self.conn.execute(sql, (*params, n))]
+
+    def top(self, n, difficulty=None):
+        where, params = self._where(difficulty)
+        return self._query(where, params, n)
+
+    def top_for_player(self, name, n):
+        return self._query("name = ?", (name,), n)
+
+    def _where(self, difficulty):
+        if difficulty is None:
+            return "", ()
+        return "difficulty = ?", (difficulty,)
+
+    def count(self, difficulty=None):
+        where, params = self._where(difficulty)
+        sql = "SELECT COALESCE(SUM(n), 0) FROM score_counts" + (" WHERE " + where if where else "")
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def rank_of_score(self, score, difficulty=None):
+        where, params = self._where(difficulty)
+        where = (where + " AND " if where else "") + "score > ?"
+        sql = "SELECT COALESCE(SUM(n), 0) FROM score_counts WHERE " + where
+        return self.conn.execute(sql, (*params, score)).fetchone()[0] + 1
+
+    def score_counts(self):
+        return (tuple(row) for row in self.conn.execute("SELECT difficulty, score, n FROM score_counts WHERE n > 0"))
+
+    def best_score(self, name, difficulty=None):
+        where, params = self._where(difficulty)
+        where = (where + " AND " if where else "") + "name = ?"
+        return self.conn.execute("SELECT MAX(score) FROM leaderboard WHERE " + where, (*params, name)).fetchone()[0]
+
+    def rank_of_player(self, name, difficulty=None):
+        best = self.best_score(name, difficulty)
+        if best is None:
+            return None
+        return self.rank_of_score(best, difficulty)
+
+    def entries_around(self, rank, difficulty=None, radius=2):
+        start = max(0, rank - 1 - radius)
+        return [(start + i + 1, entry) for i, entry in enumerate(self.page(start, rank + radius - start, difficulty))]
+
+    def _score_groups(self, difficulty):
+        where, params = self._where(difficulty)
+        sql = "SELECT score, SUM(n) FROM score_counts" + (" WHERE " + where if where else "")
+        return self.conn.execute(sql + " GROUP BY score HAVING SUM(n) > 0 ORDER BY score DESC", params).fetchall()
+
+    # Pages are found by seeking (keyset paging) rather than with OFFSET,
+    # which walks every skipped row. Every served page leaves its first and
+    # last row as anchors, so scrolling seeks to a neighbouring anchor and
+    # reads on from there; a jump in score order seeks to the first row with
+    # the score at that position; both ends are always anchors. Rows are
+    # read in descending order, and an ascending page is the same rows read
+    # from the other end.
+    #
+    # Other columns have no counts to jump by, and SQLite indexes cannot
+    # find the n-th row without walking to it, so a jump far from any anchor
+    # in name, attempts or time order still skips rows in the index: about
+    # 45 ms per million rows, up to half the board away.
+    def page(self, offset, limit, difficulty=None, sort="score", descending=True):
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort leaderboard by {sort!r}")
+        version = self.data_version()
+        if version != self._data_version:
+            # Another connection changed the table, so positions moved.
+            self._anchors.clear()
+            self._counts.clear()
+            self._data_version = version
+        if difficulty not in self._counts:
+            self._counts[difficulty] = self.count(difficulty)
+        total = self._counts[difficulty]
+        limit = min(limit, total - offset)
+        if offset < 0 or limit <= 0:
+            return []
+        start = offset if descending else total - offset - limit
+        anchors = self._anchors.setdefault((difficulty, sort), {})
+
+        # (rows to skip, anchor key, forward); a None key starts at that end.
+        seek = (start, None, True)
+        if total - start - limit < seek[0]:
+            seek = (total - start - limit, None, False)
+        for position, key in anchors.items():
+            if position <= start and start - position < seek[0]:
+                seek = (start - position, key, True)
+            elif position >= start + limit - 1 and position - (start + limit - 1) < seek[0]:
+                seek = (position - (start + limit - 1), key, False)
+        if sort == "score" and seek[0] > limit:
+            before = 0
+            for score, n in self._score_groups(difficulty):
+                if before + n > start:
+                    if start - before < seek[0]:
+                        seek = (start - before, (score, 0), True)
+                    break
+                before += n
+
+        skip, key, forward = seek
+        rows = self._seek(difficulty, sort, key, forward, skip, limit)
+        if not forward:
+            rows.reverse()
+        if rows:
+            if len(anchors) > MAX_ANCHORS:
+                anchors.clear()
+            anchors[start] = (rows[0][sort], rows[0]["id"])
+            anchors[start + len(rows) - 1] = (rows[-1][sort], rows[-1]["id"])
+        entries = [{column: row[column] for column in ENTRY_COLUMNS} for row in rows]
+        return entries if descending else entries[::-1]
+
+    def _seek(self, difficulty, sort, key, forward, skip, limit):
+        # Rows from `key` on (inclusive), in descending order when `forward`
+        # and ascending otherwise. Each part is a range over one index: a
+        # seek finishes the anchor's group of equal values by id, then moves
+        # on to the lower (or higher) values. SQLite would only bound a
+        # row-value range such as (attempts, id) <= (?, ?) on its first
+        # column, and walk the whole group to find the id.
+        where, params = self._where(difficulty)
+        if sort == "score":
+            # Scores are descending with ties by ascending id.
+            within, across = ("id", "score DESC, id") if forward else ("id DESC", "score, id DESC")
+            equal, beyond = (">=", "<") if forward else ("<=", ">")
+        else:
+            within, across = ("id DESC", f"{sort} DESC, id DESC") if forward else ("id", f"{sort}, id")
+            equal, beyond = ("<=", "<") if forward else (">=", ">")
+        if key is None:
+            parts = [("", (), across)]
+        else:
+            parts = [(f"{sort} = ? AND id {equal} ?", key, within), (f"{sort} {beyond} ?", key[:1], across)]
+
+        rows = []
+        for i, (condition, values, order) in enumerate(parts):
+            clauses = " AND ".join(clause for clause in (where, condition) if clause)
+            clauses = " WHERE " + clauses if clauses else ""
+            found = self.conn.execute(f"SELECT id, {', '.join(ENTRY_COLUMNS)} FROM leaderboard{clauses} ORDER BY {order} LIMIT ? OFFSET ?",
+                                      (*params, *values, limit - len(rows), skip)).fetchall()
+            rows += found
+            if len(rows) == limit or i == len(parts) - 1:
+                break
+            if found:
+                skip = 0
+            else:
+                skip -= self.conn.execute(f"SELECT COUNT(*) FROM leaderboard{clauses}", (*params, *values)).fetchone()[0]
+        return rows
+
+    def iter_entries(self):
+        cursor = self.conn.execute("SELECT name, score, attempts, time_taken, difficulty FROM leaderboard ORDER BY id")
+        for row in cursor:
+            yield dict(row)
+
+    def reader(self):
+        return SQLiteLeaderboard(self.db_file, read_only=True)
+
+    def data_version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class LeaderboardIndex(SQLiteLeaderboard):
+    # The SQLite copy of an AppendLogLeaderboard. It records which snapshot
+    # it was built from and how much of the log it holds, in the same
+    # transaction as the rows, so a restart only indexes the wins appended
+    # since, and a rewritten snapshot (compaction aside) forces a rebuild.
+    def __init__(self, db_file):
+        super().__init__(db_file)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS index_source ("
+                          "id INTEGER PRIMARY KEY CHECK (id = 0), snapshot TEXT NOT NULL, log_size INTEGER NOT NULL)")
+
+    def source(self):
+        row = self.conn.execute("SELECT snapshot, log_size FROM index_source").fetchone()
+        return None if row is None else tuple(row)
+
+    def set_source(self, snapshot, log_size):
+        self.conn.execute("INSERT OR REPLACE INTO index_source VALUES (0, ?, ?)", (snapshot, log_size))
+
+    def add_many(self, entries, log_size=None):
+        def write():
+            self._insert(entries)
+            if log_size is not None:
+                self.conn.execute("UPDATE index_source SET log_size = ?", (log_size,))
+        self._transaction(write)
+
+    def reset(self, snapshot):
+        def write():
+            self.conn.execute("DELETE FROM leaderboard")
+            self.conn.execute("DELETE FROM score_counts")
+            self.set_source(snapshot, 0)
+        self._transaction(write)
+
+
+def open_leaderboard_store(path):
+    if path.endswith(SQLITE_SUFFIXES):
+        return SQLiteLeaderboard(path)
+    return AppendLogLeaderboard(path)
+
+
+def import_json_leaderboard(json_file, store, batch_size=10000):
+    with open(json_file, "r") as f:
+        entries = json.load(f)
+    for i in range(0, len(entries), batch_size):
+        store.add_many(entries[i:i + batch_size])
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Leaderboard storage tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser("import", help="Import a JSON leaderboard into another store.")
+    import_parser.add_argument("source", help="JSON leaderboard file, e.g. leaderboard.txt")
+    import_parser.add_argument("target", help="Target store, e.g. leaderboard.db")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        store = open_leaderboard_store(args.target)
+        try:
+            count = import_json_leaderboard(args.source, store)
+        finally:
+            store.close()
+        print(f"Imported {count} entries into {args.target}.")
+
+
+if __name__ == "__main__":
+    main()
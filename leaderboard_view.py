@@ -0,0 +1,124 @@
+import tkinter as tk
+from tkinter import ttk
+
+COLUMNS = (
+    ("rank", "Rank", 50),
+    ("name", "Name", 150),
+    ("score", "Score", 70),
+    ("attempts", "Attempts", 80),
+    ("time_taken", "Time (s)", 80),
+    ("difficulty", "Difficulty", 90),
+)
+SORTABLE = ("name", "score", "attempts", "time_taken")
+FILTERS = ("All", "Easy", "Medium", "Hard")
+ROW_HEIGHT = 25
+
+
+class LeaderboardView(tk.Toplevel):
+    # The Treeview only ever holds one screenful of rows. The scrollbar is
+    # driven by hand against store.count(), and every scroll asks the store
+    # for just the visible page, so opening and scrolling cost the same for
+    # a board of 100 entries or 10 million. Dragging the scrollbar far in a
+    # sort other than score is the exception (see SQLiteLeaderboard.page).
+    def __init__(self, master, store, themes, rows=12):
+        super().__init__(master)
+        self.store = store
+        self.rows = rows
+        self.offset = 0
+        self.total = 0
+        self.sort = "score"
+        self.descending = True
+        self.difficulty = None
+
+        self.title("Leaderboard")
+        self.geometry("600x420")
+        themes.register(self, "surface")
+
+        filter_frame = themes.register(tk.Frame(self), "surface")
+        filter_frame.pack(fill="x", padx=20, pady=(15, 0))
+        themes.register(tk.Label(filter_frame, text="Difficulty:", font=("Arial", 12)), "text").pack(side="left")
+        self.filter_var = tk.StringVar(value=FILTERS[0])
+        filter_box = ttk.Combobox(filter_frame, textvariable=self.filter_var, values=FILTERS, state="readonly", width=10)
+        filter_box.pack(side="left", padx=10)
+        filter_box.bind("<<ComboboxSelected>>", self.on_filter)
+
+        body = themes.register(tk.Frame(self), "surface")
+        body.pack(pady=15, padx=20, fill="both", expand=True)
+        self.tree = ttk.Treeview(body, columns=[c[0] for c in COLUMNS], show="headings", height=rows, selectmode="none")
+        for column, heading, width in COLUMNS:
+            if column in SORTABLE:
+                self.tree.heading(column, text=heading, command=lambda c=column: self.sort_by(c))
+            else:
+                self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="center")
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.items = [self.tree.insert("", "end") for _ in range(rows)]
+
+        self.tree.bind("<MouseWheel>", self.on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+        self.tree.bind("<Configure>", self.on_resize)
+
+        self.reload()
+
+    def reload(self):
+        self.total = self.store.count(self.difficulty)
+        self.scroll_to(self.offset)
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, self.total - self.rows))
+        entries = self.store.page(self.offset, self.rows, self.difficulty, self.sort, self.descending)
+        for i, item in enumerate(self.items):
+            if i < len(entries):
+                entry = entries[i]
+                values = (self.offset + i + 1, entry["name"], entry["score"], entry["attempts"], entry["time_taken"], entry["difficulty"].capitalize())
+                self.tree.item(item, values=values)
+                self.tree.move(item, "", i)
+            else:
+                self.tree.detach(item)
+        if self.total:
+            self.scrollbar.set(self.offset / self.total, min(1.0, (self.offset + self.rows) / self.total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.total))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * self.rows)
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def on_wheel(self, event):
+        self.scroll_to(self.offset - 3 * (1 if event.delta > 0 else -1))
+
+    def on_resize(self, event):
+        # Keep exactly as many rows as fit; the heading takes one row's height.
+        rows = max(1, event.height // ROW_HEIGHT - 1)
+        if rows == self.rows:
+            return
+        while len(self.items) < rows:
+            self.items.append(self.tree.insert("", "end"))
+        while len(self.items) > rows:
+            self.tree.delete(self.items.pop())
+        self.rows = rows
+        self.tree.configure(height=rows)
+        self.scroll_to(self.offset)
+
+    def on_filter(self, event=None):
+        selected = self.filter_var.get()
+        self.difficulty = None if selected == FILTERS[0] else selected.lower()
+        self.offset = 0
+        self.reload()
+
+    def sort_by(self, column):
+        if column == self.sort:
+            self.descending = not self.descending
+        else:
+            self.sort = column
+            self.descending = column == "score"
+        self.offset = 0
+        self.scroll_to(0)
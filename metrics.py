@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Histogram bucket upper bounds: powers of four from 1 µs to ~16.8 s.
+BUCKETS_NS = tuple(1000 * 4 ** i for i in range(13))
+EXPORT_INTERVAL = 10.0
+PREFIX = "numguess"
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def observe(self, ns):
+        self.counts[bisect_left(BUCKETS_NS, ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation.
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_NS + (self.max_ns,), self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(bound, self.max_ns)
+        return 0
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "started")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter_ns() - self.started)
+        return False
+
+
+class Metrics:
+    # Per-operation latency histograms and plain counters. Everything is off
+    # until enable() is called: a disabled @timed function pays one attribute
+    # check, timer() hands back a shared no-op context manager, and count()
+    # returns straight away.
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._exporter = None
+
+    def enable(self, path=None, interval=EXPORT_INTERVAL):
+        self.enabled = True
+        if path is not None and self._exporter is None:
+            self._exporter = MetricsExporter(self, path, interval)
+            self._exporter.start()
+
+    def disable(self):
+        self.enabled = False
+        if self._exporter is not None:
+            self._exporter.stop()
+            self._exporter = None
+
+    def observe(self, name, ns):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(ns)
+
+    def count(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timer(self, name):
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name):
+        def decorate(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter_ns() - started)
+            return wrapper
+        return decorate
+
+    def snapshot(self):
+        with self._lock:
+            histograms = {name: (list(h.counts), h.count, h.total_ns, h.max_ns, h.quantile(0.5), h.quantile(0.99))
+                          for name, h in self.histograms.items()}
+            counters = dict(self.counters)
+        return histograms, counters
+
+    def to_json(self):
+        histograms, counters = self.snapshot()
+        return json.dumps({
+            "timestamp": time.time(),
+            "operations": {
+                name: {"count": count, "total_ms": total_ns / 1e6, "max_ms": max_ns / 1e6,
+                       "p50_ms": p50 / 1e6, "p99_ms": p99 / 1e6,
+                       "buckets_ns": dict(zip([str(b) for b in BUCKETS_NS] + ["+Inf"], counts))}
+                for name, (counts, count, total_ns, max_ns, p50, p99) in sorted(histograms.items())
+            },
+            "counters": dict(sorted(counters.items())),
+        }, indent=2)
+
+    def to_prometheus(self):
+        histograms, counters = self.snapshot()
+        lines = []
+        for name, (counts, count, total_ns, _, _, _) in sorted(histograms.items()):
+            metric = f"{PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS_NS, counts):
+                cumulative += bucket
+                lines.append(f'{metric}_bucket{{le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {count}')
+            lines.append(f"{metric}_sum {total_ns / 1e9:.9f}")
+            lines.append(f"{metric}_count {count}")
+        for name, value in sorted(counters.items()):
+            metric = f"{PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        data = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class MetricsExporter(threading.Thread):
+    # Rewrites the export file every `interval` seconds (Prometheus text
+    # format, or JSON for a .json path) and once more on stop.
+    def __init__(self, metrics, path, interval=EXPORT_INTERVAL):
+        super().__init__(name="metrics-exporter", daemon=True)
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.metrics.export(self.path)
+        self.metrics.export(self.path)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+METRICS = Metrics()
+timed = METRICS.timed
+timer = METRICS.timer
+count = METRICS.count
@@ -0,0 +1,361 @@
+import bisect
+import heapq
+import os
+import queue
+import threading
+import time
+import traceback
+
+from leaderboard_snapshot import DIFFICULTIES
+from leaderboard_store import TOP_K, LeaderboardStore
+from metrics import METRICS
+from rank_index import RankIndex
+
+FSYNC_INTERVAL = 1.0
+BATCH_SIZE = 256
+REFRESH_INTERVAL = 1.0
+
+
+def atomic_write(path, data, fsync=False):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(data)
+        METRICS.count("file_written_bytes", len(data))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class WriteBehindWriter(threading.Thread):
+    # Owns all blocking file I/O for the game. Callers enqueue work and return
+    # immediately; the thread drains the queue in batches, coalesces repeated
+    # writes to the same file, and fsyncs at most once per `fsync_interval`
+    # (and always on flush/close), which bounds how much can be lost on a crash.
+    def __init__(self, fsync_interval=FSYNC_INTERVAL, batch_size=BATCH_SIZE):
+        super().__init__(name="write-behind", daemon=True)
+        self.fsync_interval = fsync_interval
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending_files = {}
+        self._dirty = set()
+        self._last_fsync = time.monotonic()
+        self._closed = False
+
+    def write_file(self, path, data):
+        with self._lock:
+            self._pending_files[path] = data
+        self.queue.put(("file", path))
+
+    def pending_data(self, path):
+        with self._lock:
+            return self._pending_files.get(path)
+
+    def submit(self, func, *args):
+        self.queue.put(("call", (func, args)))
+
+    def submit_durable(self, func, *args):
+        # Runs func once every write queued before it is on disk.
+        self.queue.put(("durable", (func, args)))
+
+    def flush(self):
+        if not self.is_alive():
+            return
+        done = threading.Event()
+        self.queue.put(("flush", done))
+        done.wait()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self.is_alive():
+            self.queue.put(("stop", None))
+            self.join()
+
+    def run(self):
+        while True:
+            try:
+                job = self.queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                self._sync_dirty()
+                continue
+            batch = [job]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not self._process(batch):
+                return
+
+    def _process(self, batch):
+        paths = []
+        waiters = []
+        running = True
+        for kind, payload in batch:
+            if kind == "file":
+                if payload not in paths:
+                    paths.append(payload)
+            elif kind == "call":
+                self._run_call(payload)
+            elif kind == "durable":
+                for path in paths:
+                    self._write_pending(path)
+                paths = []
+                self._sync_dirty()
+                self._run_call(payload)
+            elif kind == "flush":
+                waiters.append(payload)
+            elif kind == "stop":
+                running = False
+
+        for path in paths:
+            self._write_pending(path)
+
+        if waiters or not running:
+            self._sync_dirty()
+        elif time.monotonic() - self._last_fsync >= self.fsync_interval:
+            self._sync_dirty()
+        for done in waiters:
+            done.set()
+        return running
+
+    def _run_call(self, payload):
+        func, args = payload
+        try:
+            func(*args)
+        except Exception:
+            traceback.print_exc()
+
+    def _write_pending(self, path):
+        with self._lock:
+            data = self._pending_files.get(path)
+        if data is None:
+            return
+        try:
+            atomic_write(path, data)
+        except OSError:
+            traceback.print_exc()
+            return
+        self._dirty.add(path)
+        with self._lock:
+            # Keep a newer write queued by the caller while we were busy.
+            if self._pending_files.get(path) is data:
+                del self._pending_files[path]
+
+    def _sync_dirty(self):
+        self._last_fsync = time.monotonic()
+        if not self._dirty:
+            return
+        directories = set()
+        for path in self._dirty:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            directories.add(os.path.dirname(os.path.abspath(path)))
+        for directory in directories:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        self._dirty.clear()
+
+
+class WriteBehindLeaderboard(LeaderboardStore):
+    # Queues leaderboard writes on a WriteBehindWriter and keeps every read
+    # off the store the writer is using. At startup the writer thread loads
+    # the top entries and score counts, ahead of any queued win; after that
+    # top, count and ranks are answered from memory, and pages come from a
+    # separate read-only handle (store.reader()). Entries that have not
+    # reached the store yet are merged into every read, so the game always
+    # sees its own wins. Wins other processes write to a shared store are
+    # picked up by reloading, at most every REFRESH_INTERVAL seconds.
+    def __init__(self, store, writer, top_k=TOP_K):
+        self.store = store
+        self.writer = writer
+        self.top_k = top_k
+        self._lock = threading.Lock()
+        self._pending = []
+        self._ranks = RankIndex()
+        # Best-first top entries per difficulty, and over all under None.
+        self._top = {}
+        self._top_keys = {}
+        self._reader = None
+        self._read_lock = threading.Lock()
+        self._ready = threading.Event()
+        self._data_version = None
+        self._refreshed_at = 0.0
+        writer.submit(self._warm)
+
+    def _warm(self):
+        try:
+            self._data_version = self.store.data_version()
+            self._load()
+            self._reader = self.store.reader()
+        finally:
+            self._ready.set()
+
+    def _load(self):
+        # Runs on the writer thread, the only one writing the store from this
+        # process, so the store holds exactly the wins no longer in _pending.
+        tops = {difficulty: self.store.top(self.top_k, difficulty) for difficulty in (None, *DIFFICULTIES)}
+        counts = list(self.store.score_counts())
+        with self._lock:
+            self._top, self._top_keys = {}, {}
+            self._ranks = RankIndex()
+            for difficulty, entries in tops.items():
+                for entry in entries:
+                    self._insert_top(difficulty, entry)
+            for difficulty, score, n in counts:
+                self._ranks.add_score(score, difficulty, n)
+            # Unwritten wins are newer than anything in the store.
+            for entry in self._pending:
+                self._ranks.add(entry)
+                self._insert_top(None, entry)
+                self._insert_top(entry["difficulty"], entry)
+
+    def _refresh(self):
+        version = self.store.data_version()
+        if version != self._data_version:
+            # Another connection has written to the store.
+            self._data_version = version
+            self._load()
+
+    def _request_refresh(self):
+        now = time.monotonic()
+        if now - self._refreshed_at >= REFRESH_INTERVAL:
+            self._refreshed_at = now
+            self.writer.submit(self._refresh)
+
+    def _insert_top(self, difficulty, entry):
+        keys = self._top_keys.setdefault(difficulty, [])
+        entries = self._top.setdefault(difficulty, [])
+        # Ties keep insertion order: an older entry outranks a newer one.
+        i = bisect.bisect_right(keys, -entry["score"])
+        if i < self.top_k:
+            keys.insert(i, -entry["score"])
+            entries.insert(i, entry)
+            del keys[self.top_k:], entries[self.top_k:]
+
+    def add(self, entry):
+        with self._lock:
+            self._pending.append(entry)
+            self._ranks.add(entry)
+            self._insert_top(None, entry)
+            self._insert_top(entry["difficulty"], entry)
+        self.writer.submit(self._commit_pending)
+
+    def _commit_pending(self):
+        # The store may compact here; reads never wait for it, as entries
+        # stay in _pending (and so in reads) until the store has them.
+        with self._lock:
+            batch = list(self._pending)
+        if not batch:
+            return
+        self.store.add_many(batch)
+        with self._lock:
+            del self._pending[:len(batch)]
+
+    def _pending_for(self, difficulty):
+        with self._lock:
+            return [e for e in self._pending if difficulty is None or e["difficulty"] == difficulty]
+
+    def ready(self):
+        # False until the writer thread has loaded the leaderboard; reads
+        # before then wait for it.
+        return self._ready.is_set()
+
+    def _read(self, method, *args):
+        self._ready.wait()
+        with self._read_lock:
+            return getattr(self._reader, method)(*args)
+
+    def top(self, n, difficulty=None):
+        self._ready.wait()
+        self._request_refresh()
+        if n > self.top_k:
+            return self.page(0, n, difficulty)
+        with self._lock:
+            return self._top.get(difficulty, [])[:n]
+
+    def top_for_player(self, name, n):
+        pending = [e for e in self._pending_for(None) if e["name"] == name]
+        entries = self._read("top_for_player", name, n)
+        return heapq.nlargest(n, entries + pending, key=lambda x: x["score"])
+
+    def iter_entries(self):
+        pending = self._pending_for(None)
+        self._ready.wait()
+        reader = self.store.reader()
+        try:
+            yield from reader.iter_entries()
+        finally:
+            reader.close()
+        yield from pending
+
+    def count(self, difficulty=None):
+        self._ready.wait()
+        self._request_refresh()
+        with self._lock:
+            return self._ranks.count(difficulty)
+
+    def rank_of_score(self, score, difficulty=None):
+        self._ready.wait()
+        self._request_refresh()
+        with self._lock:
+            return self._ranks.rank_of_score(score, difficulty)
+
+    def rank_of_player(self, name, difficulty=None):
+        best = self._read("best_score", name, difficulty)
+        with self._lock:
+            session = self._ranks.best_score(name, difficulty)
+        if session is not None and (best is None or session > best):
+            best = session
+        return None if best is None else self.rank_of_score(best, difficulty)
+
+    def entries_around(self, rank, difficulty=None, radius=2):
+        start = max(0, rank - 1 - radius)
+        return [(start + i + 1, entry) for i, entry in enumerate(self.page(start, rank + radius - start, difficulty))]
+
+    def page(self, offset, limit, difficulty=None, sort="score", descending=True):
+        pending = self._pending_for(difficulty)
+        if not pending:
+            return self._read("page", offset, limit, difficulty, sort, descending)
+        # Each unwritten entry moves rows down by at most one place, so the
+        # page lies within the stored rows from `offset - len(pending)` on.
+        start = max(0, offset - len(pending))
+        stored = self._read("page", start, limit + len(pending), difficulty, sort, descending)
+        # Unwritten entries are the newest. Stable sorting keeps the stored
+        # order, and puts them after older ties where the store lists older
+        # entries first (score descending, other columns ascending).
+        if (sort == "score") != descending:
+            merged = pending[::-1] + stored
+        else:
+            merged = stored + pending
+        merged.sort(key=lambda x: x[sort], reverse=descending)
+        # Unwritten entries that sort before the first stored row really sit
+        # among the rows before `start`. There are at most len(pending) of
+        # them at the front of merged, and past them merged[i] is the row at
+        # position start + i.
+        skip = offset - start
+        return merged[skip:skip + limit]
+
+    def close(self):
+        self.writer.flush()
+        self._commit_pending()
+        if self._reader is not None:
+            self._reader.close()
+        self.store.close()
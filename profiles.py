@@ -0,0 +1,139 @@
+import math
+from collections import OrderedDict
+
+from saves import PlayerFileStore
+
+PROFILE_DIR = "profiles"
+CACHE_SIZE = 256
+DEFAULT_RANGES = {"easy": (1, 50), "medium": (1, 100), "hard": (1, 200)}
+# adjust_range never shrinks a range below these upper bounds.
+RANGE_FLOORS = {"easy": 50, "medium": 100, "hard": 200}
+RANGE_STEP = 20
+
+
+def adjusted_range(difficulty, current, win):
+    (min_range, max_range) = current
+    if win:
+        return (min_range, max_range + RANGE_STEP)
+    return (min_range, max(RANGE_FLOORS[difficulty], max_range - RANGE_STEP))
+
+
+class RunningStats:
+    # Welford's online mean and variance: one update per game, no history.
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count=0, mean=0.0, m2=0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def to_list(self):
+        return [self.count, self.mean, self.m2]
+
+
+class Profile:
+    __slots__ = ("name", "games", "wins", "streak", "best_streak", "score", "attempts", "best_scores", "ranges")
+
+    def __init__(self, name, state=None):
+        state = state or {}
+        self.name = name
+        self.games = state.get("games", 0)
+        self.wins = state.get("wins", 0)
+        # Positive while winning, negative while losing.
+        self.streak = state.get("streak", 0)
+        self.best_streak = state.get("best_streak", 0)
+        # Score statistics cover won rounds only; attempts cover every round.
+        self.score = RunningStats(*state.get("score", ()))
+        self.attempts = RunningStats(*state.get("attempts", ()))
+        self.best_scores = dict(state.get("best_scores", {}))
+        ranges = state.get("ranges", {})
+        self.ranges = {difficulty: tuple(ranges.get(difficulty, default)) for difficulty, default in DEFAULT_RANGES.items()}
+
+    def record(self, game_round):
+        difficulty = game_round.difficulty
+        self.games += 1
+        self.attempts.add(game_round.attempts)
+        if game_round.won:
+            self.wins += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+            self.best_streak = max(self.best_streak, self.streak)
+            self.score.add(game_round.score)
+            if game_round.score > self.best_scores.get(difficulty, -math.inf):
+                self.best_scores[difficulty] = game_round.score
+        else:
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+        if difficulty in self.ranges:
+            self.ranges[difficulty] = adjusted_range(difficulty, self.ranges[difficulty], game_round.won)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "games": self.games,
+            "wins": self.wins,
+            "streak": self.streak,
+            "best_streak": self.best_streak,
+            "score": self.score.to_list(),
+            "attempts": self.attempts.to_list(),
+            "best_scores": self.best_scores,
+            "ranges": self.ranges,
+        }
+
+
+class ProfileStore(PlayerFileStore):
+    # One small JSON file per player (profiles/<2 hex>/<14 hex>.json). A
+    # profile is read the first time a name is seen, then served from an LRU
+    # cache of recently active players; every finished round updates it in
+    # O(1) and queues a rewrite, so an evicted profile has nothing to flush.
+    def __init__(self, root=PROFILE_DIR, writer=None, cache_size=CACHE_SIZE):
+        super().__init__(root, writer)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def path(self, name):
+        return self.player_dir(name) + ".json"
+
+    def get(self, name):
+        profile = self._cache.get(name)
+        if profile is not None:
+            self._cache.move_to_end(name)
+            return profile
+        return self.put(self.load(name))
+
+    def cached(self, name):
+        return name in self._cache
+
+    def load(self, name):
+        # Reads the profile without touching the cache, so it can run on
+        # another thread; put() then adds it on the caller's.
+        return Profile(name, self._read(self.path(name)))
+
+    def put(self, profile):
+        # A profile already cached is newer than one loaded meanwhile.
+        cached = self._cache.get(profile.name)
+        if cached is not None:
+            self._cache.move_to_end(profile.name)
+            return cached
+        self._cache[profile.name] = profile
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return profile
+
+    def record(self, name, game_round):
+        profile = self.get(name)
+        profile.record(game_round)
+        self._write(self.path(name), profile.to_dict())
+        return profile
@@ -0,0 +1,109 @@
+SORT_COLUMNS = ("score", "name", "attempts", "time_taken")
+MIN_SIZE = 64
+
+
+class ScoreCounts:
+    # Fenwick (binary indexed) tree of how many entries have each integer
+    # score in [low, low + size). Scores come from a bounded formula, so the
+    # range stays small; a score outside it rebuilds the tree around it.
+    def __init__(self):
+        self.low = 0
+        self.size = 0
+        self.total = 0
+        # Lowest and highest score actually stored; slots outside them are spare.
+        self.min_score = None
+        self.max_score = None
+        self._tree = [0]
+
+    def add(self, score, n=1):
+        if not self.low <= score < self.low + self.size:
+            self._grow(score)
+        i = score - self.low + 1
+        while i <= self.size:
+            self._tree[i] += n
+            i += i & -i
+        self.total += n
+        if self.min_score is None or score < self.min_score:
+            self.min_score = score
+        if self.max_score is None or score > self.max_score:
+            self.max_score = score
+
+    def count_at_most(self, score):
+        i = min(score - self.low + 1, self.size)
+        count = 0
+        while i > 0:
+            count += self._tree[i]
+            i -= i & -i
+        return count
+
+    def count_above(self, score):
+        return self.total - self.count_at_most(score)
+
+    def _grow(self, score):
+        if self.size:
+            low, high = min(score, self.min_score), max(score, self.max_score)
+            counts = [(s, self.count_at_most(s) - self.count_at_most(s - 1)) for s in range(self.min_score, self.max_score + 1)]
+        else:
+            low = high = score
+            counts = []
+        size = MIN_SIZE
+        while size < high - low + 1:
+            size *= 2
+        # The spare slots go on the side the scores are moving towards, so a
+        # run of falling (or rising) scores rebuilds only when the size doubles.
+        if not self.size:
+            low = score - size // 2
+        elif score < self.min_score:
+            low = high - size + 1
+        # Linear-time build: each node passes its sum on to its parent.
+        tree = [0] * (size + 1)
+        for s, n in counts:
+            tree[s - low + 1] = n
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.low, self.size, self._tree = low, size, tree
+
+
+class RankIndex:
+    # Score counts per difficulty, plus one over every difficulty under the
+    # key None, and each player's best score. A rank is one prefix sum,
+    # O(log n) to add or query; ties share a rank.
+    def __init__(self, entries=()):
+        self._counts = {}
+        self._best = {}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        self.add_score(entry["score"], entry["difficulty"])
+        name = entry["name"]
+        for group in (None, entry["difficulty"]):
+            best = self._best.get((name, group))
+            if best is None or entry["score"] > best:
+                self._best[(name, group)] = entry["score"]
+
+    def add_score(self, score, difficulty, n=1):
+        for group in (None, difficulty):
+            counts = self._counts.get(group)
+            if counts is None:
+                counts = self._counts[group] = ScoreCounts()
+            counts.add(score, n)
+
+    def count(self, difficulty=None):
+        counts = self._counts.get(difficulty)
+        return counts.total if counts is not None else 0
+
+    def rank_of_score(self, score, difficulty=None):
+        counts = self._counts.get(difficulty)
+        return (counts.count_above(score) if counts is not None else 0) + 1
+
+    def best_score(self, name, difficulty=None):
+        return self._best.get((name, difficulty))
+
+    def rank_of_player(self, name, difficulty=None):
+        best = self.best_score(name, difficulty)
+        if best is None:
+            return None
+        return self.rank_of_score(best, difficulty)
@@ -0,0 +1,236 @@
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from leaderboard_snapshot import DIFFICULTIES, DIFFICULTY_CODES, ColumnarSnapshot, _layout
+from leaderboard_store import INDEX_SUFFIX, SNAPSHOT_SUFFIX, SQLITE_SUFFIXES, AppendLogLeaderboard
+from persistence import atomic_write
+from scoring import CURRENT_VERSION, DIFFICULTY_MULTIPLIER, calculate_score, scoring_formula
+
+CHUNK = 1 << 20
+# Column dtypes of a .nglb snapshot, which is always little-endian.
+COLUMN_DTYPES = {"score": "<i4", "attempts": "<i4", "time_taken": "<i4", "name_id": "<u4", "difficulty": "u1"}
+MULTIPLIERS = np.array([DIFFICULTY_MULTIPLIER[difficulty] for difficulty in DIFFICULTIES])
+
+
+def new_scores(attempts, time_taken, difficulty_codes, version):
+    formula = scoring_formula(version)
+    return np.trunc(formula(attempts.astype(np.int64), time_taken, MULTIPLIERS[difficulty_codes])).astype(np.int64)
+
+
+# Columnar snapshots are rescored with a parallel, stable counting sort:
+#   1. every worker scores one chunk of rows and returns a histogram of the
+#      new scores;
+#   2. the histograms give each chunk the output position of its first row
+#      with every score;
+#   3. every worker scores its chunk again and scatters the rows straight
+#      into a memory-mapped copy of the file, which then replaces the
+#      original.
+# Each worker holds one chunk at a time, so memory does not grow with the
+# size of the leaderboard, and rows with equal scores keep their order.
+
+def _columns(path, offsets, start, end, mode="r"):
+    return {
+        column: np.memmap(path, dtype=dtype, mode=mode, offset=offsets[column] + start * np.dtype(dtype).itemsize, shape=(end - start,))
+        for column, dtype in COLUMN_DTYPES.items()
+    }
+
+
+def _chunk_keys(path, offsets, start, end, version):
+    # Sort keys are negated scores: ascending keys are best-first rows.
+    columns = _columns(path, offsets, start, end)
+    scores = new_scores(columns["attempts"], columns["time_taken"] / 100, columns["difficulty"], version)
+    return columns, -scores
+
+
+def histogram_chunk(unit):
+    path, offsets, start, end, version = unit
+    _, keys = _chunk_keys(path, offsets, start, end, version)
+    return np.unique(keys, return_counts=True)
+
+
+def scatter_chunk(unit):
+    path, target, offsets, count, start, end, version, key_values, key_starts = unit
+    columns, keys = _chunk_keys(path, offsets, start, end, version)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    # Rows of one key land next to each other, from that key's start for this chunk.
+    group = np.searchsorted(key_values, sorted_keys)
+    first_in_group = np.searchsorted(sorted_keys, sorted_keys, side="left")
+    destination = key_starts[group] + (np.arange(len(order)) - first_in_group)
+
+    output = _columns(target, offsets, 0, count, "r+")
+    output["score"][destination] = -sorted_keys
+    for column in ("attempts", "time_taken", "name_id", "difficulty"):
+        output[column][destination] = columns[column][order]
+    for column in output.values():
+        column.flush()
+    return end - start
+
+
+def rescore_columnar(path, version=None, workers=None, chunk=CHUNK):
+    with ColumnarSnapshot(path) as snapshot:
+        count, name_count = snapshot.count, snapshot.name_count
+    if count == 0:
+        return 0
+    offsets = _layout(count, name_count)
+    bounds = [(start, min(start + chunk, count)) for start in range(0, count, chunk)]
+
+    target = path + ".rescore.tmp"
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        histograms = list(executor.map(histogram_chunk, [(path, offsets, start, end, version) for start, end in bounds]))
+
+        key_values = np.unique(np.concatenate([values for values, _ in histograms]))
+        totals = np.zeros(len(key_values), dtype=np.int64)
+        positions = []
+        for values, counts in histograms:
+            positions.append((values, counts, np.searchsorted(key_values, values)))
+            np.add.at(totals, positions[-1][2], counts)
+        next_start = np.concatenate(([0], np.cumsum(totals)[:-1]))
+        units = []
+        for (start, end), (values, counts, index) in zip(bounds, positions):
+            key_starts = np.zeros(len(key_values), dtype=np.int64)
+            key_starts[index] = next_start[index]
+            next_start[index] += counts
+            units.append((path, target, offsets, count, start, end, version, key_values, key_starts))
+
+        # Header and names are unchanged; the columns are filled in below.
+        shutil.copyfile(path, target)
+        try:
+            for _ in executor.map(scatter_chunk, units):
+                pass
+            with open(target, "rb+") as f:
+                os.fsync(f.fileno())
+        except BaseException:
+            os.remove(target)
+            raise
+    os.replace(target, path)
+    return count
+
+
+def rescore_json(path, version=None):
+    # A JSON snapshot can only be read whole, so this one is not streamed.
+    try:
+        with open(path, "r") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return 0
+    if entries:
+        attempts = np.array([entry["attempts"] for entry in entries])
+        time_taken = np.array([entry["time_taken"] for entry in entries], dtype=np.float64)
+        codes = np.array([DIFFICULTY_CODES[entry["difficulty"]] for entry in entries])
+        scores = new_scores(attempts, time_taken, codes, version)
+        for entry, score in zip(entries, scores.tolist()):
+            entry["score"] = score
+        entries = [entries[i] for i in np.argsort(-scores, kind="stable")]
+    atomic_write(path, json.dumps(entries, indent=4), fsync=True)
+    return len(entries)
+
+
+def rescore_log(path, version=None):
+    # Wins appended since the last compaction; never more than COMPACT_EVERY.
+    lines = []
+    try:
+        with open(path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entry["score"] = calculate_score(entry["attempts"], entry["time_taken"], entry["difficulty"], version)
+                lines.append(json.dumps(entry) + "\n")
+    except FileNotFoundError:
+        return 0
+    atomic_write(path, "".join(lines), fsync=True)
+    return len(lines)
+
+
+def rescore_sqlite(path, version=None, chunk=CHUNK):
+    # One transaction: other connections keep seeing the old scores until the
+    # commit. The score indexes and the score_counts triggers are dropped
+    # first and rebuilt once at the end, which is much cheaper than updating
+    # them row by row.
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            indexes = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'leaderboard' "
+                                   "AND sql LIKE '%score%'").fetchall()
+            triggers = conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'leaderboard'").fetchall()
+            for name, _ in indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+            for name, _ in triggers:
+                conn.execute(f'DROP TRIGGER "{name}"')
+            last_id = 0
+            total = 0
+            while True:
+                rows = conn.execute("SELECT id, attempts, time_taken, difficulty FROM leaderboard WHERE id > ? ORDER BY id LIMIT ?",
+                                    (last_id, chunk)).fetchall()
+                if not rows:
+                    break
+                ids, attempts, time_taken, difficulty = zip(*rows)
+                codes = np.array([DIFFICULTY_CODES[d] for d in difficulty])
+                scores = new_scores(np.array(attempts), np.array(time_taken, dtype=np.float64), codes, version)
+                conn.executemany("UPDATE leaderboard SET score = ? WHERE id = ?", zip(scores.tolist(), ids))
+                last_id = ids[-1]
+                total += len(rows)
+            for _, sql in indexes:
+                conn.execute(sql)
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'score_counts'").fetchone():
+                conn.execute("DELETE FROM score_counts")
+                conn.execute("INSERT INTO score_counts SELECT difficulty, score, COUNT(*) FROM leaderboard GROUP BY difficulty, score")
+            for _, sql in triggers:
+                conn.execute(sql)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return total
+
+
+def rescore(path, version=None, workers=None, chunk=CHUNK):
+    # Run while no game is writing to the leaderboard.
+    scoring_formula(version)
+    if path.endswith(SQLITE_SUFFIXES):
+        return rescore_sqlite(path, version, chunk)
+    # A compaction cut short by a crash is finished first.
+    AppendLogLeaderboard(path)._recover_compaction()
+    if not os.path.exists(path):
+        count = 0
+    elif path.endswith(SNAPSHOT_SUFFIX):
+        count = rescore_columnar(path, version, workers, chunk)
+    else:
+        count = rescore_json(path, version)
+    count += rescore_log(path + ".log", version)
+    # The rank index is rebuilt from the rescored files on next open.
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + INDEX_SUFFIX + suffix)
+        except FileNotFoundError:
+            pass
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute every stored leaderboard score with a scoring version.")
+    parser.add_argument("leaderboard", help="Leaderboard file: .txt (JSON), .nglb or .db")
+    parser.add_argument("--version", type=int, default=CURRENT_VERSION, help=f"Scoring version (default {CURRENT_VERSION}).")
+    parser.add_argument("--workers", type=int, help="Worker processes for .nglb snapshots (default: all cores).")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="Rows per chunk.")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = rescore(args.leaderboard, args.version, args.workers, args.chunk)
+    print(f"Rescored {count} entries with scoring version {args.version} in {time.perf_counter() - started:.1f} s.")
+
+
+if __name__ == "__main__":
+    main()
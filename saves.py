@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import re
+import time
+
+from metrics import METRICS
+from persistence import atomic_write
+
+SAVE_DIR = "saves"
+DEFAULT_SLOT = "default"
+INDEX_FILE = "index.json"
+SLOT_NAME = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class PlayerFileStore:
+    # JSON files per player under `root`, sharded by a hash of the name so no
+    # directory grows past a few hundred entries. Paths follow from the name
+    # alone, and every file is replaced atomically (through the write-behind
+    # writer when one is given).
+    def __init__(self, root, writer=None):
+        self.root = root
+        self.writer = writer
+        self._made_dirs = set()
+
+    def player_dir(self, name):
+        digest = hashlib.sha256(name.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest[2:16])
+
+    def _read(self, path):
+        data = self.writer.pending_data(path) if self.writer is not None else None
+        try:
+            if data is None:
+                with open(path, "r") as f:
+                    data = f.read()
+                METRICS.count("file_read_bytes", len(data))
+            return json.loads(data)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write(self, path, value):
+        directory = os.path.dirname(path)
+        if directory not in self._made_dirs:
+            if self.writer is not None:
+                # The writer runs calls ahead of the file writes batched with them.
+                self.writer.submit(os.makedirs, directory, 0o777, True)
+            else:
+                os.makedirs(directory, exist_ok=True)
+            self._made_dirs.add(directory)
+        data = json.dumps(value)
+        if self.writer is not None:
+            self.writer.write_file(path, data)
+        else:
+            atomic_write(path, data, fsync=True)
+
+
+class SaveStore(PlayerFileStore):
+    # Saved rounds keyed by (player, slot):
+    #   saves/<2 hex>/<14 hex>/index.json   slot -> {"saved_at", "difficulty"}
+    #   saves/<2 hex>/<14 hex>/<slot>.json  the saved state
+    # Saving or resuming touches only that player's index and one slot file
+    # however many saves exist. The slot is written before the index that
+    # points at it.
+    def __init__(self, root=SAVE_DIR, writer=None):
+        super().__init__(root, writer)
+
+    def slot_path(self, name, slot):
+        if not SLOT_NAME.match(slot):
+            raise ValueError(f"Invalid save slot name: {slot!r}")
+        return os.path.join(self.player_dir(name), f"{slot}.json")
+
+    def slots(self, name):
+        return self._read(os.path.join(self.player_dir(name), INDEX_FILE)) or {}
+
+    def save(self, name, slot, state):
+        path = self.slot_path(name, slot)
+        saved_at = time.time()
+        state = dict(state, name=name, slot=slot, saved_at=saved_at)
+        index = self.slots(name)
+        index[slot] = {"saved_at": saved_at, "difficulty": state.get("difficulty")}
+        self._write(path, state)
+        self._write(os.path.join(self.player_dir(name), INDEX_FILE), index)
+
+    def load(self, name, slot=None):
+        # With no slot, resumes the player's most recently saved one.
+        index = self.slots(name)
+        if slot is None:
+            if not index:
+                return None
+            slot = max(index, key=lambda s: index[s]["saved_at"])
+        elif slot not in index:
+            return None
+        return self._read(self.slot_path(name, slot))
+
+    def delete(self, name, slot):
+        index = self.slots(name)
+        if index.pop(slot, None) is None:
+            return False
+        self._write(os.path.join(self.player_dir(name), INDEX_FILE), index)
+        # The index no longer points at the slot, so the file can go lazily,
+        # but only after any write of it still queued.
+        path = self.slot_path(name, slot)
+        if self.writer is not None:
+            self.writer.submit_durable(_remove, path)
+        else:
+            _remove(path)
+        return True
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,38 @@
+DIFFICULTY_MULTIPLIER = {"easy": 1, "medium": 1.5, "hard": 2}
+
+# Scoring formulas by version. Each takes attempts, time taken and the
+# difficulty multiplier and must work on plain numbers and on NumPy arrays
+# alike, so the game, the simulator and rescore.py agree on every score.
+# To change scoring, register a new version, point CURRENT_VERSION at it and
+# run `python rescore.py <leaderboard>` to bring stored scores in line.
+SCORING = {}
+
+
+def scoring_version(version):
+    def register(formula):
+        if version in SCORING:
+            raise ValueError(f"Scoring version {version} is already registered")
+        SCORING[version] = formula
+        return formula
+    return register
+
+
+@scoring_version(1)
+def score_v1(attempts, time_taken, multiplier):
+    return (100 - attempts * 5) * multiplier / (time_taken + 1)
+
+
+CURRENT_VERSION = 1
+
+
+def scoring_formula(version=None):
+    version = CURRENT_VERSION if version is None else version
+    try:
+        return SCORING[version]
+    except KeyError:
+        raise ValueError(f"Unknown scoring version {version}; known: {sorted(SCORING)}") from None
+
+
+def calculate_score(attempts, time_taken, difficulty, version=None):
+    # int() truncates toward zero, as the game always has.
+    return int(scoring_formula(version)(attempts, time_taken, DIFFICULTY_MULTIPLIER[difficulty]))
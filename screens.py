@@ -0,0 +1,57 @@
+from metrics import timer
+
+SCREEN_PLACE = {"relx": 0.5, "rely": 0.5, "anchor": "center", "relwidth": 0.9, "relheight": 0.9}
+
+
+class ScreenManager:
+    # Builds each screen the first time it is shown and keeps the frame.
+    # Navigating hides the current frame and brings back the cached one; the
+    # screen's refresh callback rebinds it to fresh state before it appears.
+    # With cache=False every screen is rebuilt on each visit instead, which is
+    # what navigation used to cost (kept for benchmarks/bench_navigation.py).
+    def __init__(self, root, transition=None, cache=True):
+        self.root = root
+        self.transition = transition
+        self.cache = cache
+        self.screens = {}
+        self.frames = {}
+        self.current = None
+
+    def register(self, name, build, refresh=None):
+        self.screens[name] = (build, refresh)
+
+    def frame(self, name):
+        frame = self.frames.get(name)
+        if frame is None or not frame.winfo_exists():
+            build, _ = self.screens[name]
+            with timer(f"build_{name}_screen"):
+                frame = build()
+            self.frames[name] = frame
+        return frame
+
+    def show(self, name, animate=True):
+        with timer("show_screen"):
+            return self._show(name, animate)
+
+    def _show(self, name, animate):
+        previous = self.current
+        frame = self.frame(name)
+        _, refresh = self.screens[name]
+        if refresh is not None:
+            refresh()
+        if previous == name:
+            return frame
+
+        old = self.frames.get(previous)
+        if old is not None and old.winfo_exists():
+            if self.cache:
+                old.place_forget()
+            else:
+                old.destroy()
+                del self.frames[previous]
+        self.current = name
+        if animate and self.transition is not None:
+            self.transition(frame)
+        else:
+            frame.place(**SCREEN_PLACE)
+        return frame
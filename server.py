@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import signal
+import time
+
+from engine import LOW
+from main import NumberGuessingGame
+
+IDLE_TIMEOUT = 300.0
+HIGH_WATER = 64 * 1024
+MAX_LINE = 1024
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Line protocol, one command per line, one reply line per command:
+#   NEW <difficulty> [name]  -> OK <min> <max> <attempts>
+#   GUESS <number>           -> LOW <attempts left> [hint] | HIGH <attempts left> [hint]
+#                               | WIN <score> <attempts> | LOSE <secret>
+#   TOP [n]                  -> TOP name:score:difficulty ...
+#   QUIT                     -> BYE
+# Anything else gets ERR <reason>.
+
+
+class Session:
+    __slots__ = ("name", "round", "profile", "last_active", "writer")
+
+    def __init__(self, writer, now):
+        self.name = "anonymous"
+        self.round = None
+        self.profile = None
+        self.last_active = now
+        self.writer = writer
+
+
+class GameServer:
+    # Runs the NumberGuessingGame rules for many concurrent players. Every
+    # connection is a slotted Session holding its GameRound; all sessions
+    # share one game, so wins go through the single write-behind leaderboard
+    # writer. A sweeper closes sessions that have been idle too long.
+    def __init__(self, game, idle_timeout=IDLE_TIMEOUT):
+        self.game = game
+        self.idle_timeout = idle_timeout
+        self.sessions = set()
+        self.guesses = 0
+        self._server = None
+        self._sweeper = None
+
+    async def start(self, host="127.0.0.1", port=7777, unix_path=None):
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self.handle, unix_path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE, backlog=4096)
+        self._sweeper = asyncio.create_task(self.sweep())
+        return self._server
+
+    async def close(self):
+        self._sweeper.cancel()
+        self._server.close()
+        for session in list(self.sessions):
+            session.writer.close()
+        await self._server.wait_closed()
+
+    async def sweep(self):
+        interval = max(1.0, self.idle_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            cutoff = time.monotonic() - self.idle_timeout
+            for session in [s for s in self.sessions if s.last_active < cutoff]:
+                session.writer.write(b"BYE idle\n")
+                session.writer.close()
+                self.sessions.discard(session)
+
+    async def handle(self, reader, writer):
+        session = Session(writer, time.monotonic())
+        self.sessions.add(session)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_LINE; the rest of the stream is unusable.
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                session.last_active = time.monotonic()
+                words = line.decode("utf-8", "replace").split(None, 2)
+                player = self.player_name(words)
+                if player and not self.game.profiles.cached(player):
+                    # Profile files are read off the event loop.
+                    profile = await asyncio.get_running_loop().run_in_executor(None, self.game.profiles.load, player)
+                    self.game.profiles.put(profile)
+                reply = self.dispatch(session, words)
+                if reply is None:
+                    writer.write(b"BYE\n")
+                    break
+                writer.write(reply.encode() + b"\n")
+                if writer.transport.get_write_buffer_size() > HIGH_WATER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+    def player_name(self, words):
+        # The player a NEW command names, if any.
+        if len(words) > 2 and words[0].upper() == "NEW":
+            return words[2].strip()[:32] or None
+        return None
+
+    def dispatch(self, session, words):
+        if not words:
+            return "ERR empty command"
+        command = words[0].upper()
+        if command == "GUESS":
+            return self.guess(session, words)
+        if command == "NEW":
+            if len(words) < 2 or words[1].lower() not in DIFFICULTIES:
+                return "ERR usage: NEW easy|medium|hard [name]"
+            player = self.player_name(words)
+            if player:
+                session.name = player
+                # Loaded by handle(), so this is a cache hit.
+                session.profile = self.game.profiles.get(player)
+            # Named players play on their own profile's ranges.
+            game_round = self.game.play_round(words[1].lower(), player)
+            session.round = game_round
+            return f"OK {game_round.min_range} {game_round.max_range} {game_round.attempts_limit}"
+        if command == "TOP":
+            n = int(words[1]) if len(words) > 1 and words[1].isdigit() else 5
+            return "TOP " + " ".join(f"{e['name'].replace(' ', '_')}:{e['score']}:{e['difficulty']}" for e in self.game.leaderboard.top(min(n, 50)))
+        if command == "QUIT":
+            return None
+        return f"ERR unknown command {command}"
+
+    def guess(self, session, words):
+        game_round = session.round
+        if game_round is None or game_round.finished:
+            return "ERR no round in progress, send NEW first"
+        try:
+            number = int(words[1])
+        except (IndexError, ValueError):
+            return "ERR usage: GUESS <number>"
+        self.guesses += 1
+        outcome = game_round.guess(number)
+        if outcome.finished and game_round.player:
+            # Put back in case the cache dropped it during the round, so
+            # recording never reads the profile file on the event loop.
+            self.game.profiles.put(session.profile)
+            self.game.profiles.record(game_round.player, game_round)
+        if outcome.won:
+            # Not finish_round: for anonymous rounds it would move the shared
+            # ranges of every connected player at once.
+            self.game.update_leaderboard(session.name, outcome.score, game_round.attempts, outcome.time_taken, game_round.difficulty)
+            return f"WIN {outcome.score} {game_round.attempts}"
+        if outcome.finished:
+            return f"LOSE {game_round.secret_number}"
+        result = "LOW" if outcome.result == LOW else "HIGH"
+        return f"{result} {outcome.attempts_left} {outcome.hint}".rstrip()
+
+
+async def serve(args):
+    game = NumberGuessingGame(args.leaderboard, args.events)
+    game.profiles.cache_size = args.profile_cache
+    server = GameServer(game, args.idle_timeout)
+    stopped = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set)
+    try:
+        await server.start(args.host, args.port, args.unix)
+        where = args.unix or f"{args.host}:{args.port}"
+        print(f"Serving on {where}", flush=True)
+        await stopped.wait()
+    finally:
+        await server.close()
+        game.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Line-protocol game server for many concurrent players.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP.")
+    parser.add_argument("--leaderboard", default="leaderboard.txt")
+    parser.add_argument("--events", default="events.log", help="Guess event log (empty to disable).")
+    parser.add_argument("--profile-cache", type=int, default=10_000, help="Player profiles kept in memory.")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT, help="Seconds before an idle session is closed.")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
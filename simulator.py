@@ -0,0 +1,166 @@
+import argparse
+import time
+
+import numpy as np
+
+from main import ATTEMPTS_LIMITS, HINT_ATTEMPTS_LEFT
+from profiles import DEFAULT_RANGES, adjusted_range
+from scoring import DIFFICULTY_MULTIPLIER, scoring_formula
+
+DIFFICULTIES = ("easy", "medium", "hard")
+CHUNK = 1_000_000
+UNKNOWN = -1
+
+
+class BisectionPlayer:
+    name = "bisection"
+
+    def guess(self, lo, hi, parity, rng):
+        return (lo + hi) // 2
+
+
+class ParityAwarePlayer:
+    # Bisects, but once the parity hint is shown only guesses numbers that
+    # match it.
+    name = "parity-aware"
+
+    def guess(self, lo, hi, parity, rng):
+        mid = (lo + hi) // 2
+        wrong = (parity != UNKNOWN) & (mid % 2 != parity)
+        return np.where(wrong & (mid + 1 <= hi), mid + 1, np.where(wrong, mid - 1, mid))
+
+
+class NoisyPlayer:
+    # Aims for the middle of what it knows, with a normally distributed miss
+    # of `noise` times the remaining range, and ignores hints.
+    name = "noisy"
+
+    def __init__(self, noise=0.2):
+        self.noise = noise
+
+    def guess(self, lo, hi, parity, rng):
+        spread = (hi - lo) * self.noise
+        guess = np.rint((lo + hi) / 2 + rng.standard_normal(lo.shape) * spread).astype(np.int64)
+        return np.clip(guess, lo, hi)
+
+
+PLAYERS = {"bisection": BisectionPlayer, "parity-aware": ParityAwarePlayer, "noisy": NoisyPlayer}
+
+
+def range_rule(difficulty):
+    # Measures adjusted_range, so the drift simulation follows whatever rule
+    # the game currently uses.
+    base = DEFAULT_RANGES[difficulty]
+    grown = adjusted_range(difficulty, base, True)
+    shrunk = adjusted_range(difficulty, grown, False)
+    floor = adjusted_range(difficulty, shrunk, False)
+    return grown[1] - base[1], grown[1] - shrunk[1], floor[1]
+
+
+def play_batch(player, lo, hi, attempts_limit, threshold, rng, seconds_per_guess=3.0):
+    # Plays len(lo) independent rounds at once. lo/hi are per-round ranges.
+    secret = lo + (rng.random(lo.shape) * (hi - lo + 1)).astype(np.int64)
+    lo = lo.copy()
+    hi = hi.copy()
+    parity = np.full(lo.shape, UNKNOWN, dtype=np.int64)
+    attempts = np.zeros(lo.shape, dtype=np.int64)
+    done = np.zeros(lo.shape, dtype=bool)
+    won = np.zeros(lo.shape, dtype=bool)
+
+    for _ in range(attempts_limit):
+        active = ~done
+        if not active.any():
+            break
+        guess = player.guess(lo, hi, parity, rng)
+        attempts += active
+        correct = active & (guess == secret)
+        won |= correct
+        done |= correct
+        missed = active & ~correct
+        lo = np.where(missed & (guess < secret), np.maximum(lo, guess + 1), lo)
+        hi = np.where(missed & (guess > secret), np.minimum(hi, guess - 1), hi)
+        reveal = missed & (attempts_limit - attempts <= threshold)
+        parity = np.where(reveal, secret % 2, parity)
+
+    time_taken = rng.exponential(seconds_per_guess, lo.shape) * attempts
+    return won, attempts, time_taken
+
+
+def scores(attempts, time_taken, difficulty):
+    # calculate_score over whole arrays; int() truncates toward zero.
+    return np.trunc(scoring_formula()(attempts, time_taken, DIFFICULTY_MULTIPLIER[difficulty])).astype(np.int64)
+
+
+def simulate(difficulty, player, rounds, rng, chunk=CHUNK):
+    (min_range, max_range), attempts_limit = DEFAULT_RANGES[difficulty], ATTEMPTS_LIMITS[difficulty]
+    threshold = HINT_ATTEMPTS_LEFT
+    wins = 0
+    attempts_total = 0
+    score_parts = []
+    for start in range(0, rounds, chunk):
+        n = min(chunk, rounds - start)
+        lo = np.full(n, min_range, dtype=np.int64)
+        hi = np.full(n, max_range, dtype=np.int64)
+        won, attempts, time_taken = play_batch(player, lo, hi, attempts_limit, threshold, rng)
+        wins += int(won.sum())
+        attempts_total += int(attempts.sum())
+        score_parts.append(scores(attempts[won], time_taken[won], difficulty))
+    won_scores = np.concatenate(score_parts)
+    percentiles = np.percentile(won_scores, [10, 50, 90]) if won_scores.size else [0, 0, 0]
+    return {
+        "difficulty": difficulty,
+        "player": player.name,
+        "rounds": rounds,
+        "win_rate": wins / rounds,
+        "mean_attempts": attempts_total / rounds,
+        "score_p10": float(percentiles[0]),
+        "score_p50": float(percentiles[1]),
+        "score_p90": float(percentiles[2]),
+    }
+
+
+def simulate_drift(difficulty, player, players, rounds, rng):
+    # Every simulated player keeps their own range and plays `rounds` games in
+    # a row; adjusted_range is applied after each one.
+    (min_range, max_range), attempts_limit = DEFAULT_RANGES[difficulty], ATTEMPTS_LIMITS[difficulty]
+    step_up, step_down, floor = range_rule(difficulty)
+    threshold = HINT_ATTEMPTS_LEFT
+    lo = np.full(players, min_range, dtype=np.int64)
+    hi = np.full(players, max_range, dtype=np.int64)
+    mean_range = []
+    for _ in range(rounds):
+        won, _, _ = play_batch(player, lo, hi, attempts_limit, threshold, rng)
+        hi = np.where(won, hi + step_up, np.maximum(floor, hi - step_down))
+        mean_range.append(float(hi.mean()))
+    return {
+        "difficulty": difficulty,
+        "player": player.name,
+        "mean_range_by_round": mean_range,
+        "final_range_p50": float(np.median(hi)),
+        "final_range_p90": float(np.percentile(hi, 90)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo simulation of difficulty settings.")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="Rounds per difficulty and player model.")
+    parser.add_argument("--drift-players", type=int, default=10_000)
+    parser.add_argument("--drift-rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    started = time.perf_counter()
+    print(f"{'Difficulty':<10} | {'Player':<12} | {'Win rate':>8} | {'Attempts':>8} | {'Score p10/p50/p90':>17} | {'Range after drift':>17}")
+    for difficulty in DIFFICULTIES:
+        for player_class in PLAYERS.values():
+            player = player_class()
+            result = simulate(difficulty, player, args.rounds, rng)
+            drift = simulate_drift(difficulty, player, args.drift_players, args.drift_rounds, rng)
+            score_range = f"{result['score_p10']:.0f}/{result['score_p50']:.0f}/{result['score_p90']:.0f}"
+            print(f"{difficulty:<10} | {player.name:<12} | {result['win_rate']:>8.1%} | {result['mean_attempts']:>8.2f} | {score_range:>17} | {drift['final_range_p50']:>17.0f}")
+    print(f"Finished in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import importlib
+
+
+class Strategy:
+    # A guessing strategy sees only the range still consistent with the
+    # Higher/Lower answers so far and must return a guess inside it.
+    name = "strategy"
+
+    def guess(self, lo, hi, rng):
+        raise NotImplementedError
+
+
+class BisectionStrategy(Strategy):
+    name = "bisection"
+
+    def guess(self, lo, hi, rng):
+        return (lo + hi) // 2
+
+
+class RandomStrategy(Strategy):
+    name = "random"
+
+    def guess(self, lo, hi, rng):
+        return rng.randint(lo, hi)
+
+
+class ThirdsStrategy(Strategy):
+    name = "thirds"
+
+    def guess(self, lo, hi, rng):
+        return lo + (hi - lo) // 3
+
+
+class LinearStrategy(Strategy):
+    name = "linear"
+
+    def guess(self, lo, hi, rng):
+        return lo
+
+
+STRATEGIES = {cls.name: cls for cls in (BisectionStrategy, RandomStrategy, ThirdsStrategy, LinearStrategy)}
+
+
+def load_strategy(spec):
+    # Either a built-in name or "package.module:ClassName" for plugins.
+    if spec in STRATEGIES:
+        return STRATEGIES[spec]
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Unknown strategy {spec!r}; use one of {', '.join(STRATEGIES)} or module:Class")
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,48 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from leaderboard_snapshot import DIFFICULTIES
+from leaderboard_store import AppendLogLeaderboard, SQLiteLeaderboard
+
+
+def make_entries(n, seed=0, scores=30):
+    # Few distinct scores, names and attempts, so every order has ties.
+    rng = random.Random(seed)
+    return [{
+        "name": f"player{rng.randrange(20)}",
+        "score": rng.randrange(scores),
+        "attempts": rng.randint(1, 10),
+        "time_taken": rng.randrange(3000) / 100,
+        "difficulty": rng.choice(DIFFICULTIES),
+    } for _ in range(n)]
+
+
+def expected_order(entries, difficulty=None, sort="score", descending=True):
+    # The order every store promises: ties in score go oldest first when
+    # descending, ties in other columns newest first when descending.
+    rows = [(i, entry) for i, entry in enumerate(entries) if difficulty is None or entry["difficulty"] == difficulty]
+    if sort == "score":
+        rows.sort(key=lambda row: (-row[1]["score"], row[0]), reverse=not descending)
+    else:
+        rows.sort(key=lambda row: (row[1][sort], row[0]), reverse=descending)
+    return [entry for _, entry in rows]
+
+
+def fill(path, entries, compact_every=150):
+    if path.endswith(".db"):
+        store = SQLiteLeaderboard(path)
+    else:
+        store = AppendLogLeaderboard(path, compact_every=compact_every)
+    for i in range(0, len(entries), 50):
+        store.add_many(entries[i:i + 50])
+    return store
+
+
+@pytest.fixture
+def entries():
+    return make_entries(400)
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from ai_solver import HIGHER, LOWER, LyingSearchSolver
+
+
+def is_candidate(solver, number):
+    return any(start <= number <= end for start, end, _ in solver.segments)
+
+
+def play(solver, secret, lie_at=()):
+    # Answers truthfully except on the questions in lie_at; returns how many
+    # guesses it took to name the secret. Lies within the budget must never
+    # rule the secret out.
+    for question in range(1, 200):
+        guess = solver.next_guess()
+        if guess == secret and question not in lie_at:
+            return question
+        feedback = HIGHER if secret > guess else LOWER
+        if question in lie_at:
+            feedback = LOWER if feedback == HIGHER else HIGHER
+        solver.answer(feedback)
+        assert is_candidate(solver, secret)
+    raise AssertionError("no answer")
+
+
+@pytest.mark.parametrize("secret", [1, 37, 64, 100])
+def test_honest_answers_take_a_binary_search(secret):
+    assert play(LyingSearchSolver(1, 100), secret) <= 7
+
+
+def test_64_bit_ranges():
+    rng = random.Random(1)
+    for _ in range(20):
+        secret = rng.randrange(2 ** 64)
+        assert play(LyingSearchSolver(0, 2 ** 64 - 1), secret) <= 65
+
+
+@pytest.mark.parametrize("lies", [1, 2])
+def test_finds_the_number_despite_lies(lies):
+    rng = random.Random(lies)
+    for _ in range(50):
+        secret = rng.randint(1, 1000)
+        solver = LyingSearchSolver(1, 1000, lies)
+        assert play(solver, secret, lie_at=set(rng.sample(range(1, 15), lies))) <= 40
+
+
+def test_candidates_drop_once_they_need_too_many_lies():
+    solver = LyingSearchSolver(1, 10, lies=1)
+    solver.answer(HIGHER, 5)
+    assert solver.segments == [[1, 5, 1], [6, 10, 0]]
+    solver.answer(HIGHER, 5)
+    assert solver.segments == [[6, 10, 0]]
+    assert solver.candidate_count() == 5
+    solver.answer(LOWER, 6)
+    solver.answer(LOWER, 6)
+    assert solver.exhausted
+    with pytest.raises(RuntimeError):
+        solver.next_guess()
+
+
+def test_bad_input():
+    with pytest.raises(ValueError):
+        LyingSearchSolver(5, 4)
+    with pytest.raises(ValueError):
+        LyingSearchSolver(1, 10).answer("sideways", 5)
@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+import pytest
+
+from analytics import OptimalPlayCache, hint_threshold, optimal_play
+from hints import CandidateSet, HintEngine
+from main import HINT_ATTEMPTS_LEFT, NumberGuessingGame
+
+REVEAL_AT = 3
+
+
+def best_play_wins(size, attempts_limit):
+    # Exhaustive best play against the real hint engine over 1..size, with
+    # guesses among the candidates. `known` is what the player knows, and
+    # `secrets` the secrets that lead to it.
+    def after_hint(known, secret):
+        candidates = CandidateSet(1, size)
+        candidates.bits = known
+        HintEngine(candidates).best_hint(secret)
+        return candidates.bits
+
+    @lru_cache(maxsize=None)
+    def wins(known, secrets, attempts_left):
+        best = 0
+        for guess in range(1, size + 1):
+            bit = 1 << (guess - 1)
+            if not known & bit:
+                continue
+            found = 1 if secrets & bit else 0
+            if attempts_left > 1:
+                below, above = known & (bit - 1), known & ~(bit | (bit - 1))
+                groups = {}
+                for secret in range(1, size + 1):
+                    secret_bit = 1 << (secret - 1)
+                    if secret == guess or not secrets & secret_bit:
+                        continue
+                    after = below if secret < guess else above
+                    if attempts_left - 1 <= REVEAL_AT:
+                        after = after_hint(after, secret)
+                    groups[after] = groups.get(after, 0) | secret_bit
+                found += sum(wins(after, group, attempts_left - 1) for after, group in groups.items())
+            best = max(best, found)
+        return best
+
+    everything = (1 << size) - 1
+    return wins(everything, everything, attempts_limit)
+
+
+def test_hints_that_would_name_the_number_are_not_counted():
+    # After a miss on 1..5 with one attempt left, two candidates remain and
+    # the engine gives no hint, so only one of each pair can be found.
+    assert optimal_play(5, 2, REVEAL_AT)[0] == pytest.approx(3 / 5)
+
+
+@pytest.mark.parametrize("size", range(1, 11))
+@pytest.mark.parametrize("attempts_limit", [1, 2, 3, 4])
+def test_is_a_lower_bound_on_best_play(size, attempts_limit):
+    win_probability, _ = optimal_play(size, attempts_limit, REVEAL_AT)
+    assert round(win_probability * size) <= best_play_wins(size, attempts_limit)
+
+
+@pytest.mark.parametrize("size", [1, 7, 8, 50, 200])
+@pytest.mark.parametrize("attempts_limit", [1, 3, 5])
+def test_without_hints_best_play_is_binary_search(size, attempts_limit):
+    win_probability, _ = optimal_play(size, attempts_limit, 0)
+    assert win_probability * size == pytest.approx(min(size, 2 ** attempts_limit - 1))
+
+
+def test_hint_threshold_follows_the_game(tmp_path):
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    try:
+        assert hint_threshold(game) == HINT_ATTEMPTS_LEFT
+    finally:
+        game.close()
+
+
+def test_cache_answers_from_its_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "optimal_play.json")
+    expected = OptimalPlayCache(path).get(100, 7, REVEAL_AT)
+    assert expected == optimal_play(100, 7, REVEAL_AT)
+    # A second cache must answer from the file without solving again.
+    monkeypatch.setattr("analytics.optimal_play", None)
+    assert OptimalPlayCache(path).get(100, 7, REVEAL_AT) == expected
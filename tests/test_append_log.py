@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from leaderboard_store import AppendLogLeaderboard, open_leaderboard_store
+
+from conftest import expected_order, fill
+
+
+@pytest.mark.parametrize("fmt", ["txt", "nglb"])
+def test_wins_go_to_the_log_until_compaction(tmp_path, entries, fmt):
+    path = str(tmp_path / f"board.{fmt}")
+    store = fill(path, entries[:100], compact_every=150)
+    try:
+        assert not os.path.exists(path)
+        with open(path + ".log") as f:
+            assert [json.loads(line) for line in f] == entries[:100]
+        store.add_many(entries[100:150])
+        # The 150th win folds the log into the snapshot.
+        assert not os.path.exists(path + ".log")
+        assert list(store._iter_snapshot()) == expected_order(entries[:150])
+        assert store.count() == 150
+    finally:
+        store.close()
+
+
+def test_top_keeps_only_top_k_per_difficulty(tmp_path, entries):
+    store = AppendLogLeaderboard(str(tmp_path / "board.txt"), top_k=10)
+    try:
+        store.add_many(entries)
+        assert all(len(items) <= 10 for items in store._top.values())
+        for difficulty in (None, "easy", "hard"):
+            assert store.top(10, difficulty) == expected_order(entries, difficulty)[:10]
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("fmt", ["txt", "nglb"])
+def test_index_catches_up_after_reopen(tmp_path, entries, fmt):
+    path = str(tmp_path / f"board.{fmt}")
+    fill(path, entries[:300]).close()
+    # Wins appended by a store that never opened the index.
+    with open(path + ".log", "a") as f:
+        for entry in entries[300:]:
+            f.write(json.dumps(entry) + "\n")
+    store = open_leaderboard_store(path)
+    try:
+        assert store.count() == len(entries)
+        assert store.page(0, 20) == expected_order(entries)[:20]
+    finally:
+        store.close()
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.mark.parametrize("fmt", ["txt", "nglb"])
+@pytest.mark.parametrize("step", ["_merge", "_finish_compaction"])
+def test_compaction_cut_short_counts_every_win_once(tmp_path, entries, fmt, step, monkeypatch):
+    path = str(tmp_path / f"board.{fmt}")
+    store = fill(path, entries[:300], compact_every=1000)
+    store.count()
+    # Crash before the snapshot is replaced, or just after.
+    def crash(*args):
+        raise Crash()
+    monkeypatch.setattr(AppendLogLeaderboard, step, crash)
+    with pytest.raises(Crash):
+        store.compact()
+    store.close()
+    monkeypatch.undo()
+
+    store = open_leaderboard_store(path)
+    try:
+        assert store.count() == 300
+        assert store.page(0, 20) == expected_order(entries[:300])[:20]
+        assert sorted(e["score"] for e in store.iter_entries()) == sorted(e["score"] for e in entries[:300])
+        store.add_many(entries[300:])
+        assert store.count() == len(entries)
+    finally:
+        store.close()
+    assert sorted(p.name for p in tmp_path.iterdir() if "compacting" in p.name) == []
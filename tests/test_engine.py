@@ -0,0 +1,79 @@
+import io
+import random
+import subprocess
+import sys
+
+import pytest
+
+from engine import CORRECT, HIGH, LOW, GameRound
+from hints import MIN_REMAINING
+from main import ATTEMPTS_LIMITS, HINT_ATTEMPTS_LEFT, NumberGuessingGame, run_terminal
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    yield game
+    game.close()
+
+
+def test_a_won_round(game):
+    game_round = GameRound(game, "easy", secret_number=30)
+    assert (game_round.min_range, game_round.max_range, game_round.attempts_limit) == (1, 50, ATTEMPTS_LIMITS["easy"])
+    low = game_round.guess(10)
+    assert (low.result, low.finished, low.remaining) == (LOW, False, 40)
+    high = game_round.guess(40)
+    assert (high.result, high.attempts_left, high.remaining) == (HIGH, ATTEMPTS_LIMITS["easy"] - 2, 29)
+    won = game_round.guess(30)
+    assert (won.result, won.finished, won.won) == (CORRECT, True, True)
+    assert won.score == game.calculate_score(3, won.time_taken, "easy")
+    with pytest.raises(RuntimeError):
+        game_round.guess(30)
+
+
+def test_a_lost_round_ends_at_the_attempts_limit(game):
+    game_round = GameRound(game, "hard", secret_number=199)
+    for _ in range(ATTEMPTS_LIMITS["hard"] - 1):
+        assert not game_round.guess(1).finished
+    outcome = game_round.guess(1)
+    assert (outcome.finished, outcome.won, outcome.attempts_left, outcome.score) == (True, False, 0, None)
+
+
+def test_hints_start_once_few_attempts_are_left(game):
+    game_round = GameRound(game, "easy", secret_number=30)
+    hints = []
+    for guess in range(1, ATTEMPTS_LIMITS["easy"]):
+        outcome = game_round.guess(guess)
+        hints.append((outcome.attempts_left, outcome.hint))
+        # A hint narrows the candidates but never down to the secret alone.
+        assert 30 in game_round.candidates
+        assert game_round.remaining() >= MIN_REMAINING
+    assert all(not hint for attempts_left, hint in hints if attempts_left > HINT_ATTEMPTS_LEFT)
+    assert hints[-HINT_ATTEMPTS_LEFT][1]
+
+
+def test_a_saved_round_resumes_where_it_stopped(game):
+    game.save_game(77, 3, 7, "medium", 100.0, "alice", number_range=(1, 120))
+    game_round = game.resume_round(game.load_game("alice"))
+    assert (game_round.secret_number, game_round.attempts, game_round.attempts_left) == (77, 3, 4)
+    assert (game_round.min_range, game_round.max_range, game_round.player) == (1, 120, "alice")
+
+
+def test_terminal_mode_plays_a_round(game, monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda lo, hi: 30)
+    out = io.StringIO()
+    run_terminal(game, "alice", "easy", stdin=io.StringIO("10\nten\n40\n30\nn\n"), out=out)
+    text = out.getvalue()
+    assert "Guess the number between 1 and 50" in text
+    assert "Too low!\n40 numbers still possible" in text
+    assert "Invalid input" in text
+    assert "Too high!\n29 numbers still possible" in text
+    assert "Congratulations! Attempts: 3" in text
+    assert text.endswith("Play again? (y/n): ")
+    assert game.profiles.get("alice").games == 1
+
+
+def test_headless_modules_do_not_load_tk():
+    code = "import sys, engine, main; print('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "False"
@@ -0,0 +1,96 @@
+import pytest
+
+from engine import GameRound
+from events import RECORD, EventLog, derive, log_files, read_records, summarize
+from main import NumberGuessingGame
+
+
+def test_rounds_round_trip_through_the_log(tmp_path):
+    path = str(tmp_path / "events.log")
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=path, data_dir=str(tmp_path))
+    try:
+        game_round = GameRound(game, "hard", secret_number=150)
+        assert game_round.guess(1).hint == ""
+        # With three attempts left the hint is due; the digit root leaves the fewest numbers.
+        outcome = game_round.guess(2)
+        assert outcome.hint.startswith("Hint: Adding up the digits")
+        assert game_round.guess(150).won
+    finally:
+        game.close()
+
+    observations = list(derive(read_records(log_files(path))))
+    hints = [o for o in observations if o[0] == "hint"]
+    assert hints == [("hint", "hard", "digit root", 198, outcome.remaining)]
+    assert [o for o in observations if o[0] == "result"] == [("result", "hard", True)]
+    assert summarize(log_files(path))["hints"]["digit root"]["count"] == 1
+
+
+
+
+
+def test_a_small_buffer_still_keeps_every_record(tmp_path):
+    path = str(tmp_path / "events.log")
+    log = EventLog(path, buffer_bytes=1)
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    try:
+        game_round = GameRound(game, "easy", secret_number=10)
+        game_round.events = log
+        game_round.round_id = log.start(game_round)
+        for guess in (40, 30, 20, 10):
+            game_round.guess(guess)
+        log.close()
+    finally:
+        game.close()
+    assert [record[5] for record in read_records([path])] == [0, 1, 1, 1, 1, 3]
+
+
+def play_rounds(game, log, rounds):
+    for _ in range(rounds):
+        game_round = GameRound(game, "medium", secret_number=50)
+        game_round.events = log
+        game_round.round_id = log.start(game_round)
+        for guess in (10, 90, 50):
+            game_round.guess(guess)
+
+
+def test_rotation_keeps_the_newest_records_in_order(tmp_path):
+    path = str(tmp_path / "events.log")
+    log = EventLog(path, max_bytes=2000, backups=2, buffer_bytes=1)
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    try:
+        play_rounds(game, log, 100)
+        log.close()
+    finally:
+        game.close()
+    files = log_files(path, backups=2)
+    assert files == [path + ".2", path + ".1", path]
+    assert not (tmp_path / "events.log.3").exists()
+    records = list(read_records(files))
+    times = [record[0] for record in records]
+    assert times == sorted(times)
+    # Older rounds went with the dropped files; the ones kept still end in a win.
+    results = [o for o in derive(records) if o[0] == "result"]
+    assert 0 < len(results) < 100
+    assert all(won for _, _, won in results)
+
+
+def test_a_cut_off_record_is_skipped(tmp_path):
+    path = str(tmp_path / "events.log")
+    log = EventLog(path)
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    try:
+        play_rounds(game, log, 3)
+        log.close()
+    finally:
+        game.close()
+    records = list(read_records([path]))
+    with open(path, "ab") as f:
+        f.write(b"\0" * (RECORD.size - 1))
+    assert list(read_records([path], chunk_size=7)) == records
+
+
+def test_other_files_raise_value_error(tmp_path):
+    path = tmp_path / "events.log"
+    path.write_bytes(b"not an event log")
+    with pytest.raises(ValueError):
+        list(read_records([str(path)]))
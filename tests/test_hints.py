@@ -0,0 +1,63 @@
+import pytest
+
+from hints import MIN_REMAINING, CandidateSet, HintEngine
+
+
+def numbers(candidates):
+    return [n for n in range(candidates.lo, candidates.hi + 1) if n in candidates]
+
+
+def test_candidate_set_updates():
+    candidates = CandidateSet(10, 109)
+    candidates.exclude_up_to(19)
+    candidates.exclude_from(90)
+    assert (candidates.count(), candidates.smallest(), candidates.largest()) == (70, 20, 89)
+    assert 19 not in candidates and 20 in candidates and 90 not in candidates
+    candidates.restrict(candidates.residue_mask(7, 3))
+    assert numbers(candidates) == [n for n in range(20, 90) if n % 7 == 3]
+    assert candidates.count_with(candidates.range_mask(0, 50)) == len([n for n in range(20, 51) if n % 7 == 3])
+    candidates.exclude_up_to(500)
+    assert candidates.count() == 0
+
+
+@pytest.mark.parametrize("lo, hi", [(1, 50), (1, 200), (0, 99), (7, 7000)])
+def test_every_hint_is_true_of_the_secret(lo, hi):
+    for secret in range(lo, hi + 1, max(1, (hi - lo) // 60)):
+        candidates = CandidateSet(lo, hi)
+        for kind, text, mask in HintEngine(candidates).hints_for(secret):
+            assert kind in ("parity", "divisibility", "digit root", "range")
+            assert (mask >> (secret - lo)) & 1, text
+
+
+def test_the_best_hint_leaves_the_fewest_candidates():
+    candidates = CandidateSet(1, 200)
+    engine = HintEngine(candidates)
+    kind, text = engine.best_hint(150)
+    assert kind == "digit root"
+    assert text == "Hint: Adding up the digits again and again gives 6." == engine.last_hint
+    assert numbers(candidates) == [n for n in range(1, 201) if n % 9 == 6]
+
+
+def test_no_hint_names_the_number():
+    candidates = CandidateSet(1, 100)
+    candidates.exclude_up_to(40)
+    candidates.exclude_from(44)
+    engine = HintEngine(candidates)
+    # 41, 42, 43: every hint that splits them would leave one number.
+    assert engine.best_hint(42) == (None, "")
+    assert candidates.count() == 3
+    candidates.exclude_from(43)
+    assert engine.best_hint(41) == (None, "")
+    assert candidates.count() == MIN_REMAINING
+
+
+def test_hints_run_out_as_they_are_given():
+    candidates = CandidateSet(1, 1000)
+    engine = HintEngine(candidates)
+    counts = [candidates.count()]
+    while engine.best_hint(777)[0] is not None:
+        assert 777 in candidates
+        counts.append(candidates.count())
+    # Each hint narrows the candidates, and the last leaves at least two.
+    assert counts == sorted(set(counts), reverse=True)
+    assert counts[-1] >= MIN_REMAINING
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from leaderboard_snapshot import ColumnarSnapshot, json_to_snapshot, snapshot_to_json, write_snapshot
+
+
+def test_round_trip(tmp_path, entries):
+    path = str(tmp_path / "board.nglb")
+    for entry in entries:
+        entry["name"] += " é"
+    assert write_snapshot(path, entries) == len(entries)
+    expected = sorted(entries, key=lambda x: x["score"], reverse=True)
+    with ColumnarSnapshot(path) as snapshot:
+        assert list(snapshot.iter_entries()) == expected
+        assert snapshot.top(5, "easy") == [e for e in expected if e["difficulty"] == "easy"][:5]
+
+
+def test_empty_board_round_trip(tmp_path):
+    path = str(tmp_path / "board.nglb")
+    write_snapshot(path, [])
+    with ColumnarSnapshot(path) as snapshot:
+        assert list(snapshot.iter_entries()) == []
+
+
+@pytest.mark.parametrize("keep", [0, 5, 17, 100, -1])
+def test_truncated_file_raises_value_error(tmp_path, entries, keep):
+    path = str(tmp_path / "board.nglb")
+    write_snapshot(path, entries)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:keep])
+    with pytest.raises(ValueError):
+        ColumnarSnapshot(path)
+
+
+def test_rows_are_read_by_index(tmp_path, entries):
+    path = str(tmp_path / "board.nglb")
+    write_snapshot(path, entries)
+    expected = sorted(entries, key=lambda x: x["score"], reverse=True)
+    with ColumnarSnapshot(path) as snapshot:
+        assert len(snapshot) == len(entries)
+        assert snapshot[0] == expected[0]
+        assert snapshot[len(entries) - 1] == expected[-1]
+        assert list(snapshot.column("score")) == [e["score"] for e in expected]
+        with pytest.raises(IndexError):
+            snapshot[len(entries)]
+
+
+def test_json_conversion_round_trip(tmp_path, entries):
+    source, snapshot, target = (str(tmp_path / name) for name in ("board.json", "board.nglb", "back.json"))
+    with open(source, "w") as f:
+        json.dump(entries, f)
+    assert json_to_snapshot(source, snapshot) == len(entries)
+    assert snapshot_to_json(snapshot, target) == len(entries)
+    with open(target) as f:
+        assert json.load(f) == sorted(entries, key=lambda x: x["score"], reverse=True)
+
+
+def test_other_files_raise_value_error(tmp_path, entries):
+    path = str(tmp_path / "board.nglb")
+    with open(path, "w") as f:
+        json.dump(entries, f)
+    with pytest.raises(ValueError):
+        ColumnarSnapshot(path)
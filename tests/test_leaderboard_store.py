@@ -0,0 +1,35 @@
+import pytest
+
+from conftest import expected_order, fill
+
+FORMATS = ("txt", "nglb", "db")
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_counts_and_ranks(tmp_path, entries, fmt):
+    store = fill(str(tmp_path / f"board.{fmt}"), entries)
+    try:
+        for difficulty in (None, "medium"):
+            board = expected_order(entries, difficulty)
+            assert store.count(difficulty) == len(board)
+            assert store.top(10, difficulty) == board[:10]
+            for score in (0, 10, 29, 30):
+                assert store.rank_of_score(score, difficulty) == 1 + sum(1 for e in board if e["score"] > score)
+            best = max(e["score"] for e in board if e["name"] == "player3")
+            assert store.rank_of_player("player3", difficulty) == store.rank_of_score(best, difficulty)
+    finally:
+        store.close()
+
+
+def test_stores_agree(tmp_path, entries):
+    stores = [fill(str(tmp_path / f"board.{fmt}"), entries) for fmt in FORMATS]
+    try:
+        for difficulty in (None, "hard"):
+            for offset in (0, 40, 120):
+                pages = [store.page(offset, 10, difficulty) for store in stores]
+                assert pages[0] == pages[1] == pages[2]
+            ranks = [store.rank_of_score(12, difficulty) for store in stores]
+            assert ranks[0] == ranks[1] == ranks[2]
+    finally:
+        for store in stores:
+            store.close()
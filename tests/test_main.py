@@ -0,0 +1,25 @@
+import json
+
+import pytest
+
+from main import NumberGuessingGame
+
+
+@pytest.fixture
+def game(tmp_path):
+    game = NumberGuessingGame(str(tmp_path / "board.txt"), events_file=None, data_dir=str(tmp_path))
+    yield game
+    game.close()
+
+
+def test_legacy_save_moves_to_the_first_player_once(tmp_path, game):
+    legacy = {"secret_number": 7, "attempts": 2, "attempts_limit": 10, "difficulty": "easy", "start_time": 0.0,
+              "ranges": [[1, 70], [1, 100], [1, 200]]}
+    (tmp_path / "savegame.json").write_text(json.dumps(legacy))
+    state = game.load_game("alice")
+    assert state["secret_number"] == 7
+    assert (state["min_range"], state["max_range"]) == (1, 70)
+    assert game.load_game("bob") is None
+    game.writer.flush()
+    assert not (tmp_path / "savegame.json").exists()
+    assert game.load_game("alice")["secret_number"] == 7
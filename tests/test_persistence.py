@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+
+from leaderboard_store import open_leaderboard_store
+import persistence
+from persistence import WriteBehindLeaderboard, WriteBehindWriter
+
+from conftest import expected_order, make_entries
+
+
+@pytest.fixture
+def writer():
+    writer = WriteBehindWriter()
+    writer.start()
+    yield writer
+    writer.close()
+
+
+@pytest.mark.parametrize("fmt", ["txt", "nglb", "db"])
+def test_reads_see_unwritten_wins(tmp_path, writer, fmt):
+    path = str(tmp_path / f"board.{fmt}")
+    stored, added = make_entries(200, seed=1), make_entries(12, seed=2)
+    store = open_leaderboard_store(path)
+    store.add_many(stored)
+    store.close()
+
+    leaderboard = WriteBehindLeaderboard(open_leaderboard_store(path), writer)
+    # Hold the writer so none of the new wins reach the store.
+    release = threading.Event()
+    writer.submit(release.wait)
+    try:
+        for entry in added:
+            leaderboard.add(entry)
+        everything = stored + added
+        for difficulty in (None, "hard"):
+            board = expected_order(everything, difficulty)
+            assert leaderboard.count(difficulty) == len(board)
+            assert leaderboard.top(10, difficulty) == board[:10]
+            assert leaderboard.rank_of_score(15, difficulty) == 1 + sum(1 for e in board if e["score"] > 15)
+            for offset in range(0, len(board), 11):
+                assert leaderboard.page(offset, 8, difficulty) == board[offset:offset + 8]
+            for sort, descending in (("name", True), ("attempts", False)):
+                ordered = expected_order(everything, difficulty, sort, descending)
+                for offset in range(0, len(ordered), 17):
+                    page = leaderboard.page(offset, 8, difficulty, sort, descending)
+                    assert [e[sort] for e in page] == [e[sort] for e in ordered[offset:offset + 8]]
+        name = added[0]["name"]
+        assert leaderboard.top_for_player(name, 3) == [e for e in expected_order(everything) if e["name"] == name][:3]
+    finally:
+        release.set()
+        leaderboard.close()
+
+    store = open_leaderboard_store(path)
+    try:
+        assert store.count() == len(everything)
+    finally:
+        store.close()
+
+
+def test_counts_pick_up_wins_from_other_connections(tmp_path, writer, monkeypatch):
+    monkeypatch.setattr(persistence, "REFRESH_INTERVAL", 0.0)
+    path = str(tmp_path / "board.db")
+    leaderboard = WriteBehindLeaderboard(open_leaderboard_store(path), writer)
+    other = open_leaderboard_store(path)
+    try:
+        leaderboard.add(make_entries(1, seed=1)[0])
+        assert leaderboard.count() == 1
+        entries = make_entries(30, seed=2)
+        other.add_many(entries)
+        # The first read asks the writer to reload; the next one sees it.
+        leaderboard.count()
+        writer.flush()
+        board = expected_order(entries + make_entries(1, seed=1))
+        assert leaderboard.count() == 31
+        assert leaderboard.count("hard") == len(expected_order(board, "hard"))
+        assert leaderboard.rank_of_score(15) == 1 + sum(1 for e in board if e["score"] > 15)
+        assert leaderboard.top(5) == board[:5]
+    finally:
+        other.close()
+        leaderboard.close()
+
+
+def test_durable_calls_run_after_earlier_writes_reach_disk(tmp_path, writer):
+    path = tmp_path / "state.json"
+    seen = []
+    release = threading.Event()
+    writer.submit(release.wait)
+    writer.write_file(str(path), "{}")
+    writer.submit_durable(lambda: seen.append(path.read_text()))
+    release.set()
+    writer.flush()
+    assert seen == ["{}"]
+
+
+def test_repeated_writes_to_a_file_are_coalesced(tmp_path, writer, monkeypatch):
+    written = []
+    atomic_write = persistence.atomic_write
+
+    def counting_write(path, data):
+        written.append(data)
+        atomic_write(path, data)
+
+    monkeypatch.setattr(persistence, "atomic_write", counting_write)
+    path = str(tmp_path / "save.json")
+    release = threading.Event()
+    writer.submit(release.wait)
+    for i in range(50):
+        writer.write_file(path, str(i))
+    assert writer.pending_data(path) == "49"
+    release.set()
+    writer.flush()
+    assert written == ["49"]
+    assert writer.pending_data(path) is None
+    assert (tmp_path / "save.json").read_text() == "49"
+
+
+def test_close_writes_what_is_queued(tmp_path):
+    writer = WriteBehindWriter()
+    writer.start()
+    writer.submit(lambda: None)
+    writer.write_file(str(tmp_path / "a.json"), "a")
+    writer.close()
+    assert (tmp_path / "a.json").read_text() == "a"
+
+
+def test_a_failing_call_does_not_stop_the_writer(tmp_path, writer, capsys):
+    writer.submit(lambda: 1 / 0)
+    writer.write_file(str(tmp_path / "a.json"), "a")
+    writer.flush()
+    assert (tmp_path / "a.json").read_text() == "a"
+    assert "ZeroDivisionError" in capsys.readouterr().err
@@ -0,0 +1,75 @@
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from persistence import WriteBehindWriter
+from profiles import DEFAULT_RANGES, RANGE_STEP, Profile, ProfileStore, RunningStats, adjusted_range
+
+
+def finished(difficulty, attempts, score=None):
+    return SimpleNamespace(difficulty=difficulty, attempts=attempts, won=score is not None, score=score)
+
+
+def test_running_stats_match_the_statistics_module():
+    values = [3, 7, 7, 19, 24, 1, 0, 12]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+    assert RunningStats(*stats.to_list()).stdev == pytest.approx(statistics.stdev(values))
+
+
+def test_ranges_grow_on_wins_and_never_shrink_below_the_default():
+    assert adjusted_range("easy", (1, 50), True) == (1, 50 + RANGE_STEP)
+    assert adjusted_range("easy", (1, 50 + RANGE_STEP), False) == (1, 50)
+    assert adjusted_range("hard", (1, 200), False) == (1, 200)
+
+
+def test_recording_rounds():
+    profile = Profile("alice")
+    for game_round in (finished("easy", 4, 80), finished("easy", 6, 60), finished("hard", 5), finished("hard", 5), finished("easy", 3, 90)):
+        profile.record(game_round)
+    assert (profile.games, profile.wins, profile.streak, profile.best_streak) == (5, 3, 1, 2)
+    assert profile.best_scores == {"easy": 90}
+    assert profile.score.mean == pytest.approx(230 / 3)
+    assert profile.attempts.mean == pytest.approx(23 / 5)
+    assert profile.ranges["easy"] == (1, DEFAULT_RANGES["easy"][1] + 3 * RANGE_STEP)
+    assert profile.ranges["hard"] == DEFAULT_RANGES["hard"]
+    restored = Profile("alice", profile.to_dict())
+    assert restored.to_dict() == profile.to_dict()
+
+
+def test_the_store_caches_recent_players(tmp_path):
+    store = ProfileStore(str(tmp_path / "profiles"), cache_size=2)
+    alice = store.get("alice")
+    assert store.get("alice") is alice
+    store.get("bob")
+    store.get("alice")
+    store.get("carol")
+    # bob was the least recently used.
+    assert store.cached("alice") and store.cached("carol") and not store.cached("bob")
+    assert not store.cached("dave")
+    store.load("dave")
+    assert not store.cached("dave")
+    # A cached profile wins over one loaded meanwhile.
+    assert store.put(Profile("alice")) is alice
+
+
+@pytest.mark.parametrize("use_writer", [False, True])
+def test_recorded_profiles_survive_a_restart(tmp_path, use_writer):
+    writer = WriteBehindWriter() if use_writer else None
+    if writer is not None:
+        writer.start()
+    store = ProfileStore(str(tmp_path / "profiles"), writer, cache_size=1)
+    try:
+        store.record("alice", finished("medium", 5, 70))
+        store.record("bob", finished("medium", 7))
+        # alice was evicted; her profile comes back from the queued write or the file.
+        assert store.get("alice").wins == 1
+    finally:
+        if writer is not None:
+            writer.close()
+    profile = ProfileStore(str(tmp_path / "profiles")).get("alice")
+    assert (profile.games, profile.best_scores, profile.ranges["medium"]) == (1, {"medium": 70}, (1, 100 + RANGE_STEP))
@@ -0,0 +1,72 @@
+import pytest
+
+from rank_index import MIN_SIZE, RankIndex, ScoreCounts
+
+from conftest import make_entries
+
+
+def brute_rank(entries, score, difficulty=None):
+    return 1 + sum(1 for e in entries if (difficulty is None or e["difficulty"] == difficulty) and e["score"] > score)
+
+
+def test_ties_share_a_rank():
+    index = RankIndex([
+        {"name": "a", "score": 50, "difficulty": "easy"},
+        {"name": "b", "score": 40, "difficulty": "easy"},
+        {"name": "c", "score": 40, "difficulty": "easy"},
+        {"name": "d", "score": 30, "difficulty": "hard"},
+    ])
+    assert index.rank_of_score(40, "easy") == 2
+    assert index.rank_of_score(39, "easy") == 4
+    assert index.rank_of_score(30) == 4
+    assert index.rank_of_player("c", "easy") == 2
+    assert index.rank_of_player("d", "easy") is None
+
+
+def test_matches_brute_force_as_the_score_range_grows():
+    entries = make_entries(500, seed=3)
+    # Scores far outside the first range force the tree to grow both ways.
+    entries[100]["score"] = 5000
+    entries[200]["score"] = -700
+    index = RankIndex()
+    for i, entry in enumerate(entries, 1):
+        index.add(entry)
+        if i % 50 == 0:
+            seen = entries[:i]
+            for difficulty in (None, "easy", "hard"):
+                assert index.count(difficulty) == len([e for e in seen if difficulty is None or e["difficulty"] == difficulty])
+                for score in (-1000, -700, 0, 15, 29, 5000, 6000):
+                    assert index.rank_of_score(score, difficulty) == brute_rank(seen, score, difficulty)
+
+
+@pytest.mark.parametrize("scores", [range(0, -2000, -1), range(0, 2000), range(190, 0, -5)])
+def test_the_tree_grows_with_the_stored_scores_only(scores):
+    counts = ScoreCounts()
+    for score in scores:
+        counts.add(score)
+    assert counts.size <= 2 * max(MIN_SIZE, len(range(min(scores), max(scores) + 1)))
+    for score in (min(scores) - 1, min(scores), 0, max(scores)):
+        assert counts.count_above(score) == sum(1 for s in scores if s > score)
+
+
+def test_players_rank_by_their_best_score():
+    entries = make_entries(300, seed=4)
+    index = RankIndex(entries)
+    for difficulty in (None, "medium"):
+        board = [e for e in entries if difficulty is None or e["difficulty"] == difficulty]
+        for name in {e["name"] for e in board}:
+            best = max(e["score"] for e in board if e["name"] == name)
+            assert index.best_score(name, difficulty) == best
+            assert index.rank_of_player(name, difficulty) == brute_rank(board, best)
+    assert index.rank_of_player("nobody") is None
+
+
+def test_counts_added_in_bulk():
+    index = RankIndex()
+    index.add_score(10, "easy", 3)
+    index.add_score(20, "hard", 2)
+    assert index.count() == 5
+    assert index.count("easy") == 3
+    assert index.count("medium") == 0
+    assert index.rank_of_score(10) == 3
+    assert index.rank_of_score(10, "medium") == 1
@@ -0,0 +1,89 @@
+import json
+import sqlite3
+
+import pytest
+
+from leaderboard_snapshot import ColumnarSnapshot, write_snapshot
+from leaderboard_store import AppendLogLeaderboard, SQLiteLeaderboard
+from rescore import rescore
+from scoring import calculate_score
+
+from conftest import make_entries
+
+
+def recomputed(entries):
+    # What rescoring must give: the same rows in the same relative order,
+    # with fresh scores, stably re-sorted best first.
+    fresh = [dict(entry, score=calculate_score(entry["attempts"], entry["time_taken"], entry["difficulty"])) for entry in entries]
+    return sorted(fresh, key=lambda x: x["score"], reverse=True)
+
+
+@pytest.fixture
+def stale():
+    # Stored scores that no longer match the formula.
+    return make_entries(300, seed=7, scores=1000)
+
+
+def test_json(tmp_path, stale):
+    path = str(tmp_path / "board.txt")
+    snapshot = sorted(stale[:250], key=lambda x: x["score"], reverse=True)
+    with open(path, "w") as f:
+        json.dump(snapshot, f)
+    with open(path + ".log", "w") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in stale[250:])
+    assert rescore(path) == len(stale)
+
+    with open(path) as f:
+        assert json.load(f) == recomputed(snapshot)
+    with open(path + ".log") as f:
+        assert [json.loads(line) for line in f] == [recomputed([entry])[0] for entry in stale[250:]]
+
+
+def test_columnar(tmp_path, stale):
+    path = str(tmp_path / "board.nglb")
+    write_snapshot(path, stale)
+    with ColumnarSnapshot(path) as snapshot:
+        before = list(snapshot.iter_entries())
+    # Small chunks, so the counting sort has to stitch several together.
+    assert rescore(path, workers=2, chunk=37) == len(stale)
+    with ColumnarSnapshot(path) as snapshot:
+        assert list(snapshot.iter_entries()) == recomputed(before)
+
+
+def test_sqlite(tmp_path, stale):
+    path = str(tmp_path / "board.db")
+    store = SQLiteLeaderboard(path)
+    store.add_many(stale)
+    store.close()
+    assert rescore(path, chunk=64) == len(stale)
+
+    store = SQLiteLeaderboard(path)
+    try:
+        assert store.top(len(stale)) == recomputed(stale)
+        for difficulty in (None, "easy"):
+            scores = [e["score"] for e in recomputed(stale) if difficulty is None or e["difficulty"] == difficulty]
+            assert store.count(difficulty) == len(scores)
+            assert store.rank_of_score(20, difficulty) == 1 + sum(1 for score in scores if score > 20)
+        indexes = {row[0] for row in store.conn.execute("SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger')")}
+        assert {"leaderboard_score", "leaderboard_difficulty_score", "leaderboard_count_insert"} <= indexes
+    finally:
+        store.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+
+
+def test_file_store_index_is_rebuilt(tmp_path, stale):
+    path = str(tmp_path / "board.nglb")
+    store = AppendLogLeaderboard(path)
+    store.add_many(stale)
+    store.compact()
+    store.close()
+    with ColumnarSnapshot(path) as snapshot:
+        before = list(snapshot.iter_entries())
+    rescore(path, workers=1)
+
+    store = AppendLogLeaderboard(path)
+    try:
+        assert store.page(0, 50) == recomputed(before)[:50]
+    finally:
+        store.close()
@@ -0,0 +1,57 @@
+import itertools
+import os
+
+import pytest
+
+import saves
+from persistence import WriteBehindWriter
+from saves import SaveStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(saves.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.mark.parametrize("use_writer", [False, True])
+def test_slots_save_load_and_delete(tmp_path, clock, use_writer):
+    writer = WriteBehindWriter() if use_writer else None
+    if writer is not None:
+        writer.start()
+    store = SaveStore(str(tmp_path / "saves"), writer)
+    try:
+        assert store.load("alice") is None
+        store.save("alice", "default", {"secret_number": 7, "difficulty": "easy"})
+        store.save("alice", "hard-one", {"secret_number": 150, "difficulty": "hard"})
+        store.save("bob", "default", {"secret_number": 9, "difficulty": "medium"})
+        assert sorted(store.slots("alice")) == ["default", "hard-one"]
+        assert store.slots("alice")["hard-one"]["difficulty"] == "hard"
+        # With no slot, the most recent save resumes.
+        assert store.load("alice")["secret_number"] == 150
+        assert store.load("alice", "default") == {"secret_number": 7, "difficulty": "easy", "name": "alice",
+                                                  "slot": "default", "saved_at": 1000.0}
+        assert store.load("alice", "missing") is None
+        assert store.delete("alice", "hard-one")
+        assert not store.delete("alice", "hard-one")
+        assert store.load("alice")["secret_number"] == 7
+        assert store.load("bob")["secret_number"] == 9
+    finally:
+        if writer is not None:
+            writer.close()
+    assert not os.path.exists(store.slot_path("alice", "hard-one"))
+    assert SaveStore(str(tmp_path / "saves")).load("alice")["secret_number"] == 7
+
+
+def test_players_are_sharded_by_name(tmp_path):
+    store = SaveStore(str(tmp_path / "saves"))
+    directories = {store.player_dir(f"player{i}") for i in range(500)}
+    assert len(directories) == 500
+    assert len({os.path.dirname(d) for d in directories}) > 100
+    assert store.player_dir("alice") == SaveStore(str(tmp_path / "saves")).player_dir("alice")
+
+
+@pytest.mark.parametrize("slot", ["", "../escape", "a/b", "x" * 65, "with space"])
+def test_slot_names_are_checked(tmp_path, slot):
+    with pytest.raises(ValueError):
+        SaveStore(str(tmp_path / "saves")).save("alice", slot, {})
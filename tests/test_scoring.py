@@ -0,0 +1,65 @@
+import json
+
+import numpy as np
+import pytest
+
+import scoring
+from leaderboard_snapshot import DIFFICULTIES
+from leaderboard_store import SQLiteLeaderboard
+from rescore import new_scores, rescore
+from scoring import calculate_score, scoring_formula, scoring_version
+
+from conftest import make_entries
+
+
+@pytest.fixture
+def version_2(monkeypatch):
+    monkeypatch.setattr(scoring, "SCORING", dict(scoring.SCORING))
+
+    @scoring_version(2)
+    def score_v2(attempts, time_taken, multiplier):
+        return (200 - attempts * 10) * multiplier - time_taken
+
+    return 2
+
+
+def test_arrays_score_like_single_rounds(version_2):
+    entries = make_entries(500, seed=5)
+    attempts = np.array([e["attempts"] for e in entries])
+    time_taken = np.array([e["time_taken"] for e in entries])
+    codes = np.array([DIFFICULTIES.index(e["difficulty"]) for e in entries])
+    for version in (1, version_2):
+        expected = [calculate_score(e["attempts"], e["time_taken"], e["difficulty"], version) for e in entries]
+        assert new_scores(attempts, time_taken, codes, version).tolist() == expected
+
+
+def test_versions_are_checked(version_2):
+    assert scoring_formula() is scoring.SCORING[scoring.CURRENT_VERSION]
+    with pytest.raises(ValueError):
+        scoring_formula(99)
+    with pytest.raises(ValueError):
+        scoring_version(version_2)(lambda attempts, time_taken, multiplier: 0)
+
+
+def test_rescoring_to_a_new_version(tmp_path, version_2):
+    entries = make_entries(200, seed=6)
+    fresh = [dict(e, score=calculate_score(e["attempts"], e["time_taken"], e["difficulty"], version_2)) for e in entries]
+    fresh.sort(key=lambda x: x["score"], reverse=True)
+
+    path = str(tmp_path / "board.txt")
+    with open(path, "w") as f:
+        json.dump(entries, f)
+    assert rescore(path, version_2) == len(entries)
+    with open(path) as f:
+        assert json.load(f) == fresh
+
+    path = str(tmp_path / "board.db")
+    store = SQLiteLeaderboard(path)
+    store.add_many(entries)
+    store.close()
+    rescore(path, version_2)
+    store = SQLiteLeaderboard(path)
+    try:
+        assert store.top(len(entries)) == fresh
+    finally:
+        store.close()
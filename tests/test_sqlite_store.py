@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from leaderboard_store import SQLiteLeaderboard, open_leaderboard_store
+
+from conftest import expected_order, fill, make_entries
+
+
+def add_in_batches(path, seed):
+    store = SQLiteLeaderboard(path)
+    try:
+        for entry in make_entries(200, seed):
+            store.add(entry)
+    finally:
+        store.close()
+
+
+def test_opens_by_suffix(tmp_path):
+    for suffix in ("db", "sqlite", "sqlite3"):
+        store = open_leaderboard_store(str(tmp_path / f"board.{suffix}"))
+        try:
+            assert isinstance(store, SQLiteLeaderboard)
+        finally:
+            store.close()
+
+
+def test_connections_see_each_others_wins(tmp_path, entries):
+    path = str(tmp_path / "board.db")
+    first, second = SQLiteLeaderboard(path), SQLiteLeaderboard(path)
+    try:
+        first.add_many(entries[:200])
+        assert second.count() == 200
+        second.add_many(entries[200:])
+        assert first.count() == len(entries)
+        assert first.page(0, 20) == expected_order(entries)[:20]
+    finally:
+        first.close()
+        second.close()
+
+
+def test_processes_write_concurrently(tmp_path):
+    path = str(tmp_path / "board.db")
+    SQLiteLeaderboard(path).close()
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(add_in_batches, [path] * 4, range(4)))
+    store = SQLiteLeaderboard(path)
+    try:
+        assert store.count() == 800
+        assert sorted(e["score"] for e in store.iter_entries()) == sorted(
+            e["score"] for seed in range(4) for e in make_entries(200, seed))
+    finally:
+        store.close()
+
+
+def test_sqlite_counts_follow_deletes_and_updates(tmp_path, entries):
+    store = fill(str(tmp_path / "board.db"), entries)
+    try:
+        store.conn.execute("DELETE FROM leaderboard WHERE name = 'player1'")
+        store.conn.execute("UPDATE leaderboard SET score = score + 100 WHERE name = 'player2'")
+        rows = [dict(row) for row in store.conn.execute("SELECT name, score, difficulty FROM leaderboard")]
+        assert store.count() == len(rows)
+        assert store.rank_of_score(50, "easy") == 1 + sum(1 for r in rows if r["difficulty"] == "easy" and r["score"] > 50)
+    finally:
+        store.close()
@@ -0,0 +1,70 @@
+import tkinter as tk
+from tkinter import ttk
+
+# How each widget role is coloured, as a function of a theme from
+# NumberGuessingGame.themes.
+ROLES = {
+    "surface": lambda theme: {"bg": theme["bg"]},
+    "text": lambda theme: {"bg": theme["bg"], "fg": theme["fg"]},
+    "button": lambda theme: {"bg": theme["button_bg"], "fg": theme["button_fg"]},
+    "radio": lambda theme: {"bg": theme["radio_bg"], "fg": theme["radio_fg"], "selectcolor": theme["radio_select"]},
+}
+MIN_PRUNE = 256
+
+
+class ThemeRegistry:
+    # Widgets are registered with a role when they are created and get that
+    # role's colours straight away. A theme switch reconfigures only the
+    # registered widgets (Toplevels included) with option dicts computed once
+    # per theme, and the ttk styles once, instead of walking the widget tree.
+    # Destroyed widgets are dropped when a switch finds them gone, or by an
+    # occasional sweep when many have been registered since the last one.
+    def __init__(self, root, themes, current):
+        self.root = root
+        self.themes = themes
+        self.current = current
+        self.options = {name: {role: build(theme) for role, build in ROLES.items()} for name, theme in themes.items()}
+        self.widgets = {role: {} for role in ROLES}
+        self.prune_at = MIN_PRUNE
+        self.style = ttk.Style(root)
+        self.style.theme_use("clam")
+        self.configure_styles()
+
+    @property
+    def theme(self):
+        return self.themes[self.current]
+
+    def register(self, widget, role):
+        widget.configure(**self.options[self.current][role])
+        widgets = self.widgets[role]
+        widgets[str(widget)] = widget
+        if len(widgets) > self.prune_at:
+            self.prune()
+        return widget
+
+    def prune(self):
+        largest = 0
+        for widgets in self.widgets.values():
+            for path in [path for path, widget in widgets.items() if not widget.winfo_exists()]:
+                del widgets[path]
+            largest = max(largest, len(widgets))
+        self.prune_at = max(MIN_PRUNE, 2 * largest)
+
+    def switch(self, name):
+        self.current = name
+        for role, widgets in self.widgets.items():
+            options = self.options[name][role]
+            gone = []
+            for path, widget in widgets.items():
+                try:
+                    widget.configure(**options)
+                except tk.TclError:
+                    gone.append(path)
+            for path in gone:
+                del widgets[path]
+        self.configure_styles()
+
+    def configure_styles(self):
+        theme = self.theme
+        self.style.configure("Treeview", background=theme["bg"], foreground=theme["fg"], rowheight=25, fieldbackground=theme["bg"])
+        self.style.map("Treeview", background=[("selected", theme["button_bg"])])
@@ -0,0 +1,96 @@
+import tkinter as tk
+from collections import deque
+
+from animation import linear
+
+TOAST_GEOMETRY = "200x50+550+400"
+FADE_SECONDS = 0.15
+HOLD_MS = 700
+
+
+class Toast:
+    # One borderless window, created on first use and withdrawn (never
+    # destroyed) when idle, that shows short messages one at a time.
+    #
+    # show() with replace=True (the default) drops anything queued and
+    # switches the visible message at once; replace=False queues it behind
+    # the current one. A message equal to the one showing, or to the last one
+    # queued, is coalesced into it and shown with a repeat count instead.
+    def __init__(self, root, animator, geometry=TOAST_GEOMETRY, hold_ms=HOLD_MS):
+        self.root = root
+        self.animator = animator
+        self.geometry = geometry
+        self.hold_ms = hold_ms
+        self.window = None
+        self.label = None
+        self.queue = deque()
+        self.current = None
+        self.alpha = 0.0
+        self.hold_job = None
+        self.windows_created = 0
+
+    def _build(self):
+        self.window = tk.Toplevel(self.root)
+        self.window.overrideredirect(True)
+        self.window.geometry(self.geometry)
+        self.window.attributes("-alpha", 0.0)
+        self.label = tk.Label(self.window, text="", fg="white", font=("Arial", 12, "bold"))
+        self.label.pack(fill="both", expand=True)
+        self.window.withdraw()
+        self.alpha = 0.0
+        self.current = None
+        self.windows_created += 1
+
+    def show(self, message, color, replace=True):
+        if self.window is None or not self.window.winfo_exists():
+            self._build()
+        if self.current is not None and self.current[0] == message and (replace or not self.queue):
+            self.current[2] += 1
+            if replace:
+                self.queue.clear()
+            self._display(self.current)
+            return
+        if self.queue and self.queue[-1][0] == message:
+            self.queue[-1][2] += 1
+            return
+        item = [message, color, 1]
+        if replace or self.current is None:
+            self.queue.clear()
+            self._display(item)
+        else:
+            self.queue.append(item)
+
+    def _display(self, item):
+        message, color, count = item
+        self.current = item
+        self.label.config(text=message if count == 1 else f"{message} x{count}", bg=color)
+        if self.hold_job is not None:
+            self.root.after_cancel(self.hold_job)
+            self.hold_job = None
+        if self.alpha == 0.0:
+            self.window.deiconify()
+            self.window.lift()
+        self._fade(1.0, self._hold)
+
+    def _fade(self, target, on_done):
+        start = self.alpha
+
+        def set_alpha(progress):
+            self.alpha = start + (target - start) * progress
+            self.window.attributes("-alpha", self.alpha)
+
+        self.animator.animate(self.window, FADE_SECONDS * abs(target - start), set_alpha, easing=linear, on_done=on_done)
+
+    def _hold(self):
+        self.hold_job = self.root.after(self.hold_ms, self._next)
+
+    def _next(self):
+        self.hold_job = None
+        if self.queue:
+            self._display(self.queue.popleft())
+        else:
+            self._fade(0.0, self._hide)
+
+    def _hide(self):
+        self.current = None
+        self.window.withdraw()
@@ -0,0 +1,116 @@
+import argparse
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from main import ATTEMPTS_LIMITS
+from profiles import DEFAULT_RANGES
+from strategies import STRATEGIES, load_strategy
+
+DIFFICULTIES = ("easy", "medium", "hard")
+UNITS_PER_RANGE = 256
+MIN_UNIT_SIZE = 64
+
+
+def unit_seed(base_seed, strategy_name, label, index):
+    # Seeds depend only on the work unit, never on which worker process runs
+    # it, so results are identical for any worker count.
+    key = f"{base_seed}:{strategy_name}:{label}:{index}".encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], "little")
+
+
+def play_unit(unit):
+    strategy_class, label, lo, hi, limit, start, end, seed = unit
+    strategy = strategy_class()
+    rng = random.Random(seed)
+    total = 0
+    worst = 0
+    wins = 0
+    for secret in range(start, end):
+        low, high = lo, hi
+        attempts = 0
+        while True:
+            guess = strategy.guess(low, high, rng)
+            if not low <= guess <= high:
+                raise ValueError(f"{strategy.name} guessed {guess} outside {low}..{high}")
+            attempts += 1
+            if guess == secret:
+                break
+            if guess < secret:
+                low = guess + 1
+            else:
+                high = guess - 1
+        total += attempts
+        worst = max(worst, attempts)
+        wins += attempts <= limit
+    return strategy_class.name, label, end - start, total, worst, wins
+
+
+def make_units(strategy_classes, ranges, base_seed):
+    # Unit boundaries depend only on the range, so the seeds (and therefore
+    # the results) do too; 256 units per range keeps every core busy.
+    units = []
+    for strategy_class in strategy_classes:
+        for label, (lo, hi), limit in ranges:
+            size = hi - lo + 1
+            chunk = max(MIN_UNIT_SIZE, -(-size // UNITS_PER_RANGE))
+            for index, start in enumerate(range(lo, hi + 1, chunk)):
+                end = min(start + chunk, hi + 1)
+                units.append((strategy_class, label, lo, hi, limit, start, end,
+                              unit_seed(base_seed, strategy_class.name, label, index)))
+    return units
+
+
+def run_tournament(strategy_classes, ranges, workers=None, base_seed=0):
+    workers = workers or os.cpu_count() or 1
+    units = make_units(strategy_classes, ranges, base_seed)
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name, label, count, total, worst, wins in executor.map(play_unit, units, chunksize=1):
+            merged = results.setdefault((name, label), [0, 0, 0, 0])
+            merged[0] += count
+            merged[1] += total
+            merged[2] = max(merged[2], worst)
+            merged[3] += wins
+    return {
+        key: {"secrets": count, "mean_attempts": total / count, "worst_attempts": worst, "win_rate": wins / count}
+        for key, (count, total, worst, wins) in results.items()
+    }
+
+
+def game_ranges():
+    # The ranges a new player starts on; no game is built, so nothing is
+    # read from or written to disk.
+    return [(difficulty, DEFAULT_RANGES[difficulty], ATTEMPTS_LIMITS[difficulty]) for difficulty in DIFFICULTIES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every strategy against every secret number of each range.")
+    parser.add_argument("--strategy", action="append", help="Built-in name or module:Class; repeatable. Defaults to all built-ins.")
+    parser.add_argument("--range", type=int, nargs=3, action="append", metavar=("LO", "HI", "LIMIT"),
+                        help="Extra range to evaluate exhaustively, with its attempts limit.")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ranges = game_ranges()
+    for lo, hi, limit in args.range or []:
+        ranges.append((f"{lo}-{hi}", (lo, hi), limit))
+    strategy_classes = [load_strategy(spec) for spec in (args.strategy or list(STRATEGIES))]
+
+    started = time.perf_counter()
+    results = run_tournament(strategy_classes, ranges, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"{'Range':<16} | {'Strategy':<12} | {'Mean':>7} | {'Worst':>6} | {'Wins':>7}")
+    for label, _, _ in ranges:
+        rows = sorted((stats["mean_attempts"], name, stats) for (name, row_label), stats in results.items() if row_label == label)
+        for _, name, stats in rows:
+            print(f"{label:<16} | {name:<12} | {stats['mean_attempts']:>7.2f} | {stats['worst_attempts']:>6} | {stats['win_rate']:>7.1%}")
+    print(f"Finished in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
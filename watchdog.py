@@ -0,0 +1,130 @@
+import inspect
+import sys
+import threading
+import time
+import traceback
+
+from metrics import BUCKETS_NS, METRICS, Histogram
+
+INTERVAL_MS = 100
+THRESHOLD_MS = 250
+REPORT_FILE = "stalls.log"
+
+
+class StallWatchdog:
+    # Opt-in detector for a blocked Tk event loop. A heartbeat `after`
+    # callback is scheduled every interval_ms on the Tk thread and its
+    # lateness goes into a histogram. A side thread notices when a heartbeat
+    # is more than threshold_ms overdue and grabs the main thread's stack
+    # right then (sys._current_frames), while the blocking handler is still
+    # running. Once the loop wakes up, the stall and that stack are appended
+    # to the report file, naming the first method of the root window's class
+    # on the stack.
+    def __init__(self, root, report_path=REPORT_FILE, interval_ms=INTERVAL_MS, threshold_ms=THRESHOLD_MS):
+        self.root = root
+        self.report_path = report_path
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.lateness = Histogram()
+        self.stalls = 0
+        self.main_thread_id = threading.get_ident()
+        self.handlers = self._handler_codes(type(root))
+        self._lock = threading.Lock()
+        self._expected = None
+        self._capture = None
+        self._job = None
+        self._stopped = threading.Event()
+        self._monitor = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+
+    @staticmethod
+    def _handler_codes(cls):
+        codes = {}
+        for klass in cls.__mro__:
+            if klass.__module__.startswith("tkinter") or klass is object:
+                continue
+            for name, member in vars(klass).items():
+                if inspect.isfunction(member):
+                    codes.setdefault(inspect.unwrap(member).__code__, f"{cls.__name__}.{name}")
+        return codes
+
+    def start(self):
+        self.main_thread_id = threading.get_ident()
+        with self._lock:
+            self._expected = time.perf_counter() + self.interval
+        self._job = self.root.after(int(self.interval * 1000), self._beat)
+        self._monitor.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except Exception:
+                # The window is already gone.
+                pass
+            self._job = None
+        if self._monitor.is_alive():
+            self._monitor.join()
+        self._write(self.summary())
+
+    def _beat(self):
+        now = time.perf_counter()
+        with self._lock:
+            late = max(0.0, now - self._expected)
+            capture, self._capture = self._capture, None
+            self._expected = now + self.interval
+        late_ns = int(late * 1e9)
+        self.lateness.observe(late_ns)
+        if METRICS.enabled:
+            METRICS.observe("event_loop_lateness", late_ns)
+        if late >= self.threshold:
+            self.stalls += 1
+            self._write(self._stall_report(late, capture))
+        if not self._stopped.is_set():
+            self._job = self.root.after(int(self.interval * 1000), self._beat)
+
+    def _watch(self):
+        while not self._stopped.wait(self.threshold / 2):
+            with self._lock:
+                overdue = time.perf_counter() - self._expected
+                if overdue < self.threshold or self._capture is not None:
+                    continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            handler = None
+            while frame is not None:
+                # Walking outwards, so the last match is the outermost method
+                # of the window class: the callback Tk actually invoked.
+                handler = self.handlers.get(frame.f_code, handler)
+                frame = frame.f_back
+            with self._lock:
+                self._capture = (overdue, handler, stack)
+
+    def _stall_report(self, late, capture):
+        lines = [f"=== {time.strftime('%Y-%m-%d %H:%M:%S')} event loop blocked for {late * 1000:.0f} ms ==="]
+        if capture is None:
+            lines.append("(ended before the main thread's stack could be captured)")
+        else:
+            overdue, handler, stack = capture
+            lines.append(f"Handler: {handler or 'unknown'}")
+            lines.append(f"Main thread stack, {overdue * 1000:.0f} ms into the stall:")
+            lines.extend(line.rstrip("\n") for line in traceback.format_list(stack))
+        return "\n".join(lines) + "\n\n"
+
+    def summary(self):
+        h = self.lateness
+        lines = [f"=== Heartbeat lateness: {h.count} beats, {self.stalls} stalls over {self.threshold * 1000:.0f} ms, max {h.max_ns / 1e6:.1f} ms ==="]
+        low = 0
+        for bound, count in zip(BUCKETS_NS + (None,), h.counts):
+            if count:
+                high = f"{bound / 1e6:g} ms" if bound is not None else "inf"
+                lines.append(f"{low / 1e6:g} ms - {high}: {count}")
+            low = bound
+        return "\n".join(lines) + "\n\n"
+
+    def _write(self, text):
+        with open(self.report_path, "a") as f:
+            f.write(text)